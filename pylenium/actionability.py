@@ -0,0 +1,102 @@
+""" Check that an element is ready for an action before it's performed.
+
+A native click on an element that is still animating or covered by an overlay fails with "element click intercepted".
+Before `click`, `double_click`, `right_click`, `hover`, `check`, `uncheck`, `type` and `select_*`, a single script
+checks that the element is:
+
+* attached to the DOM
+* visible
+* enabled (and not read-only for `type`)
+* stable, meaning it didn't move between two animation frames
+* not covered at its center point, for the mouse actions
+
+A file input is usually hidden behind a styled button, so only the attached, enabled and read-only checks apply to
+`<input type="file">` and `Element.type()` or `Element.upload()` can still send a path to it.
+
+The checks are repeated until they pass or the default wait_time is reached. With `"wait_mode": "observer"`, they
+are repeated inside the page, every animation frame, instead of once per poll. `Element.click(force=True)` skips them,
+and they can be turned off in pylenium.json:
+
+    "driver": {
+        "actionability": false
+    }
+"""
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.remote.webelement import WebElement
+
+from pylenium import observe, utils
+
+_MOUSE = ("attached", "visible", "enabled", "stable", "receives_events")
+
+ACTIONS = {
+    "click": _MOUSE,
+    "check": _MOUSE,
+    "hover": ("attached", "visible", "stable", "receives_events"),
+    "type": ("attached", "visible", "enabled", "editable"),
+    "select": ("attached", "visible", "enabled"),
+}
+
+
+def is_enabled(py) -> bool:
+    """True if the config asks for actionability checks before actions."""
+    return py.config.driver.actionability
+
+
+def check(py, webelement: WebElement, action: str, timeout: float = 0) -> dict:
+    """Run the checks of the action once, or repeatedly inside the page for up to `timeout` seconds.
+
+    Returns:
+        `{"actionable": True}`, or `{"actionable": False, "reason": ...}` with the check that failed.
+    """
+    script = utils.read_script_from_file("actionability.js")
+    return observe.execute_async(py, script, timeout, webelement, list(ACTIONS[action]), int(timeout * 1000))
+
+
+def wait(py, webelement: WebElement, action: str):
+    """Wait until the element is ready for the action.
+
+    Args:
+        py: The instance of Pylenium.
+        webelement: The element to act on.
+        action: One of the keys of `ACTIONS`.
+
+    Raises:
+        `ElementClickInterceptedException` if the element was still covered when the wait_time was reached.
+        `ElementNotInteractableException` if the element still wasn't visible, enabled or stable.
+        `StaleElementReferenceException` if the element was removed from the DOM.
+    """
+    if not is_enabled(py):
+        return
+    timeout = py.config.driver.wait_time
+    if observe.is_enabled(py):
+        with observe.recorded(py, f"actionability.{action}") as record:
+            result = check(py, webelement, action, timeout)
+            record.timed_out = not result["actionable"]
+    else:
+        results = [{"actionable": False, "reason": "not checked"}]
+
+        def actionable(_):
+            results[0] = check(py, webelement, action)
+            return results[0]["actionable"] or results[0]["reason"] == "detached"
+
+        try:
+            py.wait(timeout).until(actionable)
+        except TimeoutException:
+            pass
+        result = results[0]
+
+    if result["actionable"]:
+        return
+    reason = result["reason"]
+    message = f"Element is not ready to {action} after {timeout} seconds: it is {reason}"
+    if reason == "detached":
+        raise StaleElementReferenceException(message)
+    if reason.startswith("covered"):
+        raise ElementClickInterceptedException(message)
+    raise ElementNotInteractableException(message)
@@ -0,0 +1,211 @@
+""" Record many commands and run them in a single round trip.
+
+A form step is usually a series of round trips: get, clear, type, get, type, select, click.
+Inside `py.batch()`, the commands are only recorded, and they run as one script when the block exits.
+
+* Each step waits up to the timeout for its element to exist, like `py.get()`. The timeout is per step.
+* `check()` and `uncheck()` also wait until the element is visible, enabled and not covered, like `Element.check()`.
+* The script stops at the first step that fails and raises the matching Selenium exception for that step.
+* The steps run in the page with JavaScript: values are set with the native setter and `input`/`change` events are
+  dispatched, and clicks are `element.click()`. Use the regular commands when you need real user input.
+
+A script can't outlive its page. If a step starts a navigation, like a click that submits a form, the script stops
+right after that step and the steps after it run in a new script once the new page has replaced the old one.
+
+Examples:
+```
+    with py.batch() as batch:
+        batch.type("#username", "tomsmith", clear=True)
+        batch.type("#password", "SuperSecretPassword!", clear=True)
+        batch.select("#role", text="Admin")
+        batch.check("#terms")
+        batch.click("button[type='submit']")  # navigates, so the next step runs on the new page
+        message = batch.text("#flash")
+
+    assert "You logged into a secure area!" in message.value
+```
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from pylenium import observe, polling, utils
+from pylenium.element import Element
+from pylenium.log import logger as log
+
+
+ERRORS = {
+    "not_found": NoSuchElementException,
+    "not_interactable": ElementNotInteractableException,
+    "intercepted": ElementClickInterceptedException,
+    "invalid_selector": InvalidSelectorException,
+    "invalid_argument": ValueError,
+}
+
+
+class BatchStep:
+    """A recorded step of a Batch. Its `value` is set once the batch has run."""
+
+    __slots__ = ("index", "command", "css", "args", "value", "done")
+
+    def __init__(self, index: int, command: str, css: str, args: Dict[str, Any]):
+        self.index = index
+        self.command = command
+        self.css = css
+        self.args = args
+        self.value: Any = None
+        self.done = False
+
+    def __repr__(self) -> str:
+        args = "".join(f", {name}={value!r}" for name, value in self.args.items())
+        return f"{self.command}({self.css!r}{args})"
+
+
+class Batch:
+    """Records commands and runs them in a single script. Use it with `py.batch()`."""
+
+    __slots__ = ("_py", "_timeout", "steps")
+
+    def __init__(self, py, timeout: Optional[float] = None):
+        self._py = py
+        self._timeout = timeout or py.config.driver.wait_time
+        self.steps: List[BatchStep] = []
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.run()
+
+    # region COMMANDS
+
+    def get(self, css: str) -> BatchStep:
+        """Get the element that matches the `css` selector. The step's value is the Element."""
+        return self._record("get", css)
+
+    def text(self, css: str) -> BatchStep:
+        """Read the text of the element that matches the `css` selector, like `Element.text()`. The step's value is the text."""
+        return self._record("text", css)
+
+    def click(self, css: str) -> BatchStep:
+        """Click the element with JavaScript, like `Element.click(force=True)`."""
+        return self._record("click", css)
+
+    def type(self, css: str, text: str, clear: bool = False) -> BatchStep:
+        """Add the text to the element's value and dispatch `input` and `change` events.
+
+        Args:
+            css: The selector of the element.
+            text: The text to add.
+            clear: True to replace the current value instead of adding to it.
+        """
+        return self._record("type", css, text=text, clear=clear)
+
+    def clear(self, css: str) -> BatchStep:
+        """Clear the element's value and dispatch `input` and `change` events."""
+        return self._record("clear", css)
+
+    def check(self, css: str) -> BatchStep:
+        """Check the checkbox or radio button if it isn't already checked. Waits until it's visible, enabled and not covered."""
+        return self._record("check", css, checked=True)
+
+    def uncheck(self, css: str) -> BatchStep:
+        """Uncheck the checkbox if it is checked. Waits until it's visible, enabled and not covered."""
+        return self._record("check", css, checked=False)
+
+    def select(self, css: str, value: Optional[str] = None, text: Optional[str] = None, index: Optional[int] = None) -> BatchStep:
+        """Select an `<option>` of the `<select>` by its value, text or index, and dispatch a `change` event.
+
+        Raises:
+            `ValueError` if not exactly one of value, text or index is given.
+        """
+        given = {name: arg for name, arg in (("value", value), ("text", text), ("index", index)) if arg is not None}
+        if len(given) != 1:
+            raise ValueError("Batch.select() needs exactly one of: value, text or index")
+        return self._record("select", css, **given)
+
+    def dispatch(self, css: str, event: str) -> BatchStep:
+        """Dispatch a bubbling event, like `blur` or `keyup`, on the element."""
+        return self._record("dispatch", css, event=event)
+
+    # endregion
+
+    def run(self) -> List[BatchStep]:
+        """Run every recorded step in a single script. This is called when the `with` block exits.
+
+        If a step starts a navigation, the steps after it run in a new script on the new page.
+
+        Returns:
+            The steps with their values.
+
+        Raises:
+            `NoSuchElementException` if a step's element or `<option>` wasn't found within the timeout.
+            `ElementNotInteractableException` if a step's element is hidden, disabled or read-only.
+            `ElementClickInterceptedException` if the element of a `check()` or `uncheck()` step is covered.
+            `InvalidSelectorException` if a step's selector is invalid.
+            `TimeoutException` if the page was still unloading after the timeout.
+            `ValueError` if a step can't be used on its element, like `check()` on a `<div>`.
+        """
+        pending = [step for step in self.steps if not step.done]
+        if not pending:
+            return self.steps
+        log.command("py.batch() - Run %s steps in one script", len(pending))
+        script = utils.read_script_from_file("element_text.js") + utils.read_script_from_file("batch.js")
+        navigated_at = None
+        intervals = None
+        while pending:
+            sent = time.monotonic()
+            response = self._execute(script, pending, after_navigation=navigated_at is not None)
+            results = response["results"]
+            for step, value in zip(pending, results):
+                if isinstance(value, WebElement):
+                    value = Element(self._py, value, (By.CSS_SELECTOR, step.css))
+                step.value = value
+                step.done = True
+            error = response.get("error")
+            if error:
+                step = pending[error["index"]]
+                exception = ERRORS.get(error["kind"], JavascriptException)
+                raise exception(f"py.batch() step {step.index + 1} `{step}` failed: {error['message']}")
+            if response.get("navigated") is None:
+                break
+            if results or navigated_at is None:
+                navigated_at = time.monotonic()
+                intervals = polling.build_strategy(self._py.config.driver.polling).intervals()
+            elif sent - navigated_at > self._timeout:
+                raise TimeoutException(f"py.batch() - The page was still unloading after {self._timeout} seconds")
+            else:
+                # the old page is still unloading: back off before trying again
+                time.sleep(next(intervals))
+            pending = pending[len(results):]
+            if results and pending:
+                log.command("py.batch() - Step %s started a navigation. Run the %s steps after it on the new page", pending[0].index, len(pending))
+        return self.steps
+
+    def _execute(self, script: str, steps: List[BatchStep], after_navigation: bool) -> Dict:
+        payload = [{"command": step.command, "css": step.css, "args": step.args} for step in steps]
+        try:
+            # each step can wait up to the timeout
+            return observe.execute_async(self._py, script, self._timeout * len(steps), payload, int(self._timeout * 1000))
+        except JavascriptException as exc:
+            # after a navigation, the script can land in the old document while it unloads. No step ran there.
+            if after_navigation and observe.is_unloaded(exc):
+                return {"results": [], "error": None, "navigated": -1}
+            raise
+
+    def _record(self, command: str, css: str, **args) -> BatchStep:
+        step = BatchStep(len(self.steps), command, css, args)
+        self.steps.append(step)
+        return step
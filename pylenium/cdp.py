@@ -15,6 +15,22 @@ class CDP:
 
     def __init__(self, webdriver):
         self._webdriver = webdriver
+        self._enabled_domains = set()
+
+    def enable(self, domain: str) -> "CDP":
+        """Enable a CDP domain (like `Performance` or `Network`) if it hasn't been enabled yet by this instance.
+
+        Domains are only enabled when they are needed, so sessions that never use CDP don't pay for them.
+
+        Examples:
+        ```
+            py.cdp.enable("Network")
+        ```
+        """
+        if domain not in self._enabled_domains:
+            self._webdriver.execute_cdp_cmd(f"{domain}.enable", {})
+            self._enabled_domains.add(domain)
+        return self
 
     def execute_command(self, cmd: str, cmd_args: Dict) -> Dict:
         """Execute Chrome Devtools Protocol command and get returned result.
@@ -58,6 +74,5 @@ class CDP:
         Returns:
             A dict of performance metrics including 'ScriptDuration', 'ThreadTime', 'ProcessTime', and 'DomContentLoaded'.
         """
-        # The commented out code below should have been executed prior to this function call.
-        # self._webdriver.execute_cdp_cmd("Performance.enable", {})
+        self.enable("Performance")
         return self._webdriver.execute_cdp_cmd("Performance.getMetrics", {})
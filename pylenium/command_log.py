@@ -0,0 +1,134 @@
+""" An in-memory ring buffer of the WebDriver commands of a test, written to disk only if the test fails.
+
+Logging every command at the COMMAND level produces huge logs for tests that pass, while the INFO level loses the
+context of a failure. Instead, every WebDriver command is recorded with the Pylenium command that sent it, its
+params, duration and outcome, and only the last `logging.command_log_size` records are kept.
+
+When a test that uses the `py` fixture fails, the records are written to `test_results/<test>/commands.jsonl`.
+
+* Recording a command is a `deque.append()` of a tuple. Messages and params are only formatted when written.
+* The records of a test that passed are thrown away.
+* Set `"command_log_size": 0` in the `logging` section of pylenium.json to turn it off.
+"""
+
+import json
+import time
+from collections import deque
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, List, Optional
+
+FILENAME = "commands.jsonl"
+
+# Long values (like the source of a script) are cut to this length when written
+MAX_VALUE_LENGTH = 200
+
+# The last Pylenium command that was logged with `log.command()` in this thread, as (message, args).
+# Each thread (ie each test in a threaded runner) has its own, so commands are never tagged with another thread's.
+_last_command = ContextVar("pylenium_last_command", default=None)
+
+
+def note(message: str, args: tuple):
+    """Remember the Pylenium command that is running, so the WebDriver commands it sends can be tagged with it."""
+    _last_command.set((message, args))
+
+
+class CommandLog:
+    """The ring buffer of the WebDriver commands sent by an instance of Pylenium. It's `py.command_log`."""
+
+    __slots__ = ("_records",)
+
+    def __init__(self, size: int = 200):
+        self._records = deque(maxlen=size)
+        # a new log is a new test: don't tag its first WebDriver commands with the previous test's last command.
+        # The driver is attached lazily, inside the first command, so forgetting it on attach would lose that one.
+        _last_command.set(None)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def attach(self, webdriver):
+        """Record every command sent by the WebDriver in this log.
+
+        A WebDriver that was already attached (ie reused from the Session Pool) is attached to this log instead.
+        """
+        if not self._records.maxlen:
+            return
+        execute = getattr(webdriver, "_pylenium_execute", None) or webdriver.execute
+        records = self._records
+
+        def recorded_execute(driver_command: str, params: Optional[Dict] = None):
+            start = time.perf_counter()
+            try:
+                response = execute(driver_command, params)
+            except Exception as exc:
+                # keep the outcome, not the exception, so its traceback isn't kept alive
+                records.append((time.time(), _last_command.get(), driver_command, params, time.perf_counter() - start, _outcome(exc)))
+                raise
+            records.append((time.time(), _last_command.get(), driver_command, params, time.perf_counter() - start, "ok"))
+            return response
+
+        webdriver._pylenium_execute = execute
+        webdriver.execute = recorded_execute
+
+    def clear(self):
+        """Throw away the records, ie when the test passed."""
+        self._records.clear()
+
+    def records(self) -> List[Dict]:
+        """The records, oldest first, as dicts."""
+        return [_to_dict(*record) for record in self._records]
+
+    def write(self, directory: Path) -> Optional[Path]:
+        """Write the records to `commands.jsonl` in the directory, one JSON object per line.
+
+        Returns:
+            The path of the file, or None if there are no records.
+        """
+        if not self._records:
+            return None
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory.joinpath(FILENAME)
+        with path.open("w", encoding="utf-8") as file:
+            for record in self.records():
+                file.write(json.dumps(record, default=_shorten) + "\n")
+        return path
+
+
+def _to_dict(timestamp: float, command, driver_command: str, params, seconds: float, outcome: str) -> Dict:
+    message = None
+    if command is not None:
+        message, args = command
+        try:
+            message = message % args if args else message
+        except (TypeError, ValueError):
+            message = f"{message} {args}"
+    return {
+        "time": timestamp,
+        "command": message,
+        "webdriver": driver_command,
+        "params": _shorten_values(params),
+        "seconds": round(seconds, 4),
+        "outcome": outcome,
+    }
+
+
+def _outcome(error: Exception) -> str:
+    lines = str(error).strip().splitlines()
+    return f"{type(error).__name__}: {lines[0]}" if lines else type(error).__name__
+
+
+def _shorten(value) -> str:
+    value = str(value)
+    return value if len(value) <= MAX_VALUE_LENGTH else value[:MAX_VALUE_LENGTH] + "..."
+
+
+def _shorten_values(value):
+    if isinstance(value, dict):
+        return {key: _shorten_values(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_shorten_values(item) for item in value]
+    if isinstance(value, str):
+        return _shorten(value)
+    return value
@@ -7,6 +7,13 @@ from pydantic import BaseModel
 ###################
 
 
+class PollingConfig(BaseModel):
+    strategy: str = "backoff"
+    initial: float = 0.05
+    factor: float = 2.0
+    maximum: float = 0.5
+
+
 class DriverConfig(BaseModel):
     browser: str = "chrome"
     remote_url: str = ""
@@ -18,11 +25,21 @@ class DriverConfig(BaseModel):
     extension_paths: Optional[List[str]] = None
     webdriver_kwargs: Optional[Dict] = None
     local_path: str = ""
+    session_pool: bool = False
+    session_pool_max_uses: int = 25
+    prewarm: int = 0
+    polling: PollingConfig = PollingConfig()
+    wait_mode: str = "poll"
+    stale_retries: int = 2
+    actionability: bool = True
 
 
 class LoggingConfig(BaseModel):
     pylog_level: str = "INFO"
     screenshots_on: bool = True
+    queue: bool = False
+    format: str = "rich"
+    command_log_size: int = 200
 
 
 class ViewportConfig(BaseModel):
@@ -1,24 +1,34 @@
+import time
 from logging import Logger
-from typing import Dict, List, Set, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple, Union
+from weakref import WeakValueDictionary
 
-from faker import Faker
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.wait import WebDriverWait
 
-from pylenium import webdriver_factory
-from pylenium.a11y import PyleniumAxe
-from pylenium.cdp import CDP
+from pylenium import frames as frames_, idle, navigation, observe, shadow, text_index
+from pylenium.command_log import CommandLog
 from pylenium.config import PyleniumConfig
 from pylenium.element import Element, Elements
-from pylenium.log import logger as log
-from pylenium.performance import Performance
+from pylenium.log import configure as configure_logging, logger as log
+from pylenium.stats import Stats
 from pylenium.switch_to import SwitchTo
 from pylenium.wait import PyleniumWait
 
+if TYPE_CHECKING:
+    # heavy sub-APIs are imported on first use so `import pylenium.driver` stays fast
+    from faker import Faker
+
+    from pylenium.a11y import PyleniumAxe
+    from pylenium.batch import Batch
+    from pylenium.cdp import CDP
+    from pylenium.performance import Performance
+    from pylenium.snapshot import Snapshot
+
 
 class PyleniumShould:
     """A collection of conditions (aka expectations) for the Pylenium Driver including the browser, window, and more.
@@ -29,8 +39,11 @@ class PyleniumShould:
     ```
     """
 
+    __slots__ = ("_py", "_timeout", "_wait")
+
     def __init__(self, py: "Pylenium", timeout: int, ignored_exceptions: list = None):
         self._py = py
+        self._timeout = timeout
         self._wait: PyleniumWait = self._py.wait(timeout=timeout, use_py=True, ignored_exceptions=ignored_exceptions)
 
     def have_title(self, title: str) -> "Pylenium":
@@ -130,6 +143,11 @@ class PyleniumShould:
             `AssertionError` if the condition is not met within the timeout.
         """
         log.command("Pylenium.should().not_find() elements with CSS: `%s`", css)
+        self._py._restore_context()
+        if observe.is_enabled(self._py):
+            if observe.wait_for_absence(self._py, "selector", self._timeout, By.CSS_SELECTOR, css):
+                return True
+            raise AssertionError(f"Found element with css: `{css}`")
         try:
             self._wait.until_not(lambda x: x.find_element(By.CSS_SELECTOR, css))
             return True
@@ -149,6 +167,11 @@ class PyleniumShould:
             `AssertionError` if the condition is not met within the timeout.
         """
         log.command("Pylenium.should().not_findx() elements with XPATH: `%s`", xpath)
+        self._py._restore_context()
+        if observe.is_enabled(self._py):
+            if observe.wait_for_absence(self._py, "selector", self._timeout, By.XPATH, xpath):
+                return True
+            raise AssertionError(f"Found element with xpath: `{xpath}`")
         try:
             self._wait.until_not(lambda x: x.find_element(By.XPATH, xpath))
             return True
@@ -168,8 +191,13 @@ class PyleniumShould:
             `AssertionError` if the condition is not met within the timeout.
         """
         log.command("Pylenium.should().not_contain() any elements with the text: `%s`", text)
+        self._py._restore_context()
+        if observe.is_enabled(self._py):
+            if observe.wait_for_absence(self._py, "text", self._timeout, selector=text):
+                return True
+            raise AssertionError(f"Found element containing text: `{text}`")
         try:
-            self._wait.until_not(lambda x: x.find_element(By.XPATH, f'//*[contains(text(), "{text}")]'))
+            self._wait.until_not(lambda x: text_index.find(x, text))
             return True
         except TimeoutException:
             raise AssertionError(f"Found element containing text: `{text}`")
@@ -178,17 +206,51 @@ class PyleniumShould:
 class Pylenium:
     """The Pylenium API."""
 
-    def __init__(self, config: PyleniumConfig):
+    def __init__(self, config: PyleniumConfig, driver_factory: Optional[Callable[[PyleniumConfig], WebDriver]] = None):
         self.config = config
         log.setLevel(self.config.logging.pylog_level)
-        self.fake = Faker()
+        configure_logging(self.config.logging.queue, self.config.logging.format)
         self.Keys = Keys
+        self._driver_factory = driver_factory
+        self._fake = None
         self._webdriver = None
         self._wait = None
+        self._cdp = None
+        self._axe = None
+        self._performance = None
+        self._switch_to = None
+        self._script_timeout: Optional[float] = None  # read from the session when it's first needed
+        self._network_counter = False
+        self.stats = Stats()
+        self.command_log = CommandLog(self.config.logging.command_log_size)
+        self._elements: WeakValueDictionary = WeakValueDictionary()
+        self._frame_path: Optional[Tuple[int, ...]] = ()
+        # the frame that the commands run in. An element found with frames="all" can switch the driver away from it
+        self._context_path: Optional[Tuple[int, ...]] = ()
 
     def init_webdriver(self):
-        """Initialize WebDriver using the Pylenium Config."""
-        self._webdriver = webdriver_factory.build_from_config(self.config)
+        """Initialize WebDriver using the Pylenium Config.
+
+        * The WebDriver is built by the `driver_factory` given to Pylenium, like a SessionPool's `acquire` method.
+        * By default, `webdriver_factory.build_from_config` is used.
+        * The page load timeout and, when the browser supports it, the viewport are part of the new-session request
+          built by `webdriver_factory.build_from_config`, so they are not set again with extra round trips.
+        """
+        from pylenium import webdriver_factory
+
+        start = time.perf_counter()
+        self._webdriver = (self._driver_factory or webdriver_factory.build_from_config)(self.config)
+        self.command_log.attach(self._webdriver)
+        session_time = time.perf_counter() - start
+        # sub-APIs that wrap the WebDriver are built again for the new session
+        self._cdp = None
+        self._axe = None
+        self._performance = None
+        self._script_timeout: Optional[float] = None  # read from the session when it's first needed
+        self._network_counter = False
+        self._elements = WeakValueDictionary()
+        self._frame_path = ()
+        self._context_path = ()
         caps = self._webdriver.capabilities
         try:
             log.debug(
@@ -204,14 +266,20 @@ class Pylenium:
         # Default instance of PyleniumWait
         self._wait = PyleniumWait(self, self._webdriver, self.config.driver.wait_time, ignored_exceptions=None)
 
-        # Initial Browser Setup
-        if self.config.driver.page_load_wait_time:
-            self.set_page_load_timeout(self.config.driver.page_load_wait_time)
-
-        if self.config.viewport.maximize:
+        # Initial Browser Setup that couldn't be folded into the new-session request
+        folded = 1 if self.config.driver.page_load_wait_time else 0
+        if webdriver_factory.build_viewport_options(self.config.driver.browser, self.config.viewport, self.config.driver.options):
+            folded += 1
+        elif self.config.viewport.maximize:
             self.maximize_window()
         else:
             self.viewport(self.config.viewport.width, self.config.viewport.height, self.config.viewport.orientation)
+        log.debug(
+            "Session bootstrap: %.3fs to start the session, %.3fs of setup after it - %s setup round trip(s) folded into the new-session request",
+            session_time,
+            time.perf_counter() - start - session_time,
+            folded,
+        )
         return self._webdriver
 
     @property
@@ -268,7 +336,28 @@ class Pylenium:
         return PyleniumShould(self, wait_time, ignored_exceptions)
 
     @property
-    def axe(self) -> PyleniumAxe:
+    def fake(self) -> "Faker":
+        """A basic instance of Faker to make test data.
+
+        * Faker is only imported and built the first time this is used.
+
+        Examples:
+        ```
+            py.get("#username").type(py.fake.user_name())
+        ```
+        """
+        if self._fake is None:
+            from faker import Faker
+
+            self._fake = Faker()
+        return self._fake
+
+    @fake.setter
+    def fake(self, faker: "Faker"):
+        self._fake = faker
+
+    @property
+    def axe(self) -> "PyleniumAxe":
         """PyleniumAxe API: Accessibility (a11y) Auditing and Reporting.
 
         Examples:
@@ -281,10 +370,14 @@ class Pylenium:
                 assert violation_count == 0, f"{violation_count} violation(s) found!"
         ```
         """
-        return PyleniumAxe(self.webdriver)
+        if self._axe is None:
+            from pylenium.a11y import PyleniumAxe
+
+            self._axe = PyleniumAxe(self.webdriver)
+        return self._axe
 
     @property
-    def performance(self) -> Performance:
+    def performance(self) -> "Performance":
         """Performance API: Pylenium's custom way of capturing web performnace metrics.
 
         Examples:
@@ -297,10 +390,14 @@ class Pylenium:
             tti = py.performance.get().time_to_interactive()
         ```
         """
-        return Performance(self.webdriver)
+        if self._performance is None:
+            from pylenium.performance import Performance
+
+            self._performance = Performance(self.webdriver)
+        return self._performance
 
     @property
-    def cdp(self) -> CDP:
+    def cdp(self) -> "CDP":
         """Chrome DevTools Protocol API.
 
         Examples:
@@ -317,7 +414,11 @@ class Pylenium:
             }
         ```
         """
-        return CDP(self.webdriver)
+        if self._cdp is None:
+            from pylenium.cdp import CDP
+
+            self._cdp = CDP(self.webdriver)
+        return self._cdp
 
     # endregion
 
@@ -337,22 +438,46 @@ class Pylenium:
 
     # region NAVIGATION
 
-    def visit(self, url: str) -> "Pylenium":
+    def visit(self, url: str, wait_until: Optional[str] = None) -> "Pylenium":
         """Navigate to the given URL.
 
+        * If `wait_until=None` (default), wait for the driver's page load strategy.
+        * Else, wait until the page reaches the lifecycle state:
+          `"commit"`, `"domcontentloaded"`, `"load"` or `"networkidle"`.
+
+        Args:
+            url: The URL to navigate to.
+            wait_until: The lifecycle state to wait for.
+
         Returns:
             The current instance of Pylenium
+
+        Examples:
+        ```
+            # don't wait for slow third-party resources to load
+            py.visit("https://qap.dev", wait_until="domcontentloaded")
+        ```
         """
         log.command("py.visit() - Visit URL: `%s`", url)
-        self.webdriver.get(url)
+        navigation.check(wait_until)
+        if wait_until:
+            navigation.visit(self, url, wait_until)
+        else:
+            self.webdriver.get(url)
+        self._frame_path = self._context_path = ()  # navigation switches the driver back to the main document
         return self
 
-    def go(self, direction: str, number: int = 1) -> "Pylenium":
+    def go(self, direction: str, number: int = 1, wait_until: Optional[str] = None) -> "Pylenium":
         """Navigate forward or back.
 
+        * If `wait_until=None` (default), don't wait for the navigation.
+        * Else, wait until the page reaches the lifecycle state:
+          `"commit"`, `"domcontentloaded"`, `"load"` or `"networkidle"`.
+
         Args:
             direction: `"forward"` or `"back"`
             number: default is 1, will go back or forward one page in history.
+            wait_until: The lifecycle state to wait for.
 
         Examples:
         ```
@@ -364,22 +489,38 @@ class Pylenium:
             The current instance of Pylenium
         """
         log.command("py.go() - Go %s %s in browser history", direction, number)
+        navigation.check(wait_until)
         if direction == "back":
-            self.webdriver.execute_script("window.history.go(arguments[0])", number * -1)
-        elif direction == "forward":
-            self.webdriver.execute_script("window.history.go(arguments[0])", number)
-        else:
+            number = number * -1
+        elif direction != "forward":
             raise ValueError(f"direction was invalid. Must be `forward` or `back` but was {direction}")
+        if wait_until:
+            navigation.go(self, number, wait_until)
+        else:
+            self.webdriver.execute_script("window.history.go(arguments[0])", number)
+        self._frame_path = self._context_path = ()
         return self
 
-    def reload(self) -> "Pylenium":
+    def reload(self, wait_until: Optional[str] = None) -> "Pylenium":
         """Reload (aka refresh) the current window.
 
+        * If `wait_until=None` (default), wait for the driver's page load strategy.
+        * Else, wait until the page reaches the lifecycle state:
+          `"commit"`, `"domcontentloaded"`, `"load"` or `"networkidle"`.
+
+        Args:
+            wait_until: The lifecycle state to wait for.
+
         Returns:
             The current instance of Pylenium
         """
         log.command("py.reload() - Reload (refresh) the current page")
-        self.webdriver.refresh()
+        navigation.check(wait_until)
+        if wait_until:
+            navigation.reload(self, wait_until)
+        else:
+            self.webdriver.refresh()
+        self._frame_path = self._context_path = ()
         return self
 
     # endregion
@@ -392,6 +533,7 @@ class Pylenium:
         * If `timeout=None` (default), use the default wait_time.
         * If `timeout > 0`, override the default wait_time.
         * If `timeout=0`, poll the DOM immediately without any waiting.
+        * Whitespace is normalized and the page's text is indexed between DOM changes. See `pylenium.text_index`
 
         Args:
             text: The text for the element to contain.
@@ -401,59 +543,92 @@ class Pylenium:
             The first element that is found, even if multiple elements match the query.
         """
         log.command("py.contains() - Get the element containing the text: `%s`", text)
-        locator = (By.XPATH, f'//*[contains(text(), "{text}")]')
+        self._restore_context()
+        locator = (By.XPATH, text_index.xpath(text))
 
+        message = f"Could not find element with the text `{text}`"
         if timeout == 0:
-            element = self.webdriver.find_element(*locator)
+            element = text_index.find(self.webdriver, text)
+            if element is None:
+                raise NoSuchElementException(message)
+        elif observe.is_enabled(self):
+            element = observe.wait_for_selector(self, *locator, timeout=timeout, message=message)
         else:
-            element = self.wait(timeout).until(lambda x: x.find_element(*locator), f"Could not find element with the text `{text}`")
+            element = self.wait(timeout).until(lambda x: text_index.find(x, text), message)
         return Element(self, element, locator)
 
-    def get(self, css: str, timeout: int = None) -> Element:
+    def get(self, css: str, timeout: int = None, frames: Optional[str] = None) -> Element:
         """Get the DOM element that matches the CSS selector.
 
         * If `timeout=None` (default), use the default wait_time.
         * If `timeout > 0`, override the default wait_time.
         * If `timeout=0`, poll the DOM immediately without any waiting.
+        * If `frames="all"`, search the main document and every same-origin frame in one script.
+          The driver switches to the element's frame automatically whenever the element is used.
+        * Use `>>>` to step into shadow roots, like `app-shell >>> nav-menu >>> button`.
 
         Args:
             css: The selector to use.
             timeout: The number of seconds to wait for this to succeed. Overrides the default wait_time.
+            frames: None to search the current context, or `"all"` to search every frame.
 
         Returns:
             The first element that is found, even if multiple elements match the query.
         """
         log.command("py.get() - Find the element with CSS: `%s`", css)
+        self._restore_context()
         by = By.CSS_SELECTOR
+        frames_.check(frames)
 
+        message = f"Could not find element with the CSS `{css}`"
+        if frames:
+            return frames_.get(self, css, timeout, message)
+        if shadow.is_piercing(css):
+            return Element(self, shadow.get(self, css, timeout=timeout, message=message), locator=(shadow.BY, css))
         if timeout == 0:
             element = self.webdriver.find_element(by, css)
+        elif observe.is_enabled(self):
+            element = observe.wait_for_selector(self, by, css, timeout=timeout, message=message)
         else:
-            element = self.wait(timeout).until(lambda x: x.find_element(by, css), f"Could not find element with the CSS `{css}`")
+            element = self.wait(timeout).until(lambda x: x.find_element(by, css), message)
         return Element(self, element, locator=(by, css))
 
-    def find(self, css: str, timeout: int = None) -> Elements:
+    def find(self, css: str, timeout: int = None, frames: Optional[str] = None) -> Elements:
         """Finds all DOM elements that match the CSS selector.
 
         * If `timeout=None (default)`, use the default wait_time.
         * If `timeout > 0`, override the default wait_time.
         * If `timeout=0`, poll the DOM immediately without any waiting.
+        * If `frames="all"`, search the main document and every same-origin frame in one script.
+          The driver switches to each element's frame automatically whenever the element is used.
+        * Use `>>>` to step into shadow roots, like `app-shell >>> nav-menu >>> button`.
 
         Args:
             css: The selector to use.
             timeout: The number of seconds to wait for this to succeed. Overrides the default wait_time.
+            frames: None to search the current context, or `"all"` to search every frame.
 
         Returns:
             A list of the found elements.
         """
         by = By.CSS_SELECTOR
         log.command("py.find() - Find elements with CSS: `%s`", css)
+        self._restore_context()
+        frames_.check(frames)
 
+        message = f"Could not find any elements with the CSS `{css}`"
         try:
-            if timeout == 0:
+            if frames:
+                return frames_.find(self, css, timeout, message)
+            if shadow.is_piercing(css):
+                by = shadow.BY
+                elements = shadow.find(self, css, timeout=timeout, message=message)
+            elif timeout == 0:
                 elements = self.webdriver.find_elements(by, css)
+            elif observe.is_enabled(self):
+                elements = observe.wait_for_selector(self, by, css, timeout=timeout, mode="all", message=message)
             else:
-                elements = self.wait(timeout).until(lambda x: x.find_elements(by, css), f"Could not find any elements with the CSS `{css}`")
+                elements = self.wait(timeout).until(lambda x: x.find_elements(by, css), message)
         except TimeoutException:
             elements = []
         return Elements(self, elements, locator=(by, css))
@@ -474,11 +649,15 @@ class Pylenium:
         """
         by = By.XPATH
         log.command("py.getx() - Find the element with xpath: `%s`", xpath)
+        self._restore_context()
 
+        message = f"Could not find an element with xpath: `{xpath}`"
         if timeout == 0:
             element = self.webdriver.find_element(by, xpath)
+        elif observe.is_enabled(self):
+            element = observe.wait_for_selector(self, by, xpath, timeout=timeout, message=message)
         else:
-            element = self.wait(timeout).until(lambda x: x.find_element(by, xpath), f"Could not find an element with xpath: `{xpath}`")
+            element = self.wait(timeout).until(lambda x: x.find_element(by, xpath), message)
         return Element(self, element, locator=(by, xpath))
 
     def findx(self, xpath: str, timeout: int = None) -> Elements:
@@ -497,20 +676,126 @@ class Pylenium:
         """
         by = By.XPATH
         log.command("py.findx() - Find elements with xpath: `%s`", xpath)
+        self._restore_context()
 
+        message = f"Could not find an element with xpath: `{xpath}`"
         try:
             if timeout == 0:
                 elements = self.webdriver.find_elements(by, xpath)
+            elif observe.is_enabled(self):
+                elements = observe.wait_for_selector(self, by, xpath, timeout=timeout, mode="all", message=message)
             else:
-                elements = self.wait(timeout).until(lambda x: x.find_elements(by, xpath), f"Could not find an element with xpath: `{xpath}`")
+                elements = self.wait(timeout).until(lambda x: x.find_elements(by, xpath), message)
         except TimeoutException:
             elements = []
         return Elements(self, elements, locator=(by, xpath))
 
+    def snapshot(self) -> "Snapshot":
+        """Take a snapshot of the current page's DOM that can be queried locally, without any more WebDriver traffic.
+
+        * The snapshot has the same `get`, `find`, `getx`, `findx`, `contains` and `text()` commands as Element
+        * Use `snapshot.is_stale()` to check if the page has changed since the snapshot was taken
+
+        Examples:
+        ```
+            snapshot = py.snapshot()
+            rows = snapshot.find("#users tr")
+            assert rows.length() == 500
+            assert "Jane Doe" in rows.texts()
+        ```
+        """
+        from pylenium.snapshot import Snapshot
+
+        log.command("py.snapshot() - Take a snapshot of the DOM")
+        return Snapshot.capture(self)
+
     # endregion
 
     # region UTILITIES
 
+    def _enter_frame(self, frame_path: Tuple[int, ...]):
+        """Switch the driver to the frame at the given path of frame indexes, unless it's already there."""
+        if self._frame_path == frame_path:
+            return
+        self._frame_path = None  # unknown until every switch succeeds
+        self.webdriver.switch_to.default_content()
+        for index in frame_path:
+            self.webdriver.switch_to.frame(index)
+        self._frame_path = frame_path
+
+    def _restore_context(self):
+        """Switch back to the frame the commands run in, if an element found with frames="all" switched away from it."""
+        if self._context_path is not None:
+            self._enter_frame(self._context_path)
+
+    def batch(self, timeout: Optional[float] = None) -> "Batch":
+        """Record commands and run them as a single script when the `with` block exits.
+
+        * Each step waits for its element to exist, up to the timeout
+        * If a step fails, the matching Selenium exception is raised for that step and the steps after it don't run
+        * If a step starts a navigation, the steps after it run in a new script on the new page
+
+        Args:
+            timeout: The number of seconds each step can wait for its element. Overrides the default wait_time.
+
+        Examples:
+        ```
+            with py.batch() as batch:
+                batch.type("#username", "tomsmith", clear=True)
+                batch.type("#password", "SuperSecretPassword!", clear=True)
+                batch.click("button[type='submit']")  # navigates, so the next step runs on the new page
+                message = batch.text("#flash")
+            assert "You logged into a secure area!" in message.value
+        ```
+        """
+        from pylenium.batch import Batch
+
+        return Batch(self, timeout)
+
+    def wait_for_network_idle(self, idle_ms: int = 500, max_inflight: int = 0, timeout: Optional[float] = None) -> "Pylenium":
+        """Wait until the page's fetch and XHR requests have settled.
+
+        * On Chromium browsers, requests are counted from the start of each page load
+        * On other browsers, requests are counted from the first call on the current page
+
+        Args:
+            idle_ms: The number of milliseconds that the network must stay idle.
+            max_inflight: The number of requests that can still be in flight, like a long-polling connection.
+            timeout: The number of seconds to wait. Overrides the default wait_time.
+
+        Returns:
+            The current instance of Pylenium
+
+        Raises:
+            `TimeoutException` if the network wasn't idle within the timeout.
+
+        Examples:
+        ```
+            py.get("#search").type("pylenium", py.Keys.ENTER)
+            py.wait_for_network_idle().get(".results").should().be_visible()
+        ```
+        """
+        log.command("py.wait_for_network_idle() - Wait for %sms without requests in flight", idle_ms)
+        idle.wait_for_network_idle(self, idle_ms, max_inflight, timeout)
+        return self
+
+    def wait_for_dom_stable(self, quiet_ms: int = 500, timeout: Optional[float] = None) -> "Pylenium":
+        """Wait until the DOM has stopped changing, ie a list has finished rendering.
+
+        Args:
+            quiet_ms: The number of milliseconds without any changes to the DOM.
+            timeout: The number of seconds to wait. Overrides the default wait_time.
+
+        Returns:
+            The current instance of Pylenium
+
+        Raises:
+            `TimeoutException` if the DOM was still changing when the timeout was reached.
+        """
+        log.command("py.wait_for_dom_stable() - Wait for %sms without DOM changes", quiet_ms)
+        idle.wait_for_dom_stable(self, quiet_ms, timeout)
+        return self
+
     def wait(self, timeout: int = None, use_py: bool = False, ignored_exceptions: List = None) -> Union[WebDriverWait, PyleniumWait]:
         """The Wait object with the given timeout in seconds.
 
@@ -701,7 +986,9 @@ class Pylenium:
             py.switch_to.frame("iframe-id")
         ```
         """
-        return SwitchTo(self)
+        if self._switch_to is None:
+            self._switch_to = SwitchTo(self)
+        return self._switch_to
 
     def maximize_window(self) -> "Pylenium":
         """Maximizes the current Window."""
@@ -0,0 +1,243 @@
+""" Local cache of the driver and browser paths resolved by Selenium Manager.
+
+Without it, every process (ie every xdist worker) asks Selenium Manager to resolve the driver and browser again,
+which can include a network probe. The cache is filled once with `pylenium drivers prefetch`
+and then each worker only needs a file lookup, so runs can be fully offline.
+
+* The cache file is `~/.cache/pylenium/drivers.json`. Use the `PYLENIUM_DRIVER_CACHE` env variable to change it.
+* Writers take a lock file and replace the cache atomically, so readers never need a lock.
+* Entries whose driver no longer exists on disk are ignored.
+* Each entry keeps the browser and driver versions. If the browser was updated (or moved) since the entry was
+  written, the entry is ignored and Selenium Manager resolves a matching driver instead.
+"""
+
+import json
+import os
+import re
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pylenium.log import logger as log
+
+
+CACHE_FILE_ENV = "PYLENIUM_DRIVER_CACHE"
+
+# Pylenium's browser names and the names Selenium Manager expects
+SELENIUM_MANAGER_BROWSERS = {
+    "chrome": "chrome",
+    "edge": "MicrosoftEdge",
+    "firefox": "firefox",
+}
+
+
+def cache_file() -> Path:
+    """The filepath of the driver cache."""
+    custom_path = os.environ.get(CACHE_FILE_ENV)
+    if custom_path:
+        return Path(custom_path)
+    return Path.home().joinpath(".cache", "pylenium", "drivers.json")
+
+
+def read() -> Dict[str, Dict]:
+    """Read every entry in the driver cache.
+
+    Returns:
+        The entries keyed by browser name, or an empty dict if there is no cache yet.
+    """
+    try:
+        with cache_file().open(encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def lookup(browser: str) -> Optional[Dict]:
+    """Get the cached driver and browser paths for the given browser.
+
+    Args:
+        browser: The lowercase browser name, like "chrome".
+
+    Returns:
+        A dict with `driver_path` and `browser_path`, or None if the browser isn't cached, its driver is gone
+        or the browser changed since the driver was resolved.
+    """
+    entry = read().get(browser.lower())
+    if not entry or not Path(entry.get("driver_path", "")).is_file():
+        return None
+    if not _is_current(entry):
+        log.info("The cached %s driver may not match the installed browser anymore. Resolving it with Selenium Manager.", browser)
+        return None
+    return entry
+
+
+def version(path: str) -> str:
+    """The version that the browser or driver at the path prints with `--version`, or "" if it can't be read."""
+    if not path:
+        return ""
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    match = re.search(r"\d+(\.\d+)+", output)
+    return match.group(0) if match else ""
+
+
+def _is_current(entry: Dict) -> bool:
+    """True if the browser is still the one the entry's driver was resolved for."""
+    if "browser_version" not in entry:
+        return False  # written before versions were kept
+    browser_path = entry.get("browser_path")
+    if not browser_path:
+        return True
+    try:
+        modified = Path(browser_path).stat().st_mtime
+    except OSError:
+        return False
+    if modified == entry.get("browser_modified"):
+        return True
+    # the browser's files changed, ie it auto-updated. Only run it when that happens.
+    current = version(browser_path)
+    return bool(current) and current == entry["browser_version"]
+
+
+def resolve(browser: str) -> Dict:
+    """Ask Selenium Manager to resolve (and download, if needed) the driver and browser for the given browser.
+
+    Args:
+        browser: The lowercase browser name, like "chrome".
+
+    Returns:
+        A dict with `driver_path` and `browser_path`.
+    """
+    from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+    browser = browser.lower()
+    if browser not in SELENIUM_MANAGER_BROWSERS:
+        raise ValueError(f"{browser} is not supported. Cannot resolve its driver with Selenium Manager.")
+
+    manager = SeleniumManager()
+    if hasattr(manager, "binary_paths"):
+        paths = manager.binary_paths(["--browser", SELENIUM_MANAGER_BROWSERS[browser]])
+    else:
+        # older versions of Selenium resolve the driver from an Options object
+        from selenium import webdriver
+
+        options = {"chrome": webdriver.ChromeOptions, "edge": webdriver.EdgeOptions, "firefox": webdriver.FirefoxOptions}[browser]()
+        paths = {"driver_path": manager.driver_location(options), "browser_path": getattr(options, "binary_location", "")}
+    return {"driver_path": paths.get("driver_path") or "", "browser_path": paths.get("browser_path") or ""}
+
+
+def prefetch(browsers: List[str]) -> Dict[str, Dict]:
+    """Resolve the given browsers with Selenium Manager and save them in the driver cache.
+
+    Args:
+        browsers: The lowercase browser names, like ["chrome", "firefox"].
+
+    Returns:
+        The new entries keyed by browser name.
+    """
+    entries = {}
+    for browser in browsers:
+        entry = resolve(browser)
+        entry["driver_version"] = version(entry["driver_path"])
+        entry["browser_version"] = version(entry["browser_path"])
+        entry["browser_modified"] = Path(entry["browser_path"]).stat().st_mtime if entry["browser_path"] else None
+        entry["resolved_at"] = time.time()
+        entries[browser.lower()] = entry
+    write(entries)
+    return entries
+
+
+def write(entries: Dict[str, Dict]):
+    """Merge the given entries into the driver cache.
+
+    The cache is locked while it is updated and then atomically replaced.
+    """
+    _update(lambda cache: cache.update(entries))
+
+
+def remove(browser: str):
+    """Remove the browser's entry from the driver cache, ie after its driver failed to start a session."""
+    _update(lambda cache: cache.pop(browser.lower(), None))
+
+
+def _update(change):
+    path = cache_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _lock(path):
+        cache = read()
+        change(cache)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".drivers-", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(cache, file, indent=2)
+        os.replace(temp_path, path)
+
+
+def clear():
+    """Delete the driver cache."""
+    path = cache_file()
+    with _lock(path):
+        path.unlink(missing_ok=True)
+
+
+@contextmanager
+def _lock(path: Path, timeout: float = 30.0, stale_after: float = 120.0):
+    """A lock file next to the cache that works across processes and platforms."""
+    lock_path = path.with_name(path.name + ".lock")
+    end_time = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if _age(lock_path) > stale_after and _break_stale_lock(lock_path, stale_after):
+                continue
+            if time.monotonic() > end_time:
+                raise TimeoutError(f"Could not lock the driver cache: {lock_path}")
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        lock_path.unlink(missing_ok=True)
+
+
+def _age(path: Path) -> float:
+    """The number of seconds since the file was modified, or 0 if it's gone."""
+    try:
+        return time.time() - path.stat().st_mtime
+    except FileNotFoundError:
+        return 0
+
+
+def _break_stale_lock(lock_path: Path, stale_after: float) -> bool:
+    """Remove a stale lock file.
+
+    Only the process that creates the `.break` file (atomically, with O_EXCL) can remove the lock, and it checks
+    that the lock is still stale first. Without it, two processes could both see the stale lock, and the second
+    one would remove the lock that the first one just took.
+
+    Returns:
+        True if the lock was removed.
+    """
+    breaker = lock_path.with_name(lock_path.name + ".break")
+    try:
+        fd = os.open(breaker, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        # a process that crashed while breaking the lock leaves its breaker behind
+        if _age(breaker) > stale_after:
+            breaker.unlink(missing_ok=True)
+        return False
+    try:
+        if _age(lock_path) <= stale_after:
+            return False
+        log.warning("Removing stale driver cache lock: %s", lock_path)
+        lock_path.unlink(missing_ok=True)
+        return True
+    finally:
+        os.close(fd)
+        breaker.unlink(missing_ok=True)
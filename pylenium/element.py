@@ -1,51 +1,107 @@
+import functools
 import time
-from typing import List, Optional, Tuple
+from weakref import WeakValueDictionary
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException, WebDriverException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebElement
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.select import Select
 
-from pylenium import jquery
+from pylenium import actionability, observe, polling, shadow, text_index, utils
+from pylenium.config import PollingConfig
 from pylenium.log import logger as log
+from pylenium.polling import PollingStrategy
+from pylenium.stats import Stats
+
+
+def _interned(py) -> Optional[WeakValueDictionary]:
+    """The Elements of the current session keyed by WebElement id, or None if the session doesn't intern them."""
+    interned = getattr(py, "_elements", None)
+    return interned if isinstance(interned, WeakValueDictionary) else None
+
+
+def _find_elements(py, root, locator) -> List[WebElement]:
+    """Find the WebElements of a locator within the root, which is the driver or a WebElement."""
+    by, selector = locator
+    if by == shadow.BY:
+        return shadow.query(py, selector, None if root is py.webdriver else root, first=False)
+    return root.find_elements(by, selector)
+
+
+def _recover_stale(method):
+    """Find the Element again with its locator and retry the method if its WebElement went stale.
+
+    The number of attempts is bounded by `driver.stale_retries` in pylenium.json.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "Element", *args, **kwargs):
+        attempts = self._py.config.driver.stale_retries
+        while True:
+            try:
+                return method(self, *args, **kwargs)
+            except StaleElementReferenceException:
+                if attempts <= 0 or self._recover() is None:
+                    raise
+                attempts -= 1
+
+    return wrapper
 
 
 class ElementWait:
-    def __init__(self, webelement, timeout: int, ignored_exceptions: list = None):
+    __slots__ = ("_webelement", "_relocate", "_timeout", "_ignored_exceptions", "_strategy", "_stats", "_locator")
+
+    def __init__(
+        self,
+        webelement,
+        timeout: int,
+        ignored_exceptions: list = None,
+        strategy: Optional[PollingStrategy] = None,
+        relocate: Optional[Callable[[], Optional[WebElement]]] = None,
+        stats: Optional[Stats] = None,
+        locator: Optional[Tuple[str, str]] = None,
+    ):
         self._webelement = webelement
+        self._relocate = relocate
+        self._stats = stats
+        self._locator = locator
         self._timeout = 10 if timeout == 0 else timeout
         if ignored_exceptions:
-            self._ignored_exceptions = ignored_exceptions
+            self._ignored_exceptions = tuple(ignored_exceptions) if isinstance(ignored_exceptions, (list, tuple)) else ignored_exceptions
         else:
             self._ignored_exceptions = NoSuchElementException
+        self._strategy = strategy or polling.build_strategy(PollingConfig())
 
     def until(self, method, message=""):
-        screen = None
-        stacktrace = None
+        record = None
+        if self._stats is not None:
+            locator = f"{self._locator[0]}: {self._locator[1]}" if self._locator else None
+            record = self._stats.record_wait(polling.describe(method), message, locator)
+        return polling.poll(lambda: self._call(method), self._timeout, self._strategy, self._ignored_exceptions, message, record=record)
 
-        end_time = time.time() + self._timeout
-        while True:
-            try:
-                value = method(self._webelement)
-                if value:
-                    return value
-            except self._ignored_exceptions as exc:
-                screen = getattr(exc, "screen", None)
-                stacktrace = getattr(exc, "stacktrace", None)
-            time.sleep(0.5)
-            if time.time() > end_time:
-                break
-        raise TimeoutException(message, screen, stacktrace)
+    def _call(self, method):
+        try:
+            return method(self._webelement)
+        except StaleElementReferenceException:
+            webelement = self._relocate() if self._relocate else None
+            if webelement is None:
+                raise
+            self._webelement = webelement
+            return method(self._webelement)
 
 
 class ElementsShould:
     """ElementsShould API: Commands (aka Expectations) for the current list of Elements."""
 
+    __slots__ = ("_py", "_elements", "_timeout", "_wait")
+
     def __init__(self, py, elements: "Elements", timeout: int, ignored_exceptions: list = None):
         self._py = py
         self._elements = elements
+        self._timeout = timeout
         self._wait = py.wait(timeout=timeout, use_py=True, ignored_exceptions=ignored_exceptions)
 
     # region POSITIVE EXPECTATIONS
@@ -64,7 +120,7 @@ class ElementsShould:
             if self._elements.is_empty():
                 return True
             locator = self._elements.locator
-            value = self._wait.until(lambda drvr: len(drvr.find_elements(*locator)) == 0)
+            value = self._wait.until(lambda drvr: len(_find_elements(self._py, drvr, locator)) == 0)
         except TimeoutException:
             value = False
         if value:
@@ -85,7 +141,7 @@ class ElementsShould:
             if self._elements.length() > length:
                 return True
             locator = self._elements.locator
-            value = self._wait.until(lambda drvr: len(drvr.find_elements(*locator)) > length)
+            value = self._wait.until(lambda drvr: len(_find_elements(self._py, drvr, locator)) > length)
         except TimeoutException:
             value = False
         if value:
@@ -106,7 +162,7 @@ class ElementsShould:
             if self._elements.length() < length:
                 return True
             locator = self._elements.locator
-            value = self._wait.until(lambda drvr: len(drvr.find_elements(*locator)) < length)
+            value = self._wait.until(lambda drvr: len(_find_elements(self._py, drvr, locator)) < length)
         except TimeoutException:
             value = False
         if value:
@@ -127,7 +183,10 @@ class ElementsShould:
             if self._elements.length() == length:
                 return True
             locator = self._elements.locator
-            value = self._wait.until(lambda drvr: len(drvr.find_elements(*locator)) == length)
+            if observe.is_enabled(self._py) and locator[0] != shadow.BY:
+                value = observe.wait_for_selector(self._py, *locator, timeout=self._timeout, mode="length", length=length) is not None
+            else:
+                value = self._wait.until(lambda drvr: len(_find_elements(self._py, drvr, locator)) == length)
         except TimeoutException:
             value = False
         if value:
@@ -152,7 +211,7 @@ class ElementsShould:
             if not self._elements.is_empty():
                 return self._elements
             locator = self._elements.locator
-            value = self._wait.until(lambda drvr: drvr.find_elements(*locator))
+            value = self._wait.until(lambda drvr: _find_elements(self._py, drvr, locator))
         except TimeoutException:
             value = False
         if value:
@@ -162,13 +221,48 @@ class ElementsShould:
     # endregion
 
 
+def _condition_failure(name: str, conditions: dict, actual) -> str:
+    """The error message of a condition that failed in `ElementShould.all()`, matching its single expectation."""
+    if name.startswith("attr:"):
+        attr = name[len("attr:"):]
+        if conditions["attr"][attr] is None:
+            return f"Element did not have attribute: `{attr}`"
+        return f"Expected Attribute Value: `{conditions['attr'][attr]}` - Actual Attribute Value: `{actual}`"
+    if name.startswith("prop:"):
+        prop = name[len("prop:"):]
+        return f"Expected Property value: `{conditions['prop'][prop]}` - Actual Property value: `{actual}`"
+    expected = conditions[name]
+    if name == "text":
+        return f"Expected text: `{expected}` - Actual text: `{actual}`"
+    if name == "contain_text":
+        return f"Expected `{expected}` to be in `{actual}`"
+    if name == "value":
+        return f"Expected value: `{expected}` - Actual value: `{actual}`"
+    if name == "class_name":
+        return f"Expected className: `{expected}` - Actual className: `{actual}`"
+    if expected:
+        return f"Element was not {name}"
+    return f"Element was {name}"
+
+
 class ElementShould:
     """ElementShould API: Commands (aka Expectations) for the current Element."""
 
+    __slots__ = ("_py", "_element", "_timeout", "_wait")
+
     def __init__(self, py, element: "Element", timeout: int, ignored_exceptions: list = None):
         self._py = py
         self._element = element
-        self._wait = ElementWait(element.webelement, timeout, ignored_exceptions)
+        self._timeout = timeout
+        self._wait = ElementWait(
+            element.webelement,
+            timeout,
+            ignored_exceptions,
+            polling.build_strategy(py.config.driver.polling),
+            element._recover,
+            py.stats,
+            element.locator,
+        )
 
     # region POSITIVE EXPECTATIONS
 
@@ -274,7 +368,10 @@ class ElementShould:
         """
         log.command("Element.should().be_hidden()")
         try:
-            value = self._wait.until(lambda e: e and not e.is_displayed())
+            if observe.is_enabled(self._py):
+                value = observe.wait_for_absence(self._py, "hidden", self._timeout, element=self._element.webelement)
+            else:
+                value = self._wait.until(lambda e: e and not e.is_displayed())
         except TimeoutException:
             value = False
 
@@ -479,6 +576,99 @@ class ElementShould:
             return self._element
         raise AssertionError(f'Expected value: `{value}` - Actual value: `{self._element.get_attribute("value")}`')
 
+    def all(
+        self,
+        visible: Optional[bool] = None,
+        hidden: Optional[bool] = None,
+        clickable: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        disabled: Optional[bool] = None,
+        checked: Optional[bool] = None,
+        selected: Optional[bool] = None,
+        focused: Optional[bool] = None,
+        text: Optional[str] = None,
+        contain_text: Optional[str] = None,
+        value: Optional[str] = None,
+        class_name: Optional[str] = None,
+        attr: Optional[Dict[str, Optional[str]]] = None,
+        prop: Optional[Dict[str, Any]] = None,
+        case_sensitive: bool = True,
+    ) -> "Element":
+        """An expectation that the element meets every given condition at the same time.
+
+        All of the conditions are checked with a single script per poll instead of a polling loop per expectation.
+        Conditions that are `None` are not checked.
+
+        Args:
+            visible: True if the element should be displayed, False if it should not.
+            hidden: True if the element should not be displayed.
+            clickable: True if the element should be displayed and enabled.
+            enabled: True if the element should be enabled.
+            disabled: True if the element should be disabled.
+            checked: True if the checkbox or radio button should be checked.
+            selected: True if the element should be selected.
+            focused: True if the element should have focus.
+            text: The exact text to match.
+            contain_text: The text that the element should contain.
+            value: The exact value to match.
+            class_name: The exact `.className` to match.
+            attr: The attributes to match. Use a value of `None` if the attribute only needs to exist.
+            prop: The properties to match.
+            case_sensitive: False if you want to ignore casing and leading/trailing spaces of `text` and `contain_text`.
+
+        Returns:
+            The current element.
+
+        Raises:
+            `AssertionError` with every failed condition if they are not all met in the specified amount of time.
+            `ValueError` if no conditions are given.
+
+        Examples:
+        ```
+            py.get("#submit").should().all(visible=True, enabled=True, text="Submit", attr={"type": "submit"})
+        ```
+        """
+        expected = {
+            "visible": visible,
+            "hidden": hidden,
+            "clickable": clickable,
+            "enabled": enabled,
+            "disabled": disabled,
+            "checked": checked,
+            "selected": selected,
+            "focused": focused,
+            "text": text,
+            "contain_text": contain_text,
+            "value": value,
+            "class_name": class_name,
+            "attr": attr,
+            "prop": prop,
+        }
+        conditions = {name: condition for name, condition in expected.items() if condition is not None}
+        if not conditions:
+            raise ValueError("Element.should().all() needs at least one condition")
+        log.command("Element.should().all() `%s`", conditions)
+
+        script = utils.read_script_from_file("element_text.js") + utils.read_script_from_file("check_conditions.js")
+        results = {}
+
+        def check(webelement):
+            results.clear()
+            results.update(self._py.webdriver.execute_script(script, webelement, {**conditions, "case_sensitive": case_sensitive}))
+            return all(passed for passed, _ in results.values())
+
+        try:
+            value = self._wait.until(check)
+        except TimeoutException:
+            value = False
+
+        if value:
+            return self._element
+        if not results:
+            raise AssertionError("Element.should().all() was unable to check the element")
+        failures = [_condition_failure(name, conditions, actual) for name, (passed, actual) in results.items() if not passed]
+        raise AssertionError(f"{len(failures)} of {len(results)} conditions failed:\n- " + "\n- ".join(failures))
+
     # endregion
 
     # region NEGATIVE EXPECTATIONS
@@ -517,7 +707,13 @@ class ElementShould:
         """
         log.command("Element.should().disappear()")
         try:
-            value = self._wait.until(ec.invisibility_of_element(self._element.webelement))
+            if observe.is_enabled(self._py):
+                value = observe.wait_for_absence(self._py, "gone", self._timeout, element=self._element.webelement)
+            else:
+                value = self._wait.until(ec.invisibility_of_element(self._element.webelement))
+        except StaleElementReferenceException:
+            # the element was already removed from the DOM
+            value = True
         except TimeoutException:
             value = False
         if value:
@@ -610,14 +806,140 @@ class ElementShould:
     # endregion
 
 
-class Elements(List["Element"]):
-    """Elements API: Represents a list of DOM webelements and includes commands to work with them."""
+def _stored(method: Callable) -> Callable:
+    """Wrap a `list` method so the Elements are created and stored in the list itself before it runs."""
 
-    def __init__(self, py, web_elements, locator: Optional[Tuple]):
-        self._list = [Element(py, element, None) for element in web_elements]
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return method(self._store(), *args, **kwargs)
+
+    return wrapper
+
+
+class Elements(List["Element"]):
+    """Elements API: Represents a list of DOM webelements and includes commands to work with them.
+
+    * The WebElements are stored once and each `Element` is only created when it is accessed
+    * Slicing returns another `Elements` that shares the same WebElements instead of copying them
+    * Any other list operation, like `append()` or `+`, first creates every Element and stores them in the list
+    """
+
+    __slots__ = ("_py", "_handles", "_indices", "_parent", "_frames", "_frame_path", "_is_stored", "locator")
+
+    def __init__(
+        self,
+        py,
+        web_elements,
+        locator: Optional[Tuple],
+        parent: Optional["Element"] = None,
+        frames: Optional[Sequence[Tuple[Tuple[int, ...], int]]] = None,
+    ):
+        super().__init__()
         self._py = py
+        self._handles: Sequence[WebElement] = web_elements if isinstance(web_elements, (list, tuple)) else list(web_elements)
+        self._indices = range(len(self._handles))
+        self._parent = parent
+        self._frames = frames
+        # the frame the WebElements were found in, so they can be used after the driver switched to another frame
+        self._frame_path: Optional[Tuple[int, ...]] = getattr(py, "_frame_path", None)
+        self._is_stored = False
         self.locator = locator
-        super().__init__(self._list)
+
+    def _view(self, indices: range) -> "Elements":
+        """Another Elements of the given indices that shares this list's WebElements."""
+        view = Elements(self._py, self._handles, self.locator, self._parent, self._frames)
+        view._indices = indices
+        view._frame_path = self._frame_path
+        return view
+
+    def _element(self, i: int) -> "Element":
+        """Wrap the WebElement at index `i` so it can find itself again with the locator if it goes stale."""
+        if self._frames is not None:
+            # found with frames="all": the index is within the element's frame
+            frame_path, index = self._frames[i]
+            return Element(self._py, self._handles[i], self.locator, index=index, frame_path=frame_path)
+        if self.locator is None:
+            return Element(self._py, self._handles[i], None, frame_path=self._frame_path)
+        return Element(self._py, self._handles[i], self.locator, self._parent, i, frame_path=self._frame_path)
+
+    def _store(self) -> "Elements":
+        """Create every Element and store them in the list itself, so the `list` methods see them."""
+        if not self._is_stored:
+            list.extend(self, [self._element(i) for i in self._indices])
+            self._is_stored = True
+        return self
+
+    def _webelements(self) -> List[WebElement]:
+        if self._is_stored:
+            return [element.webelement for element in list.__iter__(self)]
+        return [self._handles[i] for i in self._indices]
+
+    def __len__(self) -> int:
+        return list.__len__(self) if self._is_stored else len(self._indices)
+
+    def __getitem__(self, index):
+        if self._is_stored:
+            return list.__getitem__(self, index)
+        if isinstance(index, slice):
+            return self._view(self._indices[index])
+        return self._element(self._indices[index])
+
+    def __iter__(self) -> Iterator["Element"]:
+        if self._is_stored:
+            yield from list.__iter__(self)
+            return
+        for i in self._indices:
+            yield self._element(i)
+
+    def __reversed__(self) -> Iterator["Element"]:
+        if self._is_stored:
+            yield from list.__reversed__(self)
+            return
+        for i in reversed(self._indices):
+            yield self._element(i)
+
+    def __contains__(self, item) -> bool:
+        webelement = item.webelement if isinstance(item, Element) else item
+        return any(handle == webelement for handle in self._webelements())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Elements):
+            return len(self) == len(other) and self._webelements() == other._webelements()
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __add__(self, other) -> List["Element"]:
+        # list.__add__ reads the other list's storage, which is empty until an Elements is stored
+        return list(self) + list(other)
+
+    def __radd__(self, other) -> List["Element"]:
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"<Elements locator={self.locator} length={len(self)}>"
+
+    __setitem__ = _stored(list.__setitem__)
+    __delitem__ = _stored(list.__delitem__)
+    __iadd__ = _stored(list.__iadd__)
+    __mul__ = _stored(list.__mul__)
+    __rmul__ = _stored(list.__rmul__)
+    __imul__ = _stored(list.__imul__)
+    append = _stored(list.append)
+    extend = _stored(list.extend)
+    insert = _stored(list.insert)
+    remove = _stored(list.remove)
+    pop = _stored(list.pop)
+    clear = _stored(list.clear)
+    index = _stored(list.index)
+    count = _stored(list.count)
+    copy = _stored(list.copy)
+    sort = _stored(list.sort)
+    reverse = _stored(list.reverse)
 
     def should(self, timeout: int = 0, ignored_exceptions: list = None) -> ElementsShould:
         """A collection of expectations for this list of elements.
@@ -637,7 +959,7 @@ class Elements(List["Element"]):
 
     def length(self) -> int:
         """The number of elements in the list."""
-        return len(self._list)
+        return len(self)
 
     def first(self) -> "Element":
         """Gets the first element in the list.
@@ -646,7 +968,7 @@ class Elements(List["Element"]):
             `IndexError` if the list is empty.
         """
         if self.length() > 0:
-            return self._list[0]
+            return self[0]
         raise IndexError("Cannot get first() from an empty list")
 
     def last(self) -> "Element":
@@ -656,9 +978,63 @@ class Elements(List["Element"]):
             `IndexError` if the list is empty.
         """
         if self.length() > 0:
-            return self._list[-1]
+            return self[-1]
         raise IndexError("Cannot get last() from an empty list")
 
+    def texts(self) -> List[str]:
+        """Gets the text of every element in the list with a single script.
+
+            * Like `Element.text()`, hidden elements have no text and non-breaking spaces are spaces
+            * The text is the element's `innerText` with every line trimmed, so whitespace can still differ from
+              the driver's own text rules in edge cases
+        """
+        log.command("Elements.texts() - Get the text of every element in this list")
+        return self._bulk_values("text")
+
+    def attributes(self, attribute: str) -> List:
+        """Gets the given attribute's value of every element in the list with a single script.
+
+            * The values are read with the same Selenium atom as `Element.get_attribute()`, so properties like
+              `href` and `value` are used when they exist
+            * If the value is 'true' or 'false', then it is a Boolean
+            * If the attribute does not exist on an element, then its value is None
+
+        Args:
+            attribute: The name of the attribute.
+        """
+        log.command("Elements.attributes() - Get the `%s` attribute value of every element in this list", attribute)
+        values = self._bulk_values("attribute", attribute)
+        return [True if value == "true" else False if value == "false" else value for value in values]
+
+    def properties(self, prop: str) -> List:
+        """Gets the given property's value of every element in the list with a single script.
+
+        Args:
+            prop: The name of the property.
+        """
+        log.command("Elements.properties() - Get the `%s` property value of every element in this list", prop)
+        return self._bulk_values("property", prop)
+
+    def css_values(self, property_name: str) -> List[str]:
+        """Gets the computed CSS Value of every element in the list with a single script.
+
+        Args:
+            property_name: The name of the CSS property, like `background-color`.
+        """
+        log.command("Elements.css_values() - Get the `%s` CSS Value of every element in this list", property_name)
+        return self._bulk_values("css", property_name)
+
+    def _bulk_values(self, kind: str, name: str = "") -> List:
+        webelements = self._webelements()
+        if not webelements:
+            return []
+        script = utils.read_script_from_file("element_text.js") + utils.read_script_from_file("bulk_values.js")
+        if kind == "attribute":
+            script = f"const getAttribute = {utils.read_selenium_atom('getAttribute.js')};\n{script}"
+        if not self._is_stored and self._frames is None and self._frame_path is not None:
+            self._py._enter_frame(self._frame_path)
+        return self._py.webdriver.execute_script(script, kind, name, webelements)
+
     # endregion
 
     # region CONDITIONS
@@ -669,7 +1045,7 @@ class Elements(List["Element"]):
 
     def are_checked(self) -> bool:
         """Check that all checkbox or radio buttons in this list are selected."""
-        for element in self._list:
+        for element in self:
             if not element.is_checked():
                 return False
         # every element is checked
@@ -690,7 +1066,7 @@ class Elements(List["Element"]):
             `ValueError` if any elements are not checkboxes or radio buttons.
         """
         log.command("Elements.check() - Check all checkboxes or radio buttons in this list")
-        for element in self._list:
+        for element in self:
             element.check(allow_selected)
         return self
 
@@ -705,7 +1081,7 @@ class Elements(List["Element"]):
             `ValueError` if any elements are not checkboxes or radio buttons.
         """
         log.command("Elements.uncheck() - Uncheck all checkboxes or radio buttons in this list")
-        for element in self._list:
+        for element in self:
             element.uncheck(allow_deselected)
         return self
 
@@ -713,20 +1089,115 @@ class Elements(List["Element"]):
 
 
 class Element:
-    """Element API: Represents a single DOM webelement and includes the commands to work with it."""
-
-    def __init__(self, py, web_element: WebElement, locator: Optional[Tuple]):
+    """Element API: Represents a single DOM webelement and includes the commands to work with it.
+
+    If the WebElement goes stale (ie the page re-rendered it), the Element finds itself again with its `locator`,
+    starting from its parent Element, and retries the command.
+
+    Every Element remembers the frame it was found in, and the driver switches back to that frame before the
+    Element is used, even if another Element or command switched it to a different frame in the meantime.
+
+    Elements are interned per session by WebElement id, so getting the same WebElement twice returns the same Element.
+    Elements are equal and hash by that id, so lists of them can be deduplicated and compared with sets.
+    """
+
+    __slots__ = ("_py", "_webelement", "_id", "_parent", "_index", "_frame_path", "locator", "__weakref__")
+
+    def __new__(cls, py=None, web_element: Optional[WebElement] = None, *args, **kwargs):
+        # Elements are interned per session, so the same WebElement is always the same Element
+        interned = _interned(py)
+        key = getattr(web_element, "id", None)
+        if interned is None or key is None:
+            return super().__new__(cls)
+        element = interned.get(key)
+        if element is None or type(element) is not cls:
+            element = super().__new__(cls)
+            interned[key] = element
+        return element
+
+    def __init__(
+        self,
+        py,
+        web_element: WebElement,
+        locator: Optional[Tuple],
+        parent: Optional["Element"] = None,
+        index: Optional[int] = None,
+        frame_path: Optional[Tuple[int, ...]] = None,
+    ):
+        if getattr(self, "_py", None) is not None:
+            # an interned Element: keep its WebElement, but learn how to find it again if it didn't know yet
+            if self.locator is None and locator is not None:
+                self._parent, self._index, self.locator = parent, index, locator
+            if self._frame_path is None:
+                self._frame_path = frame_path if frame_path is not None else getattr(py, "_frame_path", None)
+            return
         self._py = py
         self._webelement = (web_element,)
+        self._id = getattr(web_element, "id", None)
+        self._parent = parent
+        self._index = index
+        # by default, the element is in the frame the driver was in when it was found
+        self._frame_path = frame_path if frame_path is not None else getattr(py, "_frame_path", None)
         self.locator = locator
 
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Element):
+            return NotImplemented
+        if self._id is None or other._id is None:
+            return self is other
+        return self._id == other._id
+
+    def __hash__(self) -> int:
+        return object.__hash__(self) if self._id is None else hash(self._id)
+
     @property
     def webelement(self) -> WebElement:
-        """The current instance of the Selenium's `WebElement` API."""
+        """The current instance of the Selenium's `WebElement` API.
+
+        * The driver switches to the frame this element was found in first, unless it's already there.
+        """
+        if self._frame_path is not None:
+            self._py._enter_frame(self._frame_path)
         if isinstance(self._webelement, Tuple):
             return self._webelement[0]
         return self._webelement
 
+    @property
+    def frame_path(self) -> Optional[Tuple[int, ...]]:
+        """The path of frame indexes this element was found in. `()` is the main document.
+
+        None if the frame isn't known, like after `py.switch_to.frame()`, and then the driver doesn't switch frames.
+        """
+        return self._frame_path
+
+    def _recover(self) -> Optional[WebElement]:
+        """Find this element again with its locator after its WebElement went stale.
+
+        Returns:
+            The new WebElement, or None if this element has no locator or it can't be found anymore.
+        """
+        if self.locator is None:
+            return None
+        if self._frame_path is not None:
+            self._py._enter_frame(self._frame_path)
+        try:
+            root = self._parent.webelement if self._parent else self._py.webdriver
+            webelements = _find_elements(self._py, root, self.locator)
+        except StaleElementReferenceException:
+            if self._parent._recover() is None:
+                return None
+            webelements = _find_elements(self._py, self._parent.webelement, self.locator)
+        index = self._index or 0
+        if index >= len(webelements):
+            return None
+        self._webelement = (webelements[index],)
+        interned = _interned(self._py)
+        if interned is not None:
+            interned[self.webelement.id] = self
+        self._py.stats.stale_recoveries += 1
+        log.debug("Element - found stale element again with locator: %s", self.locator)
+        return self.webelement
+
     def should(self, timeout: int = 0, ignored_exceptions: list = None) -> ElementShould:
         """A collection of expectations for this element.
 
@@ -743,25 +1214,31 @@ class Element:
 
     # region METHODS
 
+    @_recover_stale
     def css_value(self, property_name: str):
         """EXPERIMENTAL: Gets the CSS Value of this element given the property's name."""
         log.command("Element.css_value() - Get a CSS Value given the property: `%s`", property_name)
         try:
             return self.webelement.value_of_css_property(property_name)
+        except StaleElementReferenceException:
+            raise
         except WebDriverException:
             log.warning("Property Name: `%s` is invalid or not found", property_name)
             return None
 
+    @_recover_stale
     def tag_name(self) -> str:
         """Gets the tag name of this element."""
         log.command("Element.tag_name() - Get the tag name of this element")
         return self.webelement.tag_name
 
+    @_recover_stale
     def text(self) -> str:
         """Gets the InnerText of this element."""
         log.command("Element.text() - Get the text of this element")
         return self.webelement.text
 
+    @_recover_stale
     def get_attribute(self, attribute: str):
         """Gets the given attribute's value.
 
@@ -783,6 +1260,7 @@ class Element:
             return False
         return value
 
+    @_recover_stale
     def get_property(self, prop: str):
         """Gets the property's value.
 
@@ -799,6 +1277,7 @@ class Element:
 
     # region CONDITIONS
 
+    @_recover_stale
     def is_checked(self) -> bool:
         """Check that this checkbox or radio button is selected.
 
@@ -812,6 +1291,7 @@ class Element:
         log.command("Element.is_checked() - Check if this checkbox or radio button element is selected")
         return self._py.webdriver.execute_script("return arguments[0].checked;", self.webelement)
 
+    @_recover_stale
     def is_displayed(self) -> bool:
         """Check that this element is displayed.
 
@@ -824,6 +1304,7 @@ class Element:
         log.command("Element.is_displayed() - Check if this element is displayed")
         return self.webelement.is_displayed()
 
+    @_recover_stale
     def is_enabled(self) -> bool:
         """Check that this element is enabled.
 
@@ -833,6 +1314,7 @@ class Element:
         log.command("Element.is_enabled() - Check if this element is enabled")
         return self.webelement.is_enabled()
 
+    @_recover_stale
     def is_selected(self) -> bool:
         """Check that this element is selected.
 
@@ -846,6 +1328,7 @@ class Element:
 
     # region ACTIONS
 
+    @_recover_stale
     def check(self, allow_selected=False) -> "Element":
         """Check this checkbox or radio button.
 
@@ -864,6 +1347,7 @@ class Element:
         if type_ == "checkbox" or type_ == "radio":
             checked = self._py.webdriver.execute_script("return arguments[0].checked;", self.webelement)
             if not checked:
+                actionability.wait(self._py, self.webelement, "check")
                 self.webelement.click()
                 return self
             if allow_selected:
@@ -871,6 +1355,7 @@ class Element:
             raise ValueError(f"{type_} is already selected")
         raise ValueError("Element is not a checkbox or radio button")
 
+    @_recover_stale
     def uncheck(self, allow_deselected=False) -> "Element":
         """Uncheck this checkbox or radio button.
 
@@ -889,6 +1374,7 @@ class Element:
         if type_ == "checkbox" or type_ == "radio":
             checked = self._py.webdriver.execute_script("return arguments[0].checked;", self.webelement)
             if checked:
+                actionability.wait(self._py, self.webelement, "check")
                 self.webelement.click()
                 return self
             if allow_deselected:
@@ -896,6 +1382,7 @@ class Element:
             raise ValueError(f"{type_} is already deselected")
         raise ValueError("Element is not a checkbox or radio button")
 
+    @_recover_stale
     def clear(self) -> "Element":
         """Clears the text of the input or textarea element.
 
@@ -908,11 +1395,15 @@ class Element:
         self.webelement.clear()
         return self
 
+    @_recover_stale
     def click(self, force=False):
         """Clicks the element.
 
+        Before a native click, wait until the element is visible, enabled, stable and not covered.
+
         Args:
-            force: If True, a JavascriptExecutor command is sent instead of Selenium's native `.click()`.
+            force: If True, a JavascriptExecutor command is sent instead of Selenium's native `.click()`,
+                without checking that the element is ready.
 
         Returns:
             The current instance of Pylenium
@@ -921,9 +1412,11 @@ class Element:
         if force:
             self._py.webdriver.execute_script("arguments[0].click()", self.webelement)
         else:
+            actionability.wait(self._py, self.webelement, "click")
             self.webelement.click()
         return self._py
 
+    @_recover_stale
     def deselect(self, value):
         """Deselects all `<option>` within a multi `<select>` element that match the given value.
 
@@ -945,6 +1438,7 @@ class Element:
             select.deselect_by_value(value)
         return self
 
+    @_recover_stale
     def double_click(self):
         """Double clicks the element.
 
@@ -952,9 +1446,11 @@ class Element:
             The current instance of Pylenium
         """
         log.command("Element.double_click() - Double click this element")
+        actionability.wait(self._py, self.webelement, "click")
         ActionChains(self._py.webdriver).double_click(self.webelement).perform()
         return self._py
 
+    @_recover_stale
     def drag_to(self, css: str) -> "Element":
         """Drag the current element to another element given its CSS selector.
 
@@ -970,10 +1466,13 @@ class Element:
         ```
         """
         log.command("Element.drag_to() - Drag this element to another element by CSS: `%s`", css)
+        from pylenium import jquery
+
         to_element = self._py.get(css).webelement
         jquery.drag_and_drop(self._py.webdriver, self.webelement, to_element)
         return self
 
+    @_recover_stale
     def drag_to_element(self, to_element: "Element") -> "Element":
         """Drag the current element to the given element.
 
@@ -990,9 +1489,12 @@ class Element:
         ```
         """
         log.command("Element.drag_to_element() - Drag this element to another element")
+        from pylenium import jquery
+
         jquery.drag_and_drop(self._py.webdriver, self.webelement, to_element.webelement)
         return self
 
+    @_recover_stale
     def focus(self) -> "Element":
         """Put focus on the element.
 
@@ -1004,6 +1506,7 @@ class Element:
         self._py.execute_script("arguments[0].focus();", self.webelement)
         return self
 
+    @_recover_stale
     def hover(self):
         """Hovers the element.
 
@@ -1011,9 +1514,11 @@ class Element:
             The current instance of Pylenium
         """
         log.command("Element.hover() - Hovers this element")
+        actionability.wait(self._py, self.webelement, "hover")
         ActionChains(self._py.webdriver).move_to_element(self.webelement).perform()
         return self._py
 
+    @_recover_stale
     def right_click(self):
         """Right clicks the element.
 
@@ -1021,9 +1526,11 @@ class Element:
             The current instance of Pylenium
         """
         log.command("Element.right_click() - Right click this element")
+        actionability.wait(self._py, self.webelement, "click")
         ActionChains(self._py.webdriver).context_click(self.webelement).perform()
         return self._py
 
+    @_recover_stale
     def select_by_index(self, index: int) -> "Element":
         """Select an `<option>` element within a `<select>` dropdown given its index.
 
@@ -1040,10 +1547,12 @@ class Element:
             The current element
         """
         log.command("Element.select_by_index() - Select an <option> element in the dropdown by index: %s", index)
+        actionability.wait(self._py, self.webelement, "select")
         dropdown = Select(self.webelement)
         dropdown.select_by_index(index)
         return self
 
+    @_recover_stale
     def select_by_text(self, text: str) -> "Element":
         """Selects all `<option>` elements within a `<select>` dropdown given the option's text.
 
@@ -1060,10 +1569,12 @@ class Element:
         log.command(
             "Element.select_by_text() - Select one or more <option> elements in the dropdown by text: `%s`", text
         )
+        actionability.wait(self._py, self.webelement, "select")
         dropdown = Select(self.webelement)
         dropdown.select_by_visible_text(text)
         return self
 
+    @_recover_stale
     def select_by_value(self, value) -> "Element":
         """Selects all `<option>` elements within a `<select>` dropdown given the option's value.
 
@@ -1080,10 +1591,12 @@ class Element:
         log.command(
             "Element.select_by_value() - Select one or more <option> elements in this dropdown by value: `%s`", value
         )
+        actionability.wait(self._py, self.webelement, "select")
         dropdown = Select(self.webelement)
         dropdown.select_by_value(value)
         return self
 
+    @_recover_stale
     def submit(self):
         """Submits the form.
 
@@ -1096,6 +1609,7 @@ class Element:
         self.webelement.submit()
         return self._py
 
+    @_recover_stale
     def type(self, *args) -> "Element":
         """Simulate a user typing keys into the input.
 
@@ -1103,9 +1617,11 @@ class Element:
             The current element
         """
         log.command("Element.type() - Type keys into this element")
+        actionability.wait(self._py, self.webelement, "type")
         self.webelement.send_keys(args)
         return self
 
+    @_recover_stale
     def upload(self, filepath: str) -> "Element":
         """A convenience method to upload a file to the element.
 
@@ -1144,6 +1660,7 @@ class Element:
 
     # region FIND ELEMENTS
 
+    @_recover_stale
     def contains(self, text: str, timeout: int = None) -> "Element":
         """Gets the DOM element containing the `text`.
 
@@ -1155,16 +1672,18 @@ class Element:
             The first element that is found, even if multiple elements match the query.
         """
         log.command("Element.contains() - Get the element that contains text: `%s`", text)
-        locator = (By.XPATH, f'.//*[contains(text(), "{text}")]')
+        locator = (By.XPATH, text_index.xpath(text))
 
+        message = f"Could not find element with the text: `{text}`"
         if timeout == 0:
-            element = self.webelement.find_element(*locator)
+            element = text_index.find(self._py.webdriver, text, self.webelement)
+            if element is None:
+                raise NoSuchElementException(message)
         else:
-            element = self._py.wait(timeout).until(
-                lambda _: self.webelement.find_element(*locator), f"Could not find element with the text: `{text}`"
-            )
-        return Element(self._py, element, locator)
+            element = self._py.wait(timeout).until(lambda x: text_index.find(x, text, self.webelement), message)
+        return Element(self._py, element, locator, self)
 
+    @_recover_stale
     def get(self, css: str, timeout: int = None) -> "Element":
         """Gets the DOM element that matches the `css` selector in this element's context.
 
@@ -1178,14 +1697,19 @@ class Element:
         log.command("Element.get() - Get the element with CSS: `%s`", css)
         by = By.CSS_SELECTOR
 
+        if shadow.is_piercing(css):
+            message = f"Could not find element with the CSS: `{css}`"
+            element = shadow.get(self._py, css, self.webelement, timeout=timeout, message=message)
+            return Element(self._py, element, locator=(shadow.BY, css), parent=self)
         if timeout == 0:
             element = self.webelement.find_element(by, css)
         else:
             element = self._py.wait(timeout).until(
                 lambda _: self.webelement.find_element(by, css), f"Could not find element with the CSS: `{css}`"
             )
-        return Element(self._py, element, locator=(by, css))
+        return Element(self._py, element, locator=(by, css), parent=self)
 
+    @_recover_stale
     def find(self, css: str, timeout: int = None) -> Elements:
         """Finds all DOM elements that match the `css` selector in this element's context.
 
@@ -1200,7 +1724,10 @@ class Element:
         by = By.CSS_SELECTOR
 
         try:
-            if timeout == 0:
+            if shadow.is_piercing(css):
+                by = shadow.BY
+                elements = shadow.find(self._py, css, self.webelement, timeout=timeout, message=f"Could not find any elements with CSS: `{css}`")
+            elif timeout == 0:
                 elements = self.webelement.find_elements(by, css)
             else:
                 elements = self._py.wait(timeout).until(
@@ -1208,8 +1735,9 @@ class Element:
                 )
         except TimeoutException:
             elements = []
-        return Elements(self._py, elements, locator=(by, css))
+        return Elements(self._py, elements, locator=(by, css), parent=self)
 
+    @_recover_stale
     def getx(self, xpath: str, timeout: int = None) -> "Element":
         """Finds the DOM element that matches the `xpath` selector.
 
@@ -1230,8 +1758,9 @@ class Element:
                 lambda _: self.webelement.find_element(by, xpath),
                 f"Could not find any elements with the xpath: `{xpath}`",
             )
-        return Element(self._py, elements, locator=(by, xpath))
+        return Element(self._py, elements, locator=(by, xpath), parent=self)
 
+    @_recover_stale
     def findx(self, xpath: str, timeout: int = None) -> "Elements":
         """Finds the DOM elements that matches the `xpath` selector.
 
@@ -1255,18 +1784,20 @@ class Element:
                 )
         except TimeoutException:
             elements = []
-        return Elements(self._py, elements, locator=(by, xpath))
+        return Elements(self._py, elements, locator=(by, xpath), parent=self)
 
     # endregion
 
     # region FAMILY
 
+    @_recover_stale
     def children(self) -> Elements:
         """Gets the Child elements."""
         log.command("Element.children() - Get the children of this element")
         elements = self._py.webdriver.execute_script("return arguments[0].children;", self.webelement)
         return Elements(self._py, elements, None)
 
+    @_recover_stale
     def parent(self) -> "Element":
         """Gets the Parent element."""
         log.command("Element.parent() - Get the parent of this element")
@@ -1277,6 +1808,7 @@ class Element:
         element = self._py.webdriver.execute_script(js, self.webelement)
         return Element(self._py, element, None)
 
+    @_recover_stale
     def siblings(self) -> Elements:
         """Gets the Sibling elements."""
         log.command("Element.siblings() - Get the siblings of this element")
@@ -1300,6 +1832,7 @@ class Element:
 
     # region UTILITIES
 
+    @_recover_stale
     def screenshot(self, filename) -> "Element":
         """Take a screenshot of the current element.
 
@@ -1315,6 +1848,7 @@ class Element:
         self.webelement.screenshot(filename)
         return self
 
+    @_recover_stale
     def scroll_into_view(self) -> "Element":
         """Scroll this element into view.
 
@@ -1324,6 +1858,7 @@ class Element:
         self._py.webdriver.execute_script("arguments[0].scrollIntoView(true);", self.webelement)
         return self
 
+    @_recover_stale
     def open_shadow_dom(self) -> "Element":
         """Open a Shadow DOM and return the Shadow Root element.
 
@@ -1342,6 +1877,7 @@ class Element:
         shadow_element = self._py.execute_script("return arguments[0].shadowRoot", self.webelement)
         return Element(self._py, shadow_element, locator=None)
 
+    @_recover_stale
     def highlight(self, effect_time=1, color="red", border=5) -> "Element":
         """Highlights (blinks) the element."""
 
@@ -0,0 +1,83 @@
+""" Find elements in the main document and every same-origin frame with a single script.
+
+Without this, finding an element that might be in any of several iframes means switching to each frame and
+searching it, which costs several round trips per frame. The script searches every frame at once, and only the
+frames that actually have matches are switched to.
+
+* Frames are identified by their path of indexes, like `(1, 0)` for the first frame inside the second frame.
+* Every Element is tagged with the `frame_path` it was found in, and the driver switches to that frame
+  automatically before it is used, so Elements from different frames can be mixed freely.
+* Commands that don't use `frames`, like `py.get()` without it, switch back to the frame they run in first, which
+  is the main document unless `py.switch_to` was used.
+* Cross-origin frames can't be searched by a script in the main document, so they are skipped.
+"""
+
+from typing import Optional
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from pylenium import utils
+from pylenium.element import Element, Elements
+
+FRAMES = ("all",)
+
+
+def check(frames: Optional[str]):
+    """Raise a ValueError if `frames` is not a supported value."""
+    if frames is not None and frames not in FRAMES:
+        raise ValueError(f"{frames} is not supported. `frames` must be one of: {FRAMES}")
+
+
+def search(py, css: str, first: bool):
+    """Run the search script from the main document."""
+    py._enter_frame(())
+    return py.webdriver.execute_script(utils.read_script_from_file("find_in_frames.js"), css, first)
+
+
+def get(py, css: str, timeout: float = None, message: str = "") -> Element:
+    """Get the first element that matches the CSS selector in the main document or any same-origin frame.
+
+    Raises:
+        `NoSuchElementException` if timeout is 0 and no element matches.
+        `TimeoutException` if no element matches within the timeout.
+    """
+    if timeout == 0:
+        found = search(py, css, True)
+        if found is None:
+            raise NoSuchElementException(message)
+    else:
+        found = py.wait(timeout).until(lambda _: search(py, css, True), message)
+
+    path = tuple(found["path"])
+    webelement = found["element"]
+    if path:
+        py._enter_frame(path)
+        webelement = py.webdriver.find_elements(By.CSS_SELECTOR, css)[found["index"]]
+    return Element(py, webelement, (By.CSS_SELECTOR, css), frame_path=path)
+
+
+def find(py, css: str, timeout: float = None, message: str = "") -> Elements:
+    """Find every element that matches the CSS selector in the main document and every same-origin frame.
+
+    Raises:
+        `TimeoutException` if no element matches within the timeout.
+    """
+    if timeout == 0:
+        found = search(py, css, False)
+    else:
+        found = py.wait(timeout).until(lambda _: _any(search(py, css, False)), message)
+
+    webelements = list(found["elements"])
+    frame_paths = [((), i) for i in range(len(webelements))]
+    for frame in found["frames"]:
+        path = tuple(frame["path"])
+        py._enter_frame(path)
+        for i, webelement in enumerate(py.webdriver.find_elements(By.CSS_SELECTOR, css)):
+            webelements.append(webelement)
+            frame_paths.append((path, i))
+    return Elements(py, webelements, (By.CSS_SELECTOR, css), frames=frame_paths)
+
+
+def _any(found):
+    return found if found["elements"] or found["frames"] else None
@@ -0,0 +1,55 @@
+""" Wait for the page to settle instead of sleeping for a fixed amount of time.
+
+* `py.wait_for_network_idle()` waits until no fetch or XHR requests (or at most `max_inflight`) have been in flight
+  for `idle_ms`. The requests are counted by wrapping `fetch` and `XMLHttpRequest` in the page.
+* `py.wait_for_dom_stable()` waits until a MutationObserver hasn't seen the DOM change for `quiet_ms`.
+
+On Chromium browsers, the request counter is added with CDP to every new document before the page's own scripts run,
+so requests made while the page loads are counted too. On other browsers, it's added to the current page by the
+first wait, and requests that were already in flight by then aren't counted.
+
+Selenium's `execute_cdp_cmd` can't subscribe to CDP `Network` events, so the counter is used on Chromium as well.
+"""
+
+from selenium.common.exceptions import TimeoutException
+
+from pylenium import observe, utils
+
+
+def install_network_counter(py):
+    """Add the request counter to every new document with CDP, once per session. Only on Chromium browsers."""
+    if py._network_counter or not hasattr(py.webdriver, "execute_cdp_cmd"):
+        return
+    source = utils.read_script_from_file("network_counter.js")
+    py.cdp.execute_command("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+    py._network_counter = True
+
+
+def wait_for_network_idle(py, idle_ms: int = 500, max_inflight: int = 0, timeout: float = None):
+    """Wait until at most `max_inflight` fetch/XHR requests have been in flight for `idle_ms` milliseconds.
+
+    Raises:
+        `TimeoutException` if the network wasn't idle within the timeout.
+    """
+    timeout = timeout or py.config.driver.wait_time
+    install_network_counter(py)
+    script = utils.read_script_from_file("network_counter.js") + utils.read_script_from_file("wait_for_network_idle.js")
+    with observe.recorded(py, "wait_for_network_idle", f"idle_ms={idle_ms}, max_inflight={max_inflight}") as record:
+        value = observe.execute_async(py, script, timeout, idle_ms, max_inflight, int(timeout * 1000))
+        record.timed_out = not value["idle"]
+    if record.timed_out:
+        raise TimeoutException(f"Network was not idle after {timeout} seconds: {value['inflight']} requests were still in flight")
+
+
+def wait_for_dom_stable(py, quiet_ms: int = 500, timeout: float = None):
+    """Wait until the DOM hasn't changed for `quiet_ms` milliseconds.
+
+    Raises:
+        `TimeoutException` if the DOM was still changing when the timeout was reached.
+    """
+    timeout = timeout or py.config.driver.wait_time
+    script = utils.read_script_from_file("wait_for_dom_stable.js")
+    with observe.recorded(py, "wait_for_dom_stable", f"quiet_ms={quiet_ms}") as record:
+        record.timed_out = not observe.execute_async(py, script, timeout, quiet_ms, int(timeout * 1000))
+    if record.timed_out:
+        raise TimeoutException(f"DOM was still changing after {timeout} seconds")
@@ -8,10 +8,26 @@ Log Levels:
     INFO     = 20, (default)
     COMMAND  = 15,
     DEBUG    = 10
+
+Handlers:
+    By default, records are rendered with `rich` in the thread that logs them. In pylenium.json, `"queue": true`
+    only puts records on a queue, and a background thread formats and renders them. `"format": "plain"` uses a
+    plain, fast formatter instead of `rich`, which is better suited for CI logs:
+
+    "logging": {
+        "queue": true,
+        "format": "plain"
+    }
 """
 
+import atexit
+import copy
 import logging
-from rich.logging import RichHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from pylenium import command_log
 
 
 COMMAND_LOG_LEVEL = 15
@@ -26,13 +42,107 @@ logging.COMMAND = COMMAND_LOG_LEVEL
 logging.addLevelName(USER_LOG_LEVEL, USER_LOG_LEVEL_NAME)
 logging.USER = USER_LOG_LEVEL_NAME
 
+
+class LazyRichHandler(logging.Handler):
+    """A RichHandler that only imports `rich` when the first record is emitted.
+
+    Importing `rich` is expensive, and many processes (like xdist workers or short CLI commands) never log anything.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__()
+        self._kwargs = kwargs
+        self._handler = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._handler is None:
+            from rich.logging import RichHandler
+
+            self._handler = RichHandler(**self._kwargs)
+        self._handler.emit(record)
+
+
+class _QueueHandler(QueueHandler):
+    """A QueueHandler that leaves the formatting to the QueueListener's handler.
+
+    The message is interpolated with its args before the record is queued, in case the args change later,
+    but the formatter (and rich) only run on the listener's thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+PLAIN_FORMAT = "%(asctime)s %(levelname)-8s %(message)s"
+FORMATS = ("rich", "plain")
+
 # Create logger
 logger = logging.getLogger("PYL")
 logger.setLevel(logging.INFO)
 
 # Configure logger
 # DATE_FORMAT = "%Y/%m/%d %H:%M:%S"
-logger.addHandler(RichHandler(rich_tracebacks=True, markup=True))
+_handler: logging.Handler = LazyRichHandler(rich_tracebacks=True, markup=True)
+logger.addHandler(_handler)
+
+# The handler above is the only one that `configure()` replaces, so handlers added by users are kept
+_settings = (False, "rich")
+_listener: Optional[QueueListener] = None
+
+
+def build_handler(format_: str) -> logging.Handler:
+    """Build the handler that renders the records: `rich` or `plain`."""
+    if format_ == "rich":
+        return LazyRichHandler(rich_tracebacks=True, markup=True)
+    if format_ == "plain":
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(PLAIN_FORMAT))
+        return handler
+    raise ValueError(f"{format_} is not a supported log format. Must be one of: {FORMATS}")
+
+
+def configure(use_queue: bool = False, format_: str = "rich") -> logging.Logger:
+    """Set up the handler that Pylenium adds to its logger. Nothing changes if it's already set up this way.
+
+    Only the handler that Pylenium added is replaced. Handlers added by users are kept.
+
+    Args:
+        use_queue: True to format and render the records on a background thread.
+        format_: `"rich"` or `"plain"`.
+
+    Returns:
+        The Pylenium logger.
+    """
+    global _settings, _listener, _handler
+    if (use_queue, format_) == _settings:
+        return logger
+    handler = build_handler(format_)
+    stop_queue()
+    logger.removeHandler(_handler)
+    if use_queue:
+        records = queue.SimpleQueue()
+        _listener = QueueListener(records, handler, respect_handler_level=True)
+        _listener.start()
+        _handler = _QueueHandler(records)
+    else:
+        _handler = handler
+    logger.addHandler(_handler)
+    _settings = (use_queue, format_)
+    return logger
+
+
+def stop_queue() -> None:
+    """Render the records still on the queue and stop the background thread, if there is one."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_queue)
 
 
 def command(self, message: str, *args, **kwargs) -> None:
@@ -46,6 +156,7 @@ def command(self, message: str, *args, **kwargs) -> None:
             log.command("py.visit() - Visit URL: %s", url)
             ...
     """
+    command_log.note(message, args)
     # Yes, logger takes its '*args' as 'args'.
     if self.isEnabledFor(COMMAND_LOG_LEVEL):
         self._log(COMMAND_LOG_LEVEL, message, args, **kwargs)
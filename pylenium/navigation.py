@@ -0,0 +1,91 @@
+""" Navigate without blocking on the driver's page load, and wait for a lifecycle state instead.
+
+`wait_until` is one of:
+
+* `"commit"` - the new document has started loading
+* `"domcontentloaded"` - the document was parsed (`readyState` is `interactive`)
+* `"load"` - the document and its resources finished loading (`readyState` is `complete`)
+* `"networkidle"` - after `load`, no fetch or XHR requests have been in flight for 500ms
+
+On Chromium browsers, `visit()` navigates with CDP `Page.navigate`, which returns once the navigation is committed.
+Selenium's `execute_cdp_cmd` can't subscribe to `Page.lifecycleEvent`, so the later states are read from the page.
+
+With the default `pageLoadStrategy` of `normal`, the driver itself blocks the next command until the page loads.
+To return earlier for `commit` or `domcontentloaded`, set `"pageLoadStrategy": "none"` in the driver's capabilities.
+"""
+
+from typing import Optional
+
+from selenium.common.exceptions import JavascriptException, WebDriverException
+
+from pylenium import idle, utils
+
+WAIT_UNTIL = ("commit", "domcontentloaded", "load", "networkidle")
+
+_READY_STATES = {
+    "commit": ("loading", "interactive", "complete"),
+    "domcontentloaded": ("interactive", "complete"),
+    "load": ("complete",),
+    "networkidle": ("complete",),
+}
+
+
+def check(wait_until: Optional[str]):
+    """Raise a ValueError if `wait_until` is not a supported lifecycle state."""
+    if wait_until is not None and wait_until not in WAIT_UNTIL:
+        raise ValueError(f"{wait_until} is not supported. `wait_until` must be one of: {WAIT_UNTIL}")
+
+
+def visit(py, url: str, wait_until: str):
+    """Navigate to the URL and wait until the new document reaches the lifecycle state."""
+    py._enter_frame(())
+    if wait_until == "networkidle":
+        idle.install_network_counter(py)  # count the requests made while the new document loads
+    if hasattr(py.webdriver, "execute_cdp_cmd"):
+        previous = py.webdriver.execute_script("window.__pyleniumNavigation = true; return location.href;")
+        response = py.cdp.execute_command("Page.navigate", {"url": url})
+        if response.get("errorText"):
+            raise WebDriverException(f"Could not navigate to {url}: {response['errorText']}")
+    else:
+        previous = py.webdriver.execute_script(
+            "window.__pyleniumNavigation = true; let previous = location.href; location.href = arguments[0]; return previous;", url
+        )
+    wait(py, wait_until, previous)
+
+
+def go(py, number: int, wait_until: str):
+    """Go `number` pages forward (or back if negative) in history and wait until the page reaches the lifecycle state."""
+    py._enter_frame(())
+    previous = py.webdriver.execute_script(
+        "window.__pyleniumNavigation = true; let previous = location.href; window.history.go(arguments[0]); return previous;", number
+    )
+    wait(py, wait_until, previous)
+
+
+def reload(py, wait_until: str):
+    """Reload the page and wait until the new document reaches the lifecycle state."""
+    py._enter_frame(())
+    py.webdriver.execute_script("window.__pyleniumNavigation = true; location.reload();")
+    wait(py, wait_until)
+
+
+def wait(py, wait_until: str, previous_url: Optional[str] = None):
+    """Wait until the navigation is committed and the document reaches the lifecycle state.
+
+    Args:
+        py: The instance of Pylenium.
+        wait_until: One of `WAIT_UNTIL`.
+        previous_url: The URL before a navigation that could stay in the same document. None if it can't.
+
+    Raises:
+        `TimeoutException` if the state wasn't reached within the page_load_wait_time (or wait_time if not set).
+    """
+    timeout = py.config.driver.page_load_wait_time or py.config.driver.wait_time
+    script = utils.read_script_from_file("navigation_state.js")
+    states = _READY_STATES[wait_until]
+    # scripts can fail while the old document unloads
+    py.wait(timeout, ignored_exceptions=[JavascriptException]).until(
+        lambda driver: driver.execute_script(script, previous_url) in states, f"Page did not reach `{wait_until}` within {timeout} seconds"
+    )
+    if wait_until == "networkidle":
+        idle.wait_for_network_idle(py, timeout=timeout)
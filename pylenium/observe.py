@@ -0,0 +1,191 @@
+""" Waits that run inside the page with a MutationObserver.
+
+Instead of polling `find_element` over HTTP until the element exists, a single `execute_async_script`
+resolves as soon as the DOM changes in a way that satisfies the condition. Enable it for
+`get`, `find`, `getx`, `findx`, `contains`, `Elements.should().have_length()` and the negative expectations
+`py.should().not_find()`, `not_findx()`, `not_contain()` and `Element.should().disappear()`, `be_hidden()`
+in pylenium.json:
+
+    "driver": {
+        "wait_mode": "observer"
+    }
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Callable, List, Optional, Union
+
+from selenium.common.exceptions import InvalidSelectorException, JavascriptException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+
+from pylenium import utils
+
+# The W3C default script timeout in seconds, if the session doesn't say
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+
+def is_enabled(py) -> bool:
+    """True if the config asks for observer waits instead of polling."""
+    return py.config.driver.wait_mode == "observer"
+
+
+def execute_async(py, script: str, timeout: float, *args):
+    """Execute an async script that can take up to `timeout` seconds.
+
+    The session's script timeout is only raised (with an extra round trip) when the wait could outlive it.
+    """
+    needed = timeout + 5
+    if needed > script_timeout(py):
+        py.webdriver.set_script_timeout(needed)
+        py._script_timeout = needed
+    return py.webdriver.execute_async_script(script, *args)
+
+
+def script_timeout(py) -> float:
+    """The session's script timeout in seconds.
+
+    It's read once per session: from the `timeouts` capability of the new session if it's there,
+    else from the driver. A timeout of None means scripts never time out.
+    """
+    if py._script_timeout is None:
+        timeouts = py.webdriver.capabilities.get("timeouts") if isinstance(py.webdriver.capabilities, dict) else None
+        if isinstance(timeouts, dict) and "script" in timeouts:
+            seconds = None if timeouts["script"] is None else timeouts["script"] / 1000
+        else:
+            seconds = py.webdriver.timeouts.script
+        try:
+            py._script_timeout = float("inf") if seconds is None else float(seconds)
+        except (TypeError, ValueError):
+            py._script_timeout = DEFAULT_SCRIPT_TIMEOUT
+    return py._script_timeout
+
+
+def across_navigations(timeout: float, record, run: Callable[[float], object]):
+    """Run an in-page wait, and run it again for the remaining time if a navigation unloads its document.
+
+    Args:
+        timeout: The number of seconds to wait.
+        record: The WaitRecord of the wait. Each run counts as a poll.
+        run: Runs the wait for the given number of seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return run(timeout)
+        except JavascriptException as e:
+            timeout = deadline - time.monotonic()
+            if not is_unloaded(e) or timeout <= 0:
+                raise
+            record.polls += 1
+            time.sleep(0.05)  # the old document may still be unloading
+
+
+def is_unloaded(error: Exception) -> bool:
+    """True if an async script was aborted because its document unloaded, ie during a navigation."""
+    return isinstance(error, JavascriptException) and "unloaded" in str(error.msg or "").lower()
+
+
+@contextmanager
+def recorded(py, condition: str, message: str = "", locator: Optional[str] = None):
+    """Record an in-page wait in `py.stats.waits`. It's a single poll, however long it takes."""
+    record = py.stats.record_wait(condition, message, locator)
+    record.polls = 1
+    start = time.monotonic()
+    try:
+        yield record
+    finally:
+        record.seconds = time.monotonic() - start
+
+
+def wait_for_selector(
+    py,
+    by: str,
+    selector: str,
+    timeout: Optional[float] = None,
+    root: Optional[WebElement] = None,
+    mode: str = "first",
+    length: int = 0,
+    message: str = "",
+) -> Union[WebElement, List[WebElement]]:
+    """Wait inside the page until the selector matches.
+
+    Args:
+        py: The instance of Pylenium.
+        by: `By.CSS_SELECTOR` or `By.XPATH`.
+        selector: The selector to match.
+        timeout: The number of seconds to wait. If None or 0, use the default wait_time.
+        root: The element to search within. If None, search the whole document.
+        mode: `"first"` for the first match, `"all"` for every match, or `"length"` to wait for exactly `length` matches.
+        length: The number of matches to wait for when `mode="length"`.
+        message: The message of the TimeoutException.
+
+    Returns:
+        The first matching WebElement, or the list of matching WebElements.
+
+    * If a navigation unloads the page, the wait runs again in the new page for the remaining time.
+
+    Raises:
+        `TimeoutException` if the selector didn't match within the timeout.
+        `InvalidSelectorException` if the selector is invalid.
+    """
+    timeout = timeout or py.config.driver.wait_time
+    script = utils.read_script_from_file("wait_for_selector.js")
+    with recorded(py, f"wait_for_selector.{mode}", message, f"{by}: {selector}") as record:
+        value = across_navigations(
+            timeout, record, lambda remaining: execute_async(py, script, remaining, by, selector, root, mode, length, int(remaining * 1000))
+        )
+        record.timed_out = value is None
+    if isinstance(value, dict) and "error" in value:
+        raise InvalidSelectorException(f"{value['error']} - selector: `{selector}`")
+    if value is None:
+        raise TimeoutException(message)
+    return value
+
+
+def wait_for_absence(
+    py,
+    mode: str,
+    timeout: Optional[float] = None,
+    by: Optional[str] = None,
+    selector: Optional[str] = None,
+    element: Optional[WebElement] = None,
+) -> bool:
+    """Wait inside the page until something is absent. If it's already absent, this returns after a single check.
+
+    Args:
+        py: The instance of Pylenium.
+        mode: `"selector"` until nothing matches `by` and `selector`, `"text"` until no element contains `selector`,
+            `"gone"` until the element is removed or not displayed, or `"hidden"` until it's in the DOM but not displayed.
+        timeout: The number of seconds to wait. If None or 0, use the default wait_time.
+        by: `By.CSS_SELECTOR` or `By.XPATH` for `mode="selector"`.
+        selector: The selector, or the text for `mode="text"`.
+        element: The element for the `"gone"` and `"hidden"` modes.
+
+    Returns:
+        True if it's absent, False if it was still there when the timeout was reached.
+
+    * If a navigation unloads the page, the element of `"gone"` is gone and the element of `"hidden"` is not hidden.
+      The `"selector"` and `"text"` waits run again in the new page for the remaining time.
+
+    Raises:
+        `InvalidSelectorException` if the selector is invalid.
+    """
+    timeout = timeout or py.config.driver.wait_time
+    script = utils.read_script_from_file("wait_for_absence.js")
+    locator = f"{by}: {selector}" if by else selector
+    with recorded(py, f"wait_for_absence.{mode}", locator=locator) as record:
+        if mode in ("gone", "hidden"):
+            try:
+                value = execute_async(py, script, timeout, mode, by, selector, element, int(timeout * 1000))
+            except JavascriptException as e:
+                if not is_unloaded(e):
+                    raise
+                value = mode == "gone"
+        else:
+            value = across_navigations(
+                timeout, record, lambda remaining: execute_async(py, script, remaining, mode, by, selector, element, int(remaining * 1000))
+            )
+        record.timed_out = value is False
+    if isinstance(value, dict) and "error" in value:
+        raise InvalidSelectorException(f"{value['error']} - selector: `{selector}`")
+    return value is True
@@ -0,0 +1,140 @@
+""" Polling strategies used by every wait in Pylenium.
+
+A fixed poll interval is a trade-off: short intervals hammer the browser during long waits,
+and long intervals make conditions that are true almost immediately still cost a full interval.
+The default strategy polls quickly at first and then backs off exponentially up to a cap.
+
+Configure it in pylenium.json:
+
+    "driver": {
+        "polling": {"strategy": "backoff", "initial": 0.05, "factor": 2.0, "maximum": 0.5}
+    }
+"""
+
+import itertools
+import time
+from typing import Callable, Iterator, Optional, Tuple, Type, Union
+
+from selenium.common.exceptions import TimeoutException
+
+from pylenium.config import PollingConfig
+from pylenium.stats import WaitRecord
+
+
+class PollingStrategy:
+    """The base class for polling strategies. A strategy yields how long to sleep between each poll."""
+
+    def intervals(self) -> Iterator[float]:
+        """A fresh iterator of sleep intervals (in seconds) for a single wait."""
+        raise NotImplementedError
+
+
+class FixedPolling(PollingStrategy):
+    """Sleep the same amount of time between every poll."""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+
+    def intervals(self) -> Iterator[float]:
+        return itertools.repeat(self.interval)
+
+
+class BackoffPolling(PollingStrategy):
+    """Poll quickly at first, then back off exponentially until the maximum interval is reached.
+
+    With the defaults, the intervals are: 0.05, 0.1, 0.2, 0.4, 0.5, 0.5, ...
+    """
+
+    def __init__(self, initial: float = 0.05, factor: float = 2.0, maximum: float = 0.5):
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+
+    def intervals(self) -> Iterator[float]:
+        interval = self.initial
+        while True:
+            yield min(interval, self.maximum)
+            interval *= self.factor
+
+
+def build_strategy(config: PollingConfig) -> PollingStrategy:
+    """Build the PollingStrategy from the polling settings in pylenium.json.
+
+    Args:
+        config: The polling settings.
+
+    Returns:
+        An instance of PollingStrategy.
+    """
+    if config.strategy == "backoff":
+        return BackoffPolling(config.initial, config.factor, config.maximum)
+    if config.strategy == "fixed":
+        return FixedPolling(config.maximum)
+    raise ValueError(f"{config.strategy} is not a supported polling strategy. Must be `backoff` or `fixed`.")
+
+
+def poll(
+    condition: Callable,
+    timeout: float,
+    strategy: PollingStrategy,
+    ignored_exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = (),
+    message: str = "",
+    negate: bool = False,
+    record: Optional[WaitRecord] = None,
+):
+    """Call the condition until it returns a truthy value (or a falsy value if `negate=True`).
+
+    Args:
+        condition: The function to call. It takes no arguments.
+        timeout: The max number of seconds to wait.
+        strategy: How long to sleep between polls.
+        ignored_exceptions: Exceptions that mean "not yet" instead of failing the wait.
+        message: The message of the TimeoutException.
+        negate: True to wait until the condition returns a falsy value or raises an ignored exception.
+        record: The record to fill in with the number of polls, the seconds it took and the exceptions it swallowed.
+
+    Returns:
+        The value returned by the condition. For `negate=True`, the falsy value or True if an ignored exception was raised.
+
+    Raises:
+        `TimeoutException` if the condition is not met within the timeout.
+    """
+    screen = None
+    stacktrace = None
+    intervals = strategy.intervals()
+    start_time = time.monotonic()
+    end_time = start_time + timeout
+    try:
+        while True:
+            if record is not None:
+                record.polls += 1
+            try:
+                value = condition()
+                if negate and not value:
+                    return value
+                if not negate and value:
+                    return value
+            except ignored_exceptions as exc:
+                if negate:
+                    return True
+                if record is not None:
+                    name = type(exc).__name__
+                    record.swallowed[name] = record.swallowed.get(name, 0) + 1
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(next(intervals), remaining))
+        if record is not None:
+            record.timed_out = True
+        raise TimeoutException(message, screen, stacktrace)
+    finally:
+        if record is not None:
+            record.seconds = time.monotonic() - start_time
+
+
+def describe(condition: Callable) -> str:
+    """A readable name for the condition of a wait, like `Pylenium.get.<lambda>` or `title_is`."""
+    name = getattr(condition, "__qualname__", None) or type(condition).__name__
+    return name.replace(".<locals>.", ".").replace("._predicate", "")
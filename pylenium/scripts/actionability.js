@@ -0,0 +1,126 @@
+/*
+ * Check that an element is ready for an action, like Cypress' actionability checks.
+ *
+ * The checks run once per animation frame, so `stable` compares the element's position across two frames.
+ * `receives_events` scrolls the element into view if needed and checks that the element (or one of its
+ * descendants) is the top element at its center point, so that a click isn't intercepted by an overlay.
+ * Resolves with {actionable: true}, or with {actionable: false, reason} once the timeout is reached.
+ *
+ * File inputs are usually hidden behind a styled button and `send_keys` works on them anyway, so only the
+ * `attached`, `enabled` and `editable` checks apply to an `<input type="file">`.
+ */
+(function(element, checks, timeout, callback) {
+    let deadline = Date.now() + timeout;
+
+    if (element.tagName === 'INPUT' && String(element.type).toLowerCase() === 'file') {
+        checks = checks.filter(function(name) {
+            return ['visible', 'stable', 'receives_events'].indexOf(name) === -1;
+        });
+    }
+
+    function nextFrame(fn) {
+        // requestAnimationFrame doesn't run in background tabs, so fall back to a timer
+        let called = false;
+        function once() {
+            if (!called) {
+                called = true;
+                fn();
+            }
+        }
+        requestAnimationFrame(once);
+        setTimeout(once, 50);
+    }
+
+    function describe(node) {
+        if (!node) {
+            return 'nothing';
+        }
+        let description = node.tagName ? node.tagName.toLowerCase() : node.nodeName;
+        if (node.id) {
+            description += '#' + node.id;
+        }
+        if (typeof node.className === 'string' && node.className.trim()) {
+            description += '.' + node.className.trim().split(/\s+/).join('.');
+        }
+        return '<' + description + '>';
+    }
+
+    function topElementAt(x, y) {
+        let node = document.elementFromPoint(x, y);
+        while (node && node.shadowRoot) {
+            let inner = node.shadowRoot.elementFromPoint(x, y);
+            if (!inner || inner === node) {
+                break;
+            }
+            node = inner;
+        }
+        return node;
+    }
+
+    function isElementOrDescendant(node) {
+        while (node) {
+            if (node === element) {
+                return true;
+            }
+            node = node.parentNode || node.host;
+        }
+        return false;
+    }
+
+    function isOutsideViewport(rect) {
+        let x = rect.left + rect.width / 2;
+        let y = rect.top + rect.height / 2;
+        return x < 0 || y < 0 || x > window.innerWidth || y > window.innerHeight;
+    }
+
+    function failure(previous, rect) {
+        if (!element.isConnected) {
+            return 'detached';
+        }
+        if (checks.indexOf('visible') !== -1) {
+            let style = window.getComputedStyle(element);
+            if (rect.width === 0 || rect.height === 0 || style.visibility === 'hidden' || style.display === 'none') {
+                return 'not visible';
+            }
+        }
+        if (checks.indexOf('enabled') !== -1) {
+            if (element.matches(':disabled') || element.getAttribute('aria-disabled') === 'true') {
+                return 'disabled';
+            }
+        }
+        if (checks.indexOf('editable') !== -1 && element.readOnly) {
+            return 'read-only';
+        }
+        if (checks.indexOf('stable') !== -1) {
+            if (previous.x !== rect.x || previous.y !== rect.y || previous.width !== rect.width || previous.height !== rect.height) {
+                return 'still moving';
+            }
+        }
+        if (checks.indexOf('receives_events') !== -1) {
+            let top = topElementAt(rect.left + rect.width / 2, rect.top + rect.height / 2);
+            if (!isElementOrDescendant(top)) {
+                return 'covered by ' + describe(top);
+            }
+        }
+        return null;
+    }
+
+    function check() {
+        if (element.isConnected && checks.indexOf('receives_events') !== -1 && isOutsideViewport(element.getBoundingClientRect())) {
+            element.scrollIntoView({block: 'center', inline: 'center'});
+        }
+        let previous = element.getBoundingClientRect();
+        nextFrame(function() {
+            let reason = failure(previous, element.getBoundingClientRect());
+            if (!reason) {
+                return callback({actionable: true});
+            }
+            if (reason === 'detached' || Date.now() >= deadline) {
+                return callback({actionable: false, reason: reason});
+            }
+            check();
+        });
+    }
+
+    check();
+})(arguments[0], arguments[1], arguments[2], arguments[arguments.length - 1]);
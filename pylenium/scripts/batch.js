@@ -0,0 +1,191 @@
+/*
+ * Run a sequence of recorded steps in a single script.
+ *
+ * Each step waits (up to its own timeout) for its element to exist, then runs. The script stops at the first
+ * failure and resolves with the results of the steps that ran and the index, kind and message of the error.
+ *
+ * If a step starts a navigation (`beforeunload` or `pagehide` fires), the script resolves right away with the index
+ * of the last step that ran in `navigated`, because the page unloading would abort it. The steps after it don't run.
+ * A script that starts in a document that is still unloading runs nothing and resolves with `navigated: -1`.
+ *
+ * The document counts as unloading for at most `timeout` after the event, because a download or a cancelled
+ * navigation fires `beforeunload` too and then the document stays.
+ */
+(function(steps, timeout, callback) {
+    const results = [];
+    let done = false;
+
+    if (window.__pyleniumBatchUnloading && Date.now() - window.__pyleniumBatchUnloading < timeout) {
+        return callback({results: results, error: null, navigated: -1});
+    }
+
+    function finish(value) {
+        if (done) {
+            return;
+        }
+        done = true;
+        window.removeEventListener('beforeunload', unloading, true);
+        window.removeEventListener('pagehide', unloading, true);
+        callback(value);
+    }
+
+    function unloading() {
+        window.__pyleniumBatchUnloading = Date.now();
+        finish({results: results, error: null, navigated: results.length - 1});
+    }
+
+    window.addEventListener('beforeunload', unloading, true);
+    window.addEventListener('pagehide', unloading, true);
+
+    function fail(index, kind, message) {
+        finish({results: results, error: {index: index, kind: kind, message: message}});
+    }
+
+    function setValue(el, value) {
+        let proto = Object.getPrototypeOf(el);
+        let descriptor = Object.getOwnPropertyDescriptor(proto, 'value');
+        // use the native setter so frameworks like React see the change
+        if (descriptor && descriptor.set) {
+            descriptor.set.call(el, value);
+        } else {
+            el.value = value;
+        }
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+
+    function isDisplayed(el) {
+        if (el.checkVisibility) {
+            return el.checkVisibility({visibilityProperty: true, opacityProperty: true});
+        }
+        return el.getClientRects().length > 0 && window.getComputedStyle(el).visibility !== 'hidden';
+    }
+
+    function clickable(el) {
+        // the actionability checks of Element.check() and Element.uncheck(), except `stable`
+        if (!isDisplayed(el)) {
+            return {kind: 'not_interactable', message: 'element is not visible'};
+        }
+        if (el.matches(':disabled')) {
+            return {kind: 'not_interactable', message: 'element is disabled'};
+        }
+        el.scrollIntoView({block: 'center', inline: 'center'});
+        let rect = el.getBoundingClientRect();
+        let top = document.elementFromPoint(rect.left + rect.width / 2, rect.top + rect.height / 2);
+        if (top !== el && !el.contains(top) && !(el.labels && Array.prototype.some.call(el.labels, function(l) { return l.contains(top); }))) {
+            return {kind: 'intercepted', message: 'element is covered by <' + (top ? top.tagName.toLowerCase() : 'nothing') + '>'};
+        }
+        return null;
+    }
+
+    function interactable(el) {
+        if (el.disabled) {
+            return 'element is disabled';
+        }
+        if (el.readOnly && (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA')) {
+            return 'element is read-only';
+        }
+        return null;
+    }
+
+    function run(step, el) {
+        let args = step.args || {};
+        switch (step.command) {
+            case 'get':
+                return el;
+            case 'text':
+                return elementText(el);
+            case 'click':
+                el.click();
+                return null;
+            case 'clear':
+            case 'type':
+                if (el.focus) {
+                    el.focus();
+                }
+                setValue(el, step.command === 'clear' || args.clear ? (args.text || '') : (el.value || '') + (args.text || ''));
+                return null;
+            case 'check':
+                if (el.type !== 'checkbox' && el.type !== 'radio') {
+                    throw {kind: 'invalid_argument', message: 'element is not a checkbox or radio button'};
+                }
+                if (el.checked !== args.checked) {
+                    el.click();
+                }
+                return null;
+            case 'select':
+                if (el.tagName !== 'SELECT') {
+                    throw {kind: 'invalid_argument', message: 'element is not a <select>'};
+                }
+                let options = Array.prototype.slice.call(el.options);
+                let option = options.find(function(o, i) {
+                    if ('index' in args) {
+                        return i === args.index;
+                    }
+                    if ('value' in args) {
+                        return o.value === args.value;
+                    }
+                    return o.text.trim() === args.text;
+                });
+                if (!option) {
+                    throw {kind: 'not_found', message: 'could not find <option> with ' + JSON.stringify(args)};
+                }
+                option.selected = true;
+                el.dispatchEvent(new Event('input', {bubbles: true}));
+                el.dispatchEvent(new Event('change', {bubbles: true}));
+                return null;
+            case 'dispatch':
+                el.dispatchEvent(new Event(args.event, {bubbles: true, cancelable: true}));
+                return null;
+        }
+        throw {kind: 'invalid_argument', message: 'unknown batch command: ' + step.command};
+    }
+
+    function next(index, deadline) {
+        if (done) {
+            return;
+        }
+        if (index >= steps.length) {
+            return finish({results: results, error: null, navigated: null});
+        }
+        deadline = deadline || Date.now() + timeout;
+        let step = steps[index];
+        let el;
+        try {
+            el = document.querySelector(step.css);
+        } catch (e) {
+            return fail(index, 'invalid_selector', e.message);
+        }
+        if (!el) {
+            if (Date.now() < deadline) {
+                return setTimeout(function() { next(index, deadline); }, 50);
+            }
+            return fail(index, 'not_found', 'could not find element with the CSS `' + step.css + '`');
+        }
+        if (step.command === 'check') {
+            let blocked = clickable(el);
+            if (blocked && Date.now() < deadline) {
+                return setTimeout(function() { next(index, deadline); }, 50);
+            }
+            if (blocked) {
+                return fail(index, blocked.kind, blocked.message);
+            }
+        }
+        let problem = step.command === 'type' || step.command === 'clear' || step.command === 'select' ? interactable(el) : null;
+        if (problem) {
+            return fail(index, 'not_interactable', problem);
+        }
+        try {
+            results.push(run(step, el));
+        } catch (e) {
+            return fail(index, e.kind || 'javascript', e.message || String(e));
+        }
+        if (step.command === 'get' || step.command === 'text') {
+            return next(index + 1);
+        }
+        // a navigation started by the step (ie submitting a form) begins in a later task
+        setTimeout(function() { next(index + 1); }, 0);
+    }
+
+    next(0);
+})(arguments[0], arguments[1], arguments[arguments.length - 1]);
@@ -0,0 +1,24 @@
+/*
+ * Read the same value from every element in a single script execution.
+ *
+ * kind is one of: "text", "attribute", "property" or "css".
+ *
+ * For "attribute", Selenium's getAttribute atom is added before this script as `getAttribute`, so the values are the
+ * same as WebElement.get_attribute(): properties like `href` and `value` win, and boolean attributes are "true" or null.
+ * For "text", element_text.js is added before this script as `elementText`.
+ */
+return (function(kind, name, elements) {
+    return elements.map(function(el) {
+        if (kind === 'text') {
+            return elementText(el);
+        }
+        if (kind === 'attribute') {
+            return getAttribute(el, name);
+        }
+        if (kind === 'property') {
+            let value = el[name];
+            return value === undefined ? null : value;
+        }
+        return window.getComputedStyle(el).getPropertyValue(name);
+    });
+})(arguments[0], arguments[1], arguments[2]);
@@ -0,0 +1,76 @@
+/*
+ * Check several conditions of an element in a single evaluation.
+ *
+ * Returns {name: [passed, actual]} for every condition that was given, so the caller can
+ * report exactly which conditions failed and what the actual values were.
+ * The text is read with `elementText` from element_text.js, which is added before this script.
+ */
+return (function(el, conditions) {
+    function isVisible() {
+        if (!el.isConnected) {
+            return false;
+        }
+        let style = window.getComputedStyle(el);
+        if (style.display === 'none' || style.visibility === 'hidden' || style.visibility === 'collapse' || style.opacity === '0') {
+            return false;
+        }
+        if (el.checkVisibility && !el.checkVisibility()) {
+            return false;
+        }
+        let rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    }
+
+    function isEnabled() {
+        return !el.matches(':disabled');
+    }
+
+    function isFocused() {
+        let active = document.activeElement;
+        while (active && active.shadowRoot && active.shadowRoot.activeElement) {
+            active = active.shadowRoot.activeElement;
+        }
+        return active === el;
+    }
+
+    function sameText(actual, expected, caseSensitive) {
+        return caseSensitive ? actual === expected : actual.trim().toLowerCase() === expected.toLowerCase();
+    }
+
+    function hasText(actual, expected, caseSensitive) {
+        return caseSensitive ? actual.indexOf(expected) !== -1 : actual.trim().toLowerCase().indexOf(expected.toLowerCase()) !== -1;
+    }
+
+    let caseSensitive = conditions.case_sensitive !== false;
+    let results = {};
+    let checks = {
+        visible: function(expected) { let actual = isVisible(); return [actual === expected, actual]; },
+        hidden: function(expected) { let actual = !isVisible(); return [actual === expected, actual]; },
+        clickable: function(expected) { let actual = isVisible() && isEnabled(); return [actual === expected, actual]; },
+        enabled: function(expected) { let actual = isEnabled(); return [actual === expected, actual]; },
+        disabled: function(expected) { let actual = !isEnabled(); return [actual === expected, actual]; },
+        checked: function(expected) { let actual = !!el.checked; return [actual === expected, actual]; },
+        selected: function(expected) { let actual = !!(el.checked || el.selected); return [actual === expected, actual]; },
+        focused: function(expected) { let actual = isFocused(); return [actual === expected, actual]; },
+        text: function(expected) { let actual = elementText(el); return [sameText(actual, expected, caseSensitive), actual]; },
+        contain_text: function(expected) { let actual = elementText(el); return [hasText(actual, expected, caseSensitive), actual]; },
+        value: function(expected) { let actual = el.value === undefined ? el.getAttribute('value') : String(el.value); return [actual === expected, actual]; },
+        class_name: function(expected) { let actual = el.getAttribute('class'); return [actual === expected, actual]; }
+    };
+
+    for (let name in checks) {
+        if (name in conditions) {
+            results[name] = checks[name](conditions[name]);
+        }
+    }
+    for (let attr in (conditions.attr || {})) {
+        let expected = conditions.attr[attr];
+        let actual = el.getAttribute(attr);
+        results['attr:' + attr] = [expected === null ? actual !== null : actual === expected, actual];
+    }
+    for (let prop in (conditions.prop || {})) {
+        let actual = el[prop];
+        results['prop:' + prop] = [actual === conditions.prop[prop], actual === undefined ? null : actual];
+    }
+    return results;
+})(arguments[0], arguments[1]);
@@ -9,9 +9,11 @@ import shutil
 import typer
 
 from pylenium.scripts import allure_reporting as allure_
+from pylenium.scripts import drivers as drivers_
 
 app = typer.Typer()
 app.add_typer(allure_.app, name="allure", help="Allure Reporting Commands")
+app.add_typer(drivers_.app, name="drivers", help="Driver Resolution Cache Commands")
 
 
 def _copy(file, to_dir, message) -> str:
@@ -23,26 +23,41 @@ import json
 import logging
 import shutil
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import allure
 import pytest
-import requests
-from faker import Faker
 
-from pylenium.a11y import PyleniumAxe
 from pylenium.config import PyleniumConfig, TestCase
 from pylenium.driver import Pylenium
+from pylenium.stats import RunStats
+
+if TYPE_CHECKING:
+    # only imported by the fixtures that use them so xdist workers start faster
+    from faker import Faker
+
+    from pylenium.a11y import PyleniumAxe
+    from pylenium.session_pool import PoolStats, SessionPool
+
+
+SESSION_POOL: "pytest.StashKey[SessionPool]" = pytest.StashKey()
+POOL_STATS: "pytest.StashKey[PoolStats]" = pytest.StashKey()
+STATS = pytest.StashKey[RunStats]()
 
 
 @pytest.fixture(scope="function")
-def fake() -> Faker:
+def fake() -> "Faker":
     """A basic instance of Faker to make test data."""
+    from faker import Faker
+
     return Faker()
 
 
 @pytest.fixture(scope="function")
 def api():
     """A basic instance of Requests to make HTTP API calls."""
+    import requests
+
     return requests
 
 
@@ -86,8 +101,7 @@ def test_results_dir(project_root: Path, request) -> Path:
     return test_results_dir
 
 
-@pytest.fixture(scope="session")
-def _load_pylenium_json(project_root, request) -> PyleniumConfig:
+def read_pylenium_json(project_root: Path, pytestconfig) -> PyleniumConfig:
     """Load the default pylenium.json file or the given pylenium.json config file (if specified).
 
     * Pylenium looks for these files from the Project Root!
@@ -108,7 +122,7 @@ def _load_pylenium_json(project_root, request) -> PyleniumConfig:
     $ pytest pylenium_json="configs/stage-pylenium.json"
     >>> Loads the config file: PROJECT_ROOT/configs/stage-pylenium.json
     """
-    custom_config_filepath = request.config.getoption("pylenium_json")
+    custom_config_filepath = pytestconfig.getoption("pylenium_json")
     config_filepath = project_root.joinpath(custom_config_filepath or "pylenium.json")
 
     try:
@@ -122,52 +136,57 @@ def _load_pylenium_json(project_root, request) -> PyleniumConfig:
     return config
 
 
-@pytest.fixture(scope="session")
-def _override_pylenium_config_values(_load_pylenium_json: PyleniumConfig, request) -> PyleniumConfig:
+def override_pylenium_config_values(config: PyleniumConfig, pytestconfig) -> PyleniumConfig:
     """Override any PyleniumConfig values after loading the initial pylenium.json config file.
 
     After a pylenium.json config file is loaded and converted to a PyleniumConfig object,
     then any CLI arguments override their respective key/values.
     """
-    config = _load_pylenium_json
     # Driver Settings
-    cli_remote_url = request.config.getoption("--remote_url")
+    cli_remote_url = pytestconfig.getoption("--remote_url")
     if cli_remote_url:
         config.driver.remote_url = cli_remote_url
 
-    cli_browser_options = request.config.getoption("--options")
+    cli_browser_options = pytestconfig.getoption("--options")
     if cli_browser_options:
         config.driver.options = [option.strip() for option in cli_browser_options.split(",")]
 
-    cli_browser = request.config.getoption("--browser")
+    cli_browser = pytestconfig.getoption("--browser")
     if cli_browser:
         config.driver.browser = cli_browser
 
-    cli_local_path = request.config.getoption("--local_path")
+    cli_local_path = pytestconfig.getoption("--local_path")
     if cli_local_path:
         config.driver.local_path = cli_local_path
 
-    cli_capabilities = request.config.getoption("--caps")
+    cli_capabilities = pytestconfig.getoption("--caps")
     if cli_capabilities:
         # --caps must be in '{"name": "value", "boolean": true}' format
         # with double quotes around each key. booleans are lowercase.
         config.driver.capabilities = json.loads(cli_capabilities)
 
-    cli_page_wait_time = request.config.getoption("--page_load_wait_time")
+    if pytestconfig.getoption("--session_pool"):
+        config.driver.session_pool = True
+
+    cli_prewarm = pytestconfig.getoption("--prewarm")
+    if cli_prewarm and cli_prewarm.isdigit():
+        config.driver.prewarm = int(cli_prewarm)
+
+    cli_page_wait_time = pytestconfig.getoption("--page_load_wait_time")
     if cli_page_wait_time and cli_page_wait_time.isdigit():
         config.driver.page_load_wait_time = int(cli_page_wait_time)
 
     # Logging Settings
-    cli_screenshots_on = request.config.getoption("--screenshots_on")
+    cli_screenshots_on = pytestconfig.getoption("--screenshots_on")
     if cli_screenshots_on:
         shots_on = cli_screenshots_on.lower() == "true"
         config.logging.screenshots_on = shots_on
 
-    cli_extensions = request.config.getoption("--extensions")
+    cli_extensions = pytestconfig.getoption("--extensions")
     if cli_extensions:
         config.driver.extension_paths = [ext.strip() for ext in cli_extensions.split(",")]
 
-    cli_log_level = request.config.getoption("--pylog_level")
+    cli_log_level = pytestconfig.getoption("--pylog_level")
     if cli_log_level:
         level = cli_log_level.upper()
         config.logging.pylog_level = level if level in ["DEBUG", "COMMAND", "INFO", "USER", "WARNING", "ERROR", "CRITICAL"] else "INFO"
@@ -175,6 +194,18 @@ def _override_pylenium_config_values(_load_pylenium_json: PyleniumConfig, reques
     return config
 
 
+@pytest.fixture(scope="session")
+def _load_pylenium_json(project_root, request) -> PyleniumConfig:
+    """Load the pylenium.json config file. See `read_pylenium_json()`."""
+    return read_pylenium_json(project_root, request.config)
+
+
+@pytest.fixture(scope="session")
+def _override_pylenium_config_values(_load_pylenium_json: PyleniumConfig, request) -> PyleniumConfig:
+    """Override the loaded PyleniumConfig with any CLI args. See `override_pylenium_config_values()`."""
+    return override_pylenium_config_values(_load_pylenium_json, request.config)
+
+
 @pytest.fixture(scope="function")
 def py_config(_override_pylenium_config_values) -> PyleniumConfig:
     """Get a fresh copy of the PyleniumConfig for each test
@@ -196,6 +227,30 @@ def pys_config(_override_pylenium_config_values) -> PyleniumConfig:
     return copy.deepcopy(_override_pylenium_config_values)
 
 
+@pytest.fixture(scope="session")
+def _session_pool(_override_pylenium_config_values: PyleniumConfig, request) -> Optional["SessionPool"]:
+    """The pool of warm WebDriver sessions that the `py` fixture borrows from.
+
+    * The pool is opt-in. Enable it with `"session_pool": true` in pylenium.json or with the `--session_pool` CLI arg.
+    * Pre-warming (`--prewarm N`) also uses the pool, but each pre-warmed session is only used once
+      unless the pool is enabled too.
+    * Each xdist worker gets its own pool.
+
+    Returns:
+        The SessionPool if enabled, else None.
+    """
+    pool = request.config.stash.get(SESSION_POOL, None)
+    if pool is None:
+        config = _override_pylenium_config_values
+        if not config.driver.session_pool:
+            return None
+        from pylenium.session_pool import SessionPool
+
+        pool = SessionPool(max_uses=config.driver.session_pool_max_uses)
+        request.config.stash[SESSION_POOL] = pool
+    return pool
+
+
 @pytest.fixture(scope="function")
 def test_case(test_results_dir: Path, request) -> TestCase:
     """Manages data pertaining to the currently running Test Function or Case.
@@ -214,34 +269,47 @@ def test_case(test_results_dir: Path, request) -> TestCase:
 
 
 @pytest.fixture(scope="function")
-def py(test_case: TestCase, py_config: PyleniumConfig, request):
+def py(test_case: TestCase, py_config: PyleniumConfig, _session_pool: Optional["SessionPool"], request):
     """Initialize a Pylenium driver for each test.
 
     Pass in this `py` fixture into the test function.
 
+    * If the Session Pool is enabled, the driver is borrowed from the pool and returned to it after the test.
+
     Examples:
         def test_go_to_google(py):
             py.visit('https://google.com')
             assert 'Google' in py.title()
     """
-    py = Pylenium(py_config)
+    py = Pylenium(py_config, driver_factory=_session_pool.acquire if _session_pool else None)
     yield py
+    report = getattr(request.node, "report", None)
     try:
-        if request.node.report.failed:
+        if report is not None and report.failed:
             # if the test failed, execute code in this block
+            py.command_log.write(test_case.file_path)
             if py_config.logging.screenshots_on:
                 screenshot = py.screenshot(str(test_case.file_path.joinpath("test_failed.png")))
                 allure.attach(screenshot, "test_failed.png", allure.attachment_type.PNG)
 
-        elif request.node.report.passed:
+        elif report is not None and report.passed:
             # if the test passed, execute code in this block
-            pass
+            py.command_log.clear()
         else:
             # if the test has another result (ie skipped, inconclusive), execute code in this block
             pass
     except Exception:
         logging.error("Failed to take screenshot on test failure.")
-    py.quit()
+    _collect_stats(request, py)
+    if _session_pool is None:
+        py.quit()
+    elif py._webdriver is not None:
+        _session_pool.release(py._webdriver, failed=report is None or report.failed)
+
+
+def _collect_stats(request, py: Pylenium):
+    """Add the stats of a test's driver to the totals and slowest waits of the Test Run."""
+    request.config.stash.setdefault(STATS, RunStats()).add(py.stats, request.node.nodeid)
 
 
 @pytest.fixture(scope="class")
@@ -262,6 +330,7 @@ def pyc(pyc_config: PyleniumConfig, request):
             pass
     except Exception:
         logging.error("Failed to take screenshot on test failure.")
+    _collect_stats(request, py)
     py.quit()
 
 
@@ -283,12 +352,15 @@ def pys(pys_config: PyleniumConfig, request):
             pass
     except Exception:
         logging.error("Failed to take screenshot on test failure.")
+    _collect_stats(request, py)
     py.quit()
 
 
 @pytest.fixture(scope="function")
-def axe(py) -> PyleniumAxe:
+def axe(py) -> "PyleniumAxe":
     """The aXe A11y audit tool as a fixture."""
+    from pylenium.a11y import PyleniumAxe
+
     return PyleniumAxe(py.webdriver)
 
 
@@ -302,6 +374,70 @@ def pytest_runtest_makereport(item, call):
     return report
 
 
+def pytest_sessionstart(session):
+    """Start pre-warming browser sessions in the background while pytest collects and runs the first tests.
+
+    * Only runs when `--prewarm N` (or `"prewarm": N` in pylenium.json) is greater than 0.
+    * With xdist, only the workers pre-warm sessions since the controller doesn't run any tests.
+    """
+    config = session.config
+    if config.getoption("dist", "no") != "no" and not hasattr(config, "workerinput"):
+        return
+    py_config = override_pylenium_config_values(read_pylenium_json(Path(__file__).absolute().parent, config), config)
+    if py_config.driver.prewarm < 1:
+        return
+    from pylenium.session_pool import SessionPool
+
+    max_uses = py_config.driver.session_pool_max_uses if py_config.driver.session_pool else 1
+    pool = SessionPool(max_uses=max_uses)
+    pool.prewarm(py_config, py_config.driver.prewarm)
+    config.stash[SESSION_POOL] = pool
+
+
+def pytest_sessionfinish(session):
+    """Close the Session Pool and send its stats to the xdist controller (if any)."""
+    pool = session.config.stash.get(SESSION_POOL, None)
+    if pool is not None:
+        pool.close()
+    if pool is not None and hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["pylenium_pool_stats"] = pool.stats.model_dump()
+    stats = session.config.stash.get(STATS, None)
+    if stats is not None and hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["pylenium_stats"] = stats.model_dump()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the Session Pool stats and the Pylenium stats of each xdist worker as it finishes."""
+    stats = getattr(node, "workeroutput", {}).get("pylenium_pool_stats")
+    if stats:
+        from pylenium import session_pool
+
+        total = node.config.stash.setdefault(POOL_STATS, session_pool.PoolStats())
+        total.merge(session_pool.PoolStats(**stats))
+    stats = getattr(node, "workeroutput", {}).get("pylenium_stats")
+    if stats:
+        node.config.stash.setdefault(STATS, RunStats()).merge(RunStats(**stats))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report the Session Pool hits, misses and reset time, and the waits that took the longest, at the end of the Test Run."""
+    pool = config.stash.get(SESSION_POOL, None)
+    stats = pool.stats if pool is not None else config.stash.get(POOL_STATS, None)
+    if stats is not None:
+        terminalreporter.write_sep("-", "pylenium session pool")
+        terminalreporter.write_line(stats.summary())
+    stats = config.stash.get(STATS, None)
+    if stats is not None and stats.kinds:
+        terminalreporter.write_sep("-", "pylenium top wasted wait seconds")
+        terminalreporter.write_line(stats.summary())
+        for condition in stats.top_kinds():
+            terminalreporter.write_line(f"{condition}: {stats.kinds[condition].summary()}")
+        terminalreporter.write_line("slowest waits:")
+        for wait in stats.top_waits():
+            terminalreporter.write_line(wait.summary())
+
+
 def pytest_addoption(parser):
     parser.addoption("--browser", action="store", default="", help="The lowercase browser name: chrome | firefox")
     parser.addoption("--local_path", action="store", default="", help="The filepath to the local driver")
@@ -334,4 +470,6 @@ def pytest_addoption(parser):
         default="",
         help="The amount of time to wait for a page load before raising an error. Default is 0.",
     )
+    parser.addoption("--session_pool", action="store_true", default=False, help="Reuse warm browser sessions between tests.")
+    parser.addoption("--prewarm", action="store", default="", help="The number of browser sessions to start in the background. Ex. 2")
     parser.addoption("--extensions", action="store", default="", help='Comma-separated list of extension paths. Ex. "*.crx, *.crx"')
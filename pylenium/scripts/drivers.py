@@ -0,0 +1,48 @@
+""" Driver resolution cache commands """
+from typing import List
+
+import typer
+
+from pylenium import driver_cache
+
+app = typer.Typer()
+
+
+@app.command()
+def prefetch(
+    browsers: List[str] = typer.Option(["chrome"], "--browser", "-b", help="Browser to resolve. Use multiple times for more browsers."),
+):
+    """Resolve drivers and browsers once with Selenium Manager and cache their paths.
+
+    Test runs then read the paths from the cache instead of asking Selenium Manager in every process.
+    """
+    try:
+        entries = driver_cache.prefetch(browsers)
+    except Exception as e:
+        typer.secho(f"😢 Unable to resolve drivers. {e}", fg=typer.colors.BRIGHT_RED)
+        raise typer.Exit(code=1)
+    for browser, entry in entries.items():
+        typer.secho(f"✅ {browser} driver: {entry['driver_path']}", fg=typer.colors.BRIGHT_GREEN)
+        if entry["browser_path"]:
+            typer.secho(f"   {browser} browser: {entry['browser_path']}", fg=typer.colors.BRIGHT_GREEN)
+    typer.secho(f"💾 Saved to {driver_cache.cache_file()}", fg=typer.colors.BRIGHT_CYAN)
+
+
+@app.command()
+def show():
+    """Show the cached driver and browser paths."""
+    entries = driver_cache.read()
+    if not entries:
+        typer.secho("The driver cache is empty. Run `pylenium drivers prefetch` to fill it.", fg=typer.colors.BRIGHT_YELLOW)
+        return
+    for browser, entry in entries.items():
+        typer.secho(f"{browser} driver: {entry['driver_path']} {entry.get('driver_version', '')}")
+        if entry.get("browser_path"):
+            typer.secho(f"{browser} browser: {entry['browser_path']} {entry.get('browser_version', '')}")
+
+
+@app.command()
+def clear():
+    """Delete the driver cache so Selenium Manager resolves drivers again."""
+    driver_cache.clear()
+    typer.secho("✅ Driver cache cleared", fg=typer.colors.BRIGHT_GREEN)
@@ -0,0 +1,13 @@
+/*
+ * The text of an element, like WebElement.text, for the scripts that read many texts at once.
+ *
+ * Added before check_conditions.js, bulk_values.js and batch.js, so they all read text the same way:
+ * hidden elements have no text, non-breaking spaces become spaces and every line is trimmed.
+ */
+function elementText(el) {
+    if (el.checkVisibility && !el.checkVisibility({visibilityProperty: true, opacityProperty: true})) {
+        return '';
+    }
+    let text = el.innerText === undefined ? el.textContent : el.innerText;
+    return text.replace(/\u00a0/g, ' ').split('\n').map(function(line) { return line.trim(); }).join('\n').trim();
+}
@@ -0,0 +1,49 @@
+/*
+ * Search the document and every same-origin frame for a CSS selector in a single script.
+ *
+ * Frames are identified by their path of indexes into `window.frames`, which is what switching to a frame
+ * by index uses. Cross-origin frames can't be searched from here and are skipped.
+ *
+ * With first=true, returns the first match as {path, index, element} (element is only set for the main document)
+ * or null. Otherwise, returns {elements, frames} with the matching elements of the main document and
+ * {path, count} for every frame that has matches.
+ */
+return (function(css, first) {
+    let result = {elements: [], frames: []};
+
+    function walk(win, path) {
+        let doc;
+        try {
+            doc = win.document;
+            doc.documentElement;
+        } catch (e) {
+            return null;  // cross-origin frame
+        }
+        if (!doc) {
+            return null;
+        }
+        if (first) {
+            let el = doc.querySelector(css);
+            if (el) {
+                return {path: path, index: 0, element: path.length ? null : el};
+            }
+        } else {
+            let matches = doc.querySelectorAll(css);
+            if (path.length === 0) {
+                result.elements = Array.prototype.slice.call(matches);
+            } else if (matches.length) {
+                result.frames.push({path: path, count: matches.length});
+            }
+        }
+        for (let i = 0; i < win.frames.length; i++) {
+            let found = walk(win.frames[i], path.concat([i]));
+            if (found) {
+                return found;
+            }
+        }
+        return null;
+    }
+
+    let found = walk(window, []);
+    return first ? found : result;
+})(arguments[0], arguments[1]);
@@ -0,0 +1,12 @@
+/*
+ * The readyState of the document after a navigation, or null if the navigation hasn't been committed yet.
+ *
+ * Before navigating, the old document is marked with `window.__pyleniumNavigation`. A new document doesn't have
+ * the mark. A same-document navigation (ie to a #hash or with the History API) keeps it, but changes the URL.
+ */
+return (function(previousUrl) {
+    if (window.__pyleniumNavigation && (previousUrl === null || location.href === previousUrl)) {
+        return null;
+    }
+    return document.readyState;
+})(arguments[0]);
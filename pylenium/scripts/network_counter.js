@@ -0,0 +1,53 @@
+/*
+ * Count the fetch and XHR requests in flight, in `window.__pyleniumNetwork`.
+ *
+ * `inflight` is the number of requests that haven't finished yet, and `changed` is when it last changed.
+ * Installing it twice is a no-op, so it can run on every new document and again before each wait.
+ */
+(function() {
+    if (window.__pyleniumNetwork) {
+        return;
+    }
+    let state = window.__pyleniumNetwork = {inflight: 0, changed: performance.now()};
+
+    function start() {
+        state.inflight++;
+        state.changed = performance.now();
+    }
+
+    function finish() {
+        state.inflight = Math.max(0, state.inflight - 1);
+        state.changed = performance.now();
+    }
+
+    if (window.fetch) {
+        let fetch = window.fetch;
+        window.fetch = function() {
+            start();
+            let request;
+            try {
+                request = fetch.apply(this, arguments);
+            } catch (e) {
+                finish();
+                throw e;
+            }
+            request.then(finish, finish);
+            return request;
+        };
+    }
+
+    if (window.XMLHttpRequest) {
+        let send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function() {
+            start();
+            this.addEventListener('loadend', finish, {once: true});
+            try {
+                return send.apply(this, arguments);
+            } catch (e) {
+                this.removeEventListener('loadend', finish);
+                finish();
+                throw e;
+            }
+        };
+    }
+})();
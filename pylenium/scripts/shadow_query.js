@@ -0,0 +1,96 @@
+/*
+ * Resolve a piercing selector, like `app-shell >>> nav-menu >>> button`, in a single script.
+ *
+ * Each `>>>` steps into the open shadow roots of the elements matched so far, and the next part is queried there.
+ * With `watch`, it waits until the selector matches: a MutationObserver watches the document and every shadow root,
+ * and `attachShadow` is wrapped so that shadow roots attached later are watched too.
+ * Resolves with the first match or all matches, null (or []) if nothing matched in time, or {error}.
+ */
+(function(css, root, first, watch, timeout, callback) {
+    let parts = css.split('>>>').map(function(part) { return part.trim(); });
+    if (parts.some(function(part) { return !part; })) {
+        return callback({error: 'every part of a piercing selector must be a CSS selector'});
+    }
+
+    function query() {
+        let scopes = [root || document];
+        for (let i = 0; i < parts.length; i++) {
+            let matches = [];
+            scopes.forEach(function(scope) {
+                scope.querySelectorAll(parts[i]).forEach(function(node) {
+                    if (matches.indexOf(node) === -1) {
+                        matches.push(node);
+                    }
+                });
+            });
+            if (i === parts.length - 1) {
+                return matches;
+            }
+            scopes = matches.map(function(node) { return node.shadowRoot; }).filter(Boolean);
+        }
+    }
+
+    function check() {
+        let matches = query();
+        if (matches.length === 0) {
+            return null;
+        }
+        return first ? matches[0] : matches;
+    }
+
+    let observers = [];
+    let original = Element.prototype.attachShadow;
+    let patched = null;
+    let timer = null;
+    let done = false;
+
+    function finish(value) {
+        if (done) {
+            return;
+        }
+        done = true;
+        observers.forEach(function(observer) { observer.disconnect(); });
+        if (patched && Element.prototype.attachShadow === patched) {
+            Element.prototype.attachShadow = original;
+        }
+        clearTimeout(timer);
+        callback(value);
+    }
+
+    function recheck() {
+        let found = check();
+        if (found) {
+            finish(found);
+        }
+    }
+
+    function observe(node) {
+        let observer = new MutationObserver(recheck);
+        observer.observe(node, {childList: true, subtree: true, attributes: true});
+        observers.push(observer);
+        node.querySelectorAll('*').forEach(function(child) {
+            if (child.shadowRoot) {
+                observe(child.shadowRoot);
+            }
+        });
+    }
+
+    try {
+        let found = check();
+        if (found || !watch) {
+            return finish(found || (first ? null : []));
+        }
+    } catch (e) {
+        return finish({error: e.message});
+    }
+
+    observe(root || document.documentElement);
+    patched = function() {
+        let shadowRoot = original.apply(this, arguments);
+        observe(shadowRoot);
+        setTimeout(recheck, 0);
+        return shadowRoot;
+    };
+    Element.prototype.attachShadow = patched;
+    timer = setTimeout(function() { finish(first ? null : []); }, timeout);
+})(arguments[0], arguments[1], arguments[2], arguments[3], arguments[4], arguments[arguments.length - 1]);
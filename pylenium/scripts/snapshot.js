@@ -0,0 +1,25 @@
+/*
+ * Take a snapshot of the DOM, or check how many times the DOM has changed since the first snapshot.
+ *
+ * A MutationObserver counts every change to the DOM. A snapshot records the count when it was taken,
+ * so it is stale once the count is different. The count is -1 if the page was reloaded or navigated away.
+ */
+return (function(capture) {
+    let observer = window.__pyleniumSnapshotObserver;
+    if (!observer) {
+        if (!capture) {
+            return {version: -1};
+        }
+        window.__pyleniumMutations = 0;
+        observer = window.__pyleniumSnapshotObserver = new MutationObserver(function(records) {
+            window.__pyleniumMutations += records.length;
+        });
+        observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    }
+    // count changes that the observer hasn't been told about yet
+    window.__pyleniumMutations += observer.takeRecords().length;
+    if (!capture) {
+        return {version: window.__pyleniumMutations};
+    }
+    return {html: document.documentElement.outerHTML, url: window.location.href, version: window.__pyleniumMutations};
+})(arguments[0]);
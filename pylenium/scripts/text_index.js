@@ -0,0 +1,111 @@
+/*
+ * Find the first element that contains the given text, using an index of the page's text.
+ *
+ * The index maps each element to the normalized text of its own text nodes and is built once with a TreeWalker.
+ * A MutationObserver marks it dirty whenever the DOM changes, so it is only rebuilt when needed.
+ * Lookups are cached by text until the index is dirty, so repeated lookups are a hash lookup.
+ *
+ * If no element's own text contains the text (ie the text is split across nested elements),
+ * the deepest element whose full text contains it is used instead.
+ *
+ * Text inside SCRIPT, STYLE, NOSCRIPT and TEMPLATE elements is never matched, so a string that only exists in
+ * an inline script or JSON blob doesn't match until it is rendered.
+ */
+return (function(text, root) {
+    const SKIP = {SCRIPT: true, STYLE: true, NOSCRIPT: true, TEMPLATE: true};
+
+    function normalize(value) {
+        return value.replace(/\s+/g, ' ').trim();
+    }
+
+    function isRendered(node) {
+        let parent = node.parentElement;
+        return !!parent && !SKIP[parent.tagName];
+    }
+
+    function renderedText(el) {
+        // like textContent, without the text of SCRIPT, STYLE, NOSCRIPT and TEMPLATE elements
+        let value = '';
+        let walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT, {
+            acceptNode: function(node) {
+                return isRendered(node) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_REJECT;
+            }
+        });
+        while (walker.nextNode()) {
+            value += walker.currentNode.data;
+        }
+        return normalize(value);
+    }
+
+    let index = window.__pyleniumTextIndex;
+    if (!index || index.document !== document) {
+        index = window.__pyleniumTextIndex = {document: document, dirty: true, elements: [], texts: [], lookups: new Map()};
+        new MutationObserver(function() {
+            index.dirty = true;
+        }).observe(document, {childList: true, subtree: true, characterData: true});
+    }
+
+    if (index.dirty) {
+        let owners = new Map();
+        let walker = document.createTreeWalker(document, NodeFilter.SHOW_TEXT, {
+            acceptNode: function(node) {
+                return isRendered(node) && node.data.trim() ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_REJECT;
+            }
+        });
+        while (walker.nextNode()) {
+            let node = walker.currentNode;
+            let owner = node.parentElement;
+            owners.set(owner, (owners.get(owner) || '') + ' ' + node.data);
+        }
+        index.elements = [];
+        index.texts = [];
+        owners.forEach(function(value, owner) {
+            index.elements.push(owner);
+            index.texts.push(normalize(value));
+        });
+        index.lookups.clear();
+        index.dirty = false;
+    }
+
+    let needle = normalize(text);
+    let scope = root || null;
+    if (!scope && index.lookups.has(needle)) {
+        let cached = index.lookups.get(needle);
+        if (cached === null || cached.isConnected) {
+            return cached;
+        }
+    }
+
+    let found = null;
+    for (let i = 0; i < index.elements.length; i++) {
+        let el = index.elements[i];
+        if (index.texts[i].indexOf(needle) !== -1 && (!scope || (el !== scope && scope.contains(el)))) {
+            found = el;
+            break;
+        }
+    }
+
+    if (!found) {
+        // the text is split across nested elements: find the deepest element whose text contains it
+        let el = scope || document.body || document.documentElement;
+        if (el && renderedText(el).indexOf(needle) !== -1) {
+            let deeper = true;
+            while (deeper) {
+                deeper = false;
+                for (let child = el.firstElementChild; child; child = child.nextElementSibling) {
+                    if (!SKIP[child.tagName] && renderedText(child).indexOf(needle) !== -1) {
+                        el = child;
+                        deeper = true;
+                        break;
+                    }
+                }
+            }
+            found = el === scope ? null : el;
+        }
+    }
+
+    if (!scope) {
+        index.lookups.set(needle, found);
+    }
+    return found;
+})(arguments[0], arguments[1]);
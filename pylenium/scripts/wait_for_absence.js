@@ -0,0 +1,112 @@
+/*
+ * Wait inside the page until something is absent, instead of polling find_element over HTTP until it fails.
+ *
+ * Modes:
+ *   selector - no element matches the CSS or XPath selector
+ *   text     - no element contains the text (whitespace is normalized, like text_index.js)
+ *   gone     - the element was removed from the DOM or isn't displayed
+ *   hidden   - the element is still in the DOM but isn't displayed
+ *
+ * Checks immediately, then re-checks (once per burst of changes) whenever the DOM changes or a transition or animation ends.
+ * Resolves with true once absent, false when the timeout is reached, or {error} if the selector is invalid.
+ */
+(function(mode, by, selector, element, timeout, callback) {
+    const SKIP = {SCRIPT: true, STYLE: true, NOSCRIPT: true, TEMPLATE: true};
+
+    function normalize(value) {
+        return value.replace(/\s+/g, ' ').trim();
+    }
+
+    function isDisplayed(node) {
+        if (node.checkVisibility) {
+            return node.checkVisibility({visibilityProperty: true, opacityProperty: true});
+        }
+        return node.getClientRects().length > 0 && window.getComputedStyle(node).visibility !== 'hidden';
+    }
+
+    function hasText() {
+        // like text_index.js, text inside SCRIPT, STYLE, NOSCRIPT and TEMPLATE elements is never rendered
+        let needle = normalize(selector);
+        let owners = new Map();
+        let rendered = '';
+        let walker = document.createTreeWalker(document, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            let node = walker.currentNode;
+            let owner = node.parentElement;
+            if (owner && !SKIP[owner.tagName]) {
+                owners.set(owner, (owners.get(owner) || '') + ' ' + node.data);
+                rendered += node.data;
+            }
+        }
+        for (let text of owners.values()) {
+            if (normalize(text).indexOf(needle) !== -1) {
+                return true;
+            }
+        }
+        // the text can be split across nested elements
+        return normalize(rendered).indexOf(needle) !== -1;
+    }
+
+    function isAbsent() {
+        if (mode === 'selector') {
+            if (by === 'xpath') {
+                return document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue === null;
+            }
+            return document.querySelector(selector) === null;
+        }
+        if (mode === 'text') {
+            return !hasText();
+        }
+        if (mode === 'gone') {
+            return !element.isConnected || !isDisplayed(element);
+        }
+        return element.isConnected && !isDisplayed(element);
+    }
+
+    let observer = null;
+    let timer = null;
+    let scheduled = false;
+    let done = false;
+
+    function recheck() {
+        // a burst of mutations is checked once
+        if (scheduled) {
+            return;
+        }
+        scheduled = true;
+        setTimeout(function() {
+            scheduled = false;
+            if (!done && isAbsent()) {
+                finish(true);
+            }
+        }, 0);
+    }
+
+    function finish(value) {
+        if (done) {
+            return;
+        }
+        done = true;
+        if (observer) {
+            observer.disconnect();
+        }
+        document.removeEventListener('transitionend', recheck, true);
+        document.removeEventListener('animationend', recheck, true);
+        clearTimeout(timer);
+        callback(value);
+    }
+
+    try {
+        if (isAbsent()) {
+            return finish(true);
+        }
+    } catch (e) {
+        return finish({error: e.message});
+    }
+
+    observer = new MutationObserver(recheck);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    document.addEventListener('transitionend', recheck, true);
+    document.addEventListener('animationend', recheck, true);
+    timer = setTimeout(function() { finish(false); }, timeout);
+})(arguments[0], arguments[1], arguments[2], arguments[3], arguments[4], arguments[arguments.length - 1]);
@@ -0,0 +1,26 @@
+/*
+ * Wait until the DOM hasn't changed for `quietMs`, with a MutationObserver.
+ *
+ * Resolves with true once the DOM is quiet, or false if it was still changing when the timeout was reached.
+ */
+(function(quietMs, timeout, callback) {
+    let quietTimer = null;
+    let timer = null;
+
+    function finish(value) {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(timer);
+        callback(value);
+    }
+
+    function restart() {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(function() { finish(true); }, quietMs);
+    }
+
+    let observer = new MutationObserver(restart);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    timer = setTimeout(function() { finish(false); }, timeout);
+    restart();
+})(arguments[0], arguments[1], arguments[arguments.length - 1]);
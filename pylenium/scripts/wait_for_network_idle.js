@@ -0,0 +1,25 @@
+/*
+ * Wait until at most `maxInflight` fetch/XHR requests have been in flight for `idleMs`.
+ *
+ * Runs after network_counter.js, which counts the requests. The quiet period starts no earlier than this wait,
+ * so a request that is about to start (ie right after a click) still has `idleMs` to do so.
+ * Resolves with {idle: true}, or with {idle: false, inflight} when the timeout is reached.
+ */
+(function(idleMs, maxInflight, timeout, callback) {
+    let state = window.__pyleniumNetwork;
+    let start = performance.now();
+
+    function check() {
+        let now = performance.now();
+        let quietSince = Math.max(start, state.changed);
+        if (state.inflight <= maxInflight && now - quietSince >= idleMs) {
+            return callback({idle: true});
+        }
+        if (now - start >= timeout) {
+            return callback({idle: false, inflight: state.inflight});
+        }
+        setTimeout(check, Math.min(50, idleMs));
+    }
+
+    check();
+})(arguments[0], arguments[1], arguments[2], arguments[arguments.length - 1]);
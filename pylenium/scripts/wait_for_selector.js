@@ -0,0 +1,76 @@
+/*
+ * Wait inside the page until a selector matches, instead of polling find_element over HTTP.
+ *
+ * Checks immediately, then re-checks whenever a MutationObserver sees the DOM change.
+ * Resolves with the first match, all matches, or all matches once there are exactly `length` of them.
+ * Resolves with null when the timeout is reached, or with {error} if the selector is invalid.
+ */
+(function(by, selector, root, mode, length, timeout, callback) {
+    root = root || document;
+
+    function query() {
+        if (by === 'xpath') {
+            let result = document.evaluate(selector, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            let nodes = [];
+            for (let i = 0; i < result.snapshotLength; i++) {
+                nodes.push(result.snapshotItem(i));
+            }
+            return nodes;
+        }
+        if (mode === 'first') {
+            let node = root.querySelector(selector);
+            return node ? [node] : [];
+        }
+        return Array.prototype.slice.call(root.querySelectorAll(selector));
+    }
+
+    function check() {
+        let nodes = query();
+        if (mode === 'length') {
+            return nodes.length === length ? nodes : null;
+        }
+        if (nodes.length === 0) {
+            return null;
+        }
+        return mode === 'first' ? nodes[0] : nodes;
+    }
+
+    let observer = null;
+    let timer = null;
+    let done = false;
+
+    function finish(value) {
+        if (done) {
+            return;
+        }
+        done = true;
+        if (observer) {
+            observer.disconnect();
+        }
+        clearTimeout(timer);
+        callback(value);
+    }
+
+    try {
+        let found = check();
+        if (found) {
+            return finish(found);
+        }
+    } catch (e) {
+        return finish({error: e.message});
+    }
+
+    observer = new MutationObserver(function() {
+        let found = check();
+        if (found) {
+            finish(found);
+        }
+    });
+    observer.observe(root === document ? document.documentElement : root, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true
+    });
+    timer = setTimeout(function() { finish(null); }, timeout);
+})(arguments[0], arguments[1], arguments[2], arguments[3], arguments[4], arguments[5], arguments[arguments.length - 1]);
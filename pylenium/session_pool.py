@@ -0,0 +1,297 @@
+""" Pool of warm WebDriver sessions that can be reused across tests.
+
+Launching a browser is usually the most expensive part of a UI test. When the pool is enabled,
+the `py` fixture borrows an already-running session instead of building a new one, and the session is
+reset and returned to the pool when the test is done.
+
+* Sessions are keyed by the effective driver and viewport settings, so tests never get a session
+  that was built with different options, capabilities or browser.
+* Sessions are recycled (quit) after `max_uses` tests, when the test using them fails, or when they can't be reset
+  (ie the test already quit the session).
+* Sessions can be pre-warmed on background threads so browser startup overlaps with collection and other tests.
+* Each pytest-xdist worker is its own process, so each worker has its own pool.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pylenium import webdriver_factory
+from pylenium.config import PyleniumConfig
+from pylenium.log import logger as log
+
+# The W3C timeouts of a new session in milliseconds, unless the capabilities say otherwise
+DEFAULT_TIMEOUTS = {"implicit": 0, "pageLoad": 300000, "script": 30000}
+
+
+class PoolStats(BaseModel):
+    """How well the Session Pool is doing."""
+
+    hits: int = 0
+    misses: int = 0
+    prewarmed: int = 0
+    recycled: int = 0
+    resets: int = 0
+    reset_time: float = 0.0
+
+    def merge(self, other: "PoolStats") -> "PoolStats":
+        """Add the values of another PoolStats (ie from another xdist worker) to this one."""
+        self.hits += other.hits
+        self.misses += other.misses
+        self.prewarmed += other.prewarmed
+        self.recycled += other.recycled
+        self.resets += other.resets
+        self.reset_time += other.reset_time
+        return self
+
+    def summary(self) -> str:
+        """A single line summary of these stats."""
+        average_reset = self.reset_time / self.resets if self.resets else 0.0
+        return (
+            f"hits: {self.hits}, misses: {self.misses}, prewarmed: {self.prewarmed}, recycled: {self.recycled}, "
+            f"resets: {self.resets} ({self.reset_time:.2f}s total, {average_reset:.3f}s avg)"
+        )
+
+
+class SessionPool:
+    """A pool of warm WebDriver sessions keyed by the effective PyleniumConfig.
+
+    Examples:
+    ```
+        pool = SessionPool(max_uses=25)
+        pool.prewarm(config, 2)  # optional: start 2 sessions in the background
+        py = Pylenium(config, driver_factory=pool.acquire)
+        ...
+        pool.release(py.webdriver, failed=False)
+        ...
+        pool.close()
+    ```
+    """
+
+    def __init__(self, max_uses: int = 25, build: Optional[Callable[[PyleniumConfig], WebDriver]] = None):
+        self.max_uses = max_uses
+        self.stats = PoolStats()
+        self._build = build or webdriver_factory.build_from_config
+        self._idle: Dict[str, List[Tuple[WebDriver, int]]] = {}
+        self._leased: Dict[str, Tuple[str, int, WebDriver, PyleniumConfig]] = {}
+        self._lock = threading.Condition()
+        self._pending: Dict[str, int] = {}
+        self._warm_configs: Dict[str, PyleniumConfig] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    @staticmethod
+    def key(config: PyleniumConfig) -> str:
+        """The pool key for the given config. Sessions are only shared between identical driver and viewport settings."""
+        return config.driver.model_dump_json() + config.viewport.model_dump_json()
+
+    def prewarm(self, config: PyleniumConfig, count: int):
+        """Start building sessions for the given config on background threads.
+
+        The pool keeps `count` sessions warm for this config: whenever one of them is recycled,
+        a replacement is started in the background.
+
+        Args:
+            config: The effective PyleniumConfig that tests will use.
+            count: The number of sessions to start.
+        """
+        if count < 1:
+            return
+        key = self.key(config)
+        with self._lock:
+            self._warm_configs[key] = config
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=count, thread_name_prefix="pylenium-prewarm")
+        for _ in range(count):
+            self._spawn(key)
+
+    def acquire(self, config: PyleniumConfig) -> WebDriver:
+        """Borrow a session from the pool, or build a new one if there isn't one available for this config.
+
+        If sessions for this config are still starting in the background, wait for one of them
+        instead of starting yet another browser. If none is ready within the page_load_wait_time
+        (or wait_time if not set), build one in the foreground.
+
+        Args:
+            config: The effective PyleniumConfig of the test.
+
+        Returns:
+            An instance of WebDriver.
+        """
+        key = self.key(config)
+        deadline = time.monotonic() + (config.driver.page_load_wait_time or config.driver.wait_time)
+        with self._lock:
+            while not self._idle.get(key) and self._pending.get(key):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    log.warning("Session Pool - no pre-warmed session was ready in time, so a new one will be built")
+                    break
+                self._lock.wait(remaining)
+            idle = self._idle.get(key)
+            if idle:
+                driver, uses = idle.pop()
+                self.stats.hits += 1
+                self._leased[driver.session_id] = (key, uses + 1, driver, config)
+                log.debug("Session Pool - reusing session: %s", driver.session_id)
+                return driver
+            self.stats.misses += 1
+
+        driver = self._build(config)
+        log.debug("Session Pool - built new session: %s", driver.session_id)
+        with self._lock:
+            self._leased[driver.session_id] = (key, 1, driver, config)
+        return driver
+
+    def release(self, driver: WebDriver, failed: bool = False):
+        """Return a borrowed session to the pool.
+
+        The session is reset so the next test starts from a clean slate. It is quit instead if the test failed,
+        if it has been used `max_uses` times, or if the reset fails for any reason. A recycled session is never
+        returned to the pool, so the next test gets a new one.
+
+        Args:
+            driver: The session to return.
+            failed: True if the test using this session failed.
+        """
+        with self._lock:
+            lease = self._leased.pop(driver.session_id, None)
+        if lease is None:
+            self._quit(driver)
+            return
+        key, uses, _, config = lease
+        if failed or uses >= self.max_uses:
+            self._recycle(key, driver)
+            return
+        try:
+            self.reset(driver, config)
+        except Exception as e:
+            log.warning("Session Pool - unable to reset session, so it will be recycled: %s", e)
+            self._recycle(key, driver)
+            return
+        self._add_idle(key, driver, uses)
+
+    def reset(self, driver: WebDriver, config: PyleniumConfig):
+        """Clear cookies, storage and extra windows or tabs, then leave the session on `about:blank`.
+
+        The page load, script and implicit wait timeouts are set back to the ones the session was started with,
+        in case the test changed them.
+
+        * Cookies are cleared for every domain on Chromium browsers, and for the current domain on the others.
+        * Storage is only cleared for the origins that are open in the session's windows when it's reset.
+          Storage written by an origin that the test left earlier (ie before a redirect to another site) is kept.
+          On Chromium browsers, IndexedDB and Cache Storage of those origins are cleared too.
+
+        If the viewport was part of the new-session request, it is restored here too
+        since Pylenium won't set it again when the session is reused.
+        """
+        start = time.perf_counter()
+        handles = driver.window_handles
+        origins = set()
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            origins.add(self._clear_storage(driver))
+            driver.close()
+        driver.switch_to.window(handles[0])
+        origins.add(self._clear_storage(driver))
+        if hasattr(driver, "execute_cdp_cmd"):
+            # clear cookies for every domain, not just the current one
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in origins - {None, "null"}:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        else:
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+        driver.execute(Command.SET_TIMEOUTS, self._configured_timeouts(config))
+        viewport = config.viewport
+        if webdriver_factory.build_viewport_options(config.driver.browser, viewport, config.driver.options):
+            if viewport.maximize:
+                driver.maximize_window()
+            elif viewport.orientation == "landscape":
+                driver.set_window_size(viewport.height, viewport.width)
+            else:
+                driver.set_window_size(viewport.width, viewport.height)
+        with self._lock:
+            self.stats.resets += 1
+            self.stats.reset_time += time.perf_counter() - start
+
+    @staticmethod
+    def _configured_timeouts(config: PyleniumConfig) -> Dict[str, int]:
+        """The timeouts in milliseconds that a new session for this config starts with."""
+        caps = webdriver_factory.build_timeouts_capabilities(config.driver.page_load_wait_time, config.driver.capabilities)
+        return {**DEFAULT_TIMEOUTS, **caps.get("timeouts", {})}
+
+    @staticmethod
+    def _clear_storage(driver: WebDriver) -> Optional[str]:
+        """Clear the storage of the current window's origin and return the origin."""
+        try:
+            return driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {} return window.location.origin;"
+            )
+        except WebDriverException:
+            return None  # scripts can't run on some pages
+
+    def close(self):
+        """Quit every session in the pool and log the pool's stats."""
+        with self._lock:
+            self._closed = True
+            executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for sessions in self._idle.values():
+            for driver, _ in sessions:
+                self._quit(driver)
+        for _, _, driver, _ in self._leased.values():
+            self._quit(driver)
+        self._idle.clear()
+        self._leased.clear()
+        log.info("Session Pool [%s] - %s", os.environ.get("PYTEST_XDIST_WORKER", "main"), self.stats.summary())
+
+    def _spawn(self, key: str):
+        """Build a session for the warm config with the given key on a background thread."""
+        with self._lock:
+            if self._closed or self._executor is None:
+                return
+            self._pending[key] = self._pending.get(key, 0) + 1
+            self._executor.submit(self._prewarm_one, key)
+
+    def _prewarm_one(self, key: str):
+        driver = None
+        try:
+            driver = self._build(self._warm_configs[key])
+        except Exception as e:
+            log.warning("Session Pool - unable to pre-warm a session: %s", e)
+        with self._lock:
+            self._pending[key] -= 1
+            if driver is not None and not self._closed:
+                self.stats.prewarmed += 1
+                self._idle.setdefault(key, []).append((driver, 0))
+                driver = None
+            self._lock.notify_all()
+        if driver is not None:
+            # the pool was closed while this session was starting
+            self._quit(driver)
+
+    def _add_idle(self, key: str, driver: WebDriver, uses: int):
+        with self._lock:
+            self._idle.setdefault(key, []).append((driver, uses))
+            self._lock.notify_all()
+
+    def _recycle(self, key: str, driver: WebDriver):
+        with self._lock:
+            self.stats.recycled += 1
+        self._quit(driver)
+        if key in self._warm_configs:
+            self._spawn(key)
+
+    def _quit(self, driver: WebDriver):
+        try:
+            driver.quit()
+        except Exception:
+            pass  # the session is already gone, like when the test quit it
@@ -0,0 +1,99 @@
+""" Piercing selectors that reach into nested Shadow DOMs with a single script.
+
+Without them, an element inside nested shadow roots takes a round trip per level:
+
+    py.get("app-shell").open_shadow_dom().get("nav-menu").open_shadow_dom().get("button")
+
+With a piercing selector, `>>>` steps into the open shadow roots of the elements matched so far:
+
+    py.get("app-shell >>> nav-menu >>> button")
+
+* Piercing selectors work with `py.get()`, `py.find()`, `Element.get()` and `Element.find()`.
+* Closed shadow roots can't be reached by scripts, so they are skipped.
+* With `"wait_mode": "observer"`, the wait runs inside the page and also watches for shadow roots being attached,
+  instead of polling the selector.
+"""
+
+from typing import List, Optional
+
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+
+from pylenium import observe, utils
+
+SEPARATOR = ">>>"
+
+# The `by` of an Element's locator when it was found with a piercing selector
+BY = "piercing css selector"
+
+
+def is_piercing(css: str) -> bool:
+    """True if the CSS selector steps into shadow roots with `>>>`."""
+    return SEPARATOR in css
+
+
+def query(py, css: str, root: Optional[WebElement] = None, first: bool = True, watch: bool = False, timeout: float = 0):
+    """Run the piercing selector in the page.
+
+    Args:
+        py: The instance of Pylenium.
+        css: The piercing selector.
+        root: The element to search within. If None, search the whole document.
+        first: True for the first match, False for every match.
+        watch: True to wait inside the page until the selector matches.
+        timeout: The number of seconds to wait when `watch=True`.
+
+    Returns:
+        The first matching WebElement (or None), or the list of matching WebElements.
+
+    Raises:
+        `InvalidSelectorException` if a part of the selector is invalid.
+    """
+    script = utils.read_script_from_file("shadow_query.js")
+    if watch:
+        with observe.recorded(py, "shadow.query", locator=f"{BY}: {css}") as record:
+            value = observe.execute_async(py, script, timeout, css, root, first, watch, int(timeout * 1000))
+            record.timed_out = not value
+    else:
+        value = observe.execute_async(py, script, timeout, css, root, first, watch, int(timeout * 1000))
+    if isinstance(value, dict) and "error" in value:
+        raise InvalidSelectorException(f"{value['error']} - selector: `{css}`")
+    return value
+
+
+def get(py, css: str, root: Optional[WebElement] = None, timeout: Optional[float] = None, message: str = "") -> WebElement:
+    """Get the first element that matches the piercing selector.
+
+    Raises:
+        `NoSuchElementException` if timeout is 0 and no element matches.
+        `TimeoutException` if no element matches within the timeout.
+    """
+    if timeout == 0:
+        element = query(py, css, root)
+        if element is None:
+            raise NoSuchElementException(message)
+        return element
+    if observe.is_enabled(py):
+        timeout = timeout or py.config.driver.wait_time
+        element = query(py, css, root, watch=True, timeout=timeout)
+        if element is None:
+            raise TimeoutException(message)
+        return element
+    return py.wait(timeout).until(lambda _: query(py, css, root), message)
+
+
+def find(py, css: str, root: Optional[WebElement] = None, timeout: Optional[float] = None, message: str = "") -> List[WebElement]:
+    """Find every element that matches the piercing selector.
+
+    Raises:
+        `TimeoutException` if no element matches within the timeout.
+    """
+    if timeout == 0:
+        return query(py, css, root, first=False)
+    if observe.is_enabled(py):
+        timeout = timeout or py.config.driver.wait_time
+        elements = query(py, css, root, first=False, watch=True, timeout=timeout)
+        if not elements:
+            raise TimeoutException(message)
+        return elements
+    return py.wait(timeout).until(lambda _: query(py, css, root, first=False), message)
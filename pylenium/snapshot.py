@@ -0,0 +1,571 @@
+""" Offline snapshots of the DOM that can be queried without any more WebDriver traffic.
+
+`py.snapshot()` pulls `document.documentElement.outerHTML` once and parses it in Python.
+The snapshot has the same `get`, `find`, `getx`, `findx`, `contains` and `text()` commands as `Element`,
+but every query runs locally, so hundreds of read-only checks cost a single round trip.
+
+* CSS selectors support tags, ids, classes, attribute selectors, the ` `, `>`, `+` and `~` combinators,
+  comma separated groups, and the common structural pseudo-classes like `:nth-child()` and `:not()`.
+* XPath selectors support the subset of XPath that `xml.etree.ElementTree` supports.
+* A snapshot only knows the HTML, so there is no layout: `text()` is the normalized text content, not the rendered text.
+* Use `snapshot.is_stale()` to check if the live page has changed since the snapshot was taken.
+
+Examples:
+```
+    snapshot = py.snapshot()
+    assert snapshot.find("table tr").length() == 500
+    assert snapshot.get("tr:nth-child(2) > td").text() == "Jane"
+    assert not snapshot.is_stale()
+```
+"""
+
+import functools
+import re
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException
+
+from pylenium import utils
+from pylenium.log import logger as log
+
+
+DOCUMENT_TAG = "#document"
+
+# elements that never have children or an end tag
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
+
+# elements whose content is never text on the page
+NO_TEXT_ELEMENTS = {"head", "script", "style", "noscript", "template", "title"}
+
+# elements whose text is separated from the text around them
+BLOCK_ELEMENTS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset", "figcaption", "figure", "footer",
+    "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "option", "p", "pre", "section",
+    "table", "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+}
+
+
+def normalize(text: str) -> str:
+    """Collapse all whitespace into single spaces and strip it from both ends."""
+    return " ".join(text.split())
+
+
+# region PARSING
+
+
+class _TreeBuilder(HTMLParser):
+    """Parse serialized HTML (like `outerHTML`) into a tree of ElementTree elements."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = ET.Element(DOCUMENT_TAG)
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        element = ET.SubElement(self._stack[-1], tag, {name: "" if value is None else value for name, value in attrs})
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        ET.SubElement(self._stack[-1], tag, {name: "" if value is None else value for name, value in attrs})
+
+    def handle_endtag(self, tag):
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i].tag == tag:
+                del self._stack[i:]
+                return
+
+    def handle_data(self, data):
+        parent = self._stack[-1]
+        if len(parent):
+            last = parent[-1]
+            last.tail = (last.tail or "") + data
+        else:
+            parent.text = (parent.text or "") + data
+
+
+def parse(html: str) -> ET.Element:
+    """Parse the HTML into a tree of ElementTree elements under a `#document` root."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# endregion
+
+
+# region CSS SELECTORS
+
+_CSS_TOKEN = re.compile(
+    r"""
+    \s*(?P<combinator>[>+~,])\s*
+    | (?P<space>\s+)
+    | (?P<tag>\*|[a-zA-Z][\w-]*)
+    | \#(?P<id>[\w-]+)
+    | \.(?P<class_name>[\w-]+)
+    | \[\s*(?P<attr>[\w:.-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]+)\s*(?P<flag>[iI])?\s*)?\]
+    | :(?P<pseudo>[\w-]+)(?:\((?P<arg>[^()]*)\))?
+    """,
+    re.VERBOSE,
+)
+
+_NTH = re.compile(r"^(?:(?P<a>[+-]?\d*)n\s*(?:(?P<sign>[+-])\s*(?P<b>\d+))?|(?P<only_b>[+-]?\d+))$")
+
+
+class _Compound:
+    """A compound selector, like `a.nav[href^='/']:first-child`."""
+
+    def __init__(self):
+        self.tag: Optional[str] = None
+        self.ids: List[str] = []
+        self.classes: List[str] = []
+        self.attrs: List[Tuple[str, Optional[str], Optional[str], bool]] = []
+        self.pseudos: List[Tuple[str, Optional[str]]] = []
+
+    def is_empty(self) -> bool:
+        return self.tag is None and not (self.ids or self.classes or self.attrs or self.pseudos)
+
+
+def _parse_css(selector: str) -> List[List[Tuple[str, _Compound]]]:
+    """Parse a CSS selector into groups of `(combinator, compound)` pairs, from left to right."""
+    groups = []
+    group: List[Tuple[str, _Compound]] = []
+    combinator = ""
+    compound = _Compound()
+    position = 0
+    selector = selector.strip()
+    while position < len(selector):
+        match = _CSS_TOKEN.match(selector, position)
+        if not match or match.end() == position:
+            raise InvalidSelectorException(f"Unsupported CSS selector in snapshot: `{selector}`")
+        position = match.end()
+        separator = match.group("combinator") or (" " if match.group("space") else None)
+        if separator:
+            if compound.is_empty():
+                raise InvalidSelectorException(f"Invalid CSS selector: `{selector}`")
+            group.append((combinator, compound))
+            compound = _Compound()
+            if separator == ",":
+                groups.append(group)
+                group = []
+                combinator = ""
+            else:
+                combinator = separator
+        elif match.group("tag"):
+            compound.tag = match.group("tag").lower()
+        elif match.group("id"):
+            compound.ids.append(match.group("id"))
+        elif match.group("class_name"):
+            compound.classes.append(match.group("class_name"))
+        elif match.group("attr"):
+            value = match.group("value")
+            if value and value[0] in "\"'":
+                value = value[1:-1]
+            compound.attrs.append((match.group("attr").lower(), match.group("op"), value, bool(match.group("flag"))))
+        else:
+            pseudo = match.group("pseudo").lower()
+            if pseudo not in _PSEUDOS:
+                raise InvalidSelectorException(f"Unsupported pseudo-class in snapshot: `:{pseudo}`")
+            if (pseudo == "not" or pseudo.startswith("nth-")) and match.group("arg") is None:
+                raise InvalidSelectorException(f"`:{pseudo}()` needs an argument: `{selector}`")
+            compound.pseudos.append((pseudo, match.group("arg")))
+    if compound.is_empty():
+        raise InvalidSelectorException(f"Invalid CSS selector: `{selector}`")
+    group.append((combinator, compound))
+    groups.append(group)
+    return groups
+
+
+def _nth(arg: str, position: int) -> bool:
+    """True if the 1-based position matches the `an+b` argument of `:nth-child()`."""
+    arg = arg.strip().lower().replace(" ", "")
+    if arg == "odd":
+        arg = "2n+1"
+    elif arg == "even":
+        arg = "2n"
+    match = _NTH.match(arg)
+    if not match:
+        raise InvalidSelectorException(f"Invalid :nth-child() argument: `{arg}`")
+    if match.group("only_b") is not None:
+        return position == int(match.group("only_b"))
+    a = match.group("a")
+    a = 1 if a in ("", "+") else -1 if a == "-" else int(a)
+    b = int(match.group("b") or 0) * (-1 if match.group("sign") == "-" else 1)
+    if a == 0:
+        return position == b
+    return (position - b) % a == 0 and (position - b) // a >= 0
+
+
+# endregion
+
+
+class SnapshotElement:
+    """A single element in a Snapshot. It has the read-only commands of `Element`."""
+
+    def __init__(self, snapshot: "Snapshot", node: ET.Element):
+        self._snapshot = snapshot
+        self._node = node
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SnapshotElement) and self._node is other._node
+
+    def __hash__(self) -> int:
+        return id(self._node)
+
+    def __repr__(self) -> str:
+        return f"<SnapshotElement {self.tag_name()}>"
+
+    # region METHODS
+
+    def tag_name(self) -> str:
+        """Gets the tag name of this element."""
+        return self._node.tag
+
+    def text(self) -> str:
+        """Gets the text content of this element with normalized whitespace."""
+        return normalize("".join(self._itertext(self._node)))
+
+    def get_attribute(self, attribute: str) -> Optional[str]:
+        """Gets the given attribute's value, or None if the element doesn't have it."""
+        return self._node.get(attribute)
+
+    def html(self) -> str:
+        """Gets the HTML of this element in the snapshot."""
+        return ET.tostring(self._node, encoding="unicode", method="html")
+
+    # endregion
+
+    # region FIND ELEMENTS
+
+    def contains(self, text: str) -> "SnapshotElement":
+        """Gets the first element in this element's context that contains the `text`.
+
+        Raises:
+            `NoSuchElementException` if no element contains the text.
+        """
+        needle = normalize(text)
+        for node in self._descendants():
+            own_text = normalize(" ".join(t for t in [node.text] + [child.tail for child in node] if t))
+            if needle in own_text and node.tag not in NO_TEXT_ELEMENTS:
+                return self._wrap(node)
+        # the text is split across nested elements: find the deepest element that contains all of it
+        node = self._node
+        while True:
+            child = next((c for c in node if c.tag not in NO_TEXT_ELEMENTS and needle in normalize("".join(self._itertext(c)))), None)
+            if child is None:
+                break
+            node = child
+        if node is self._node:
+            raise NoSuchElementException(f"Could not find element with the text `{text}` in the snapshot")
+        return self._wrap(node)
+
+    def get(self, css: str) -> "SnapshotElement":
+        """Gets the first element that matches the `css` selector in this element's context.
+
+        Raises:
+            `NoSuchElementException` if no element matches.
+        """
+        matchers = self._snapshot._matchers(css)
+        for node in self._descendants():
+            if any(matcher(node) for matcher in matchers):
+                return self._wrap(node)
+        raise NoSuchElementException(f"Could not find element with the CSS `{css}` in the snapshot")
+
+    def find(self, css: str) -> "SnapshotElements":
+        """Finds all elements that match the `css` selector in this element's context."""
+        matchers = self._snapshot._matchers(css)
+        return SnapshotElements(self._wrap(node) for node in self._descendants() if any(matcher(node) for matcher in matchers))
+
+    def getx(self, xpath: str) -> "SnapshotElement":
+        """Gets the first element that matches the `xpath` selector.
+
+        * Like in Selenium, an xpath that starts with `/` searches the whole snapshot. Start it with `.` to search this element.
+
+        Raises:
+            `NoSuchElementException` if no element matches.
+        """
+        elements = self.findx(xpath)
+        if elements:
+            return elements[0]
+        raise NoSuchElementException(f"Could not find element with the xpath `{xpath}` in the snapshot")
+
+    def findx(self, xpath: str) -> "SnapshotElements":
+        """Finds all elements that match the `xpath` selector.
+
+        * Like in Selenium, an xpath that starts with `/` searches the whole snapshot. Start it with `.` to search this element.
+        """
+        root = self._node
+        if xpath.startswith("/"):
+            root = self._snapshot._node
+            xpath = "." + xpath
+        try:
+            nodes = root.findall(xpath)
+        except (SyntaxError, KeyError) as e:
+            raise InvalidSelectorException(f"Unsupported xpath in snapshot: `{xpath}` - {e}")
+        return SnapshotElements(self._wrap(node) for node in nodes if node.tag != DOCUMENT_TAG)
+
+    # endregion
+
+    # region FAMILY
+
+    def children(self) -> "SnapshotElements":
+        """Gets the child elements."""
+        return SnapshotElements(self._wrap(node) for node in self._node)
+
+    def parent(self) -> Optional["SnapshotElement"]:
+        """Gets the parent element, or None for the `<html>` element."""
+        parent = self._snapshot._parents.get(self._node)
+        if parent is None or parent.tag == DOCUMENT_TAG:
+            return None
+        return self._wrap(parent)
+
+    # endregion
+
+    def _wrap(self, node: ET.Element) -> "SnapshotElement":
+        return SnapshotElement(self._snapshot, node)
+
+    def _descendants(self) -> Iterator[ET.Element]:
+        """Every element under this one in document order."""
+        iterator = self._node.iter()
+        next(iterator)
+        return iterator
+
+    @classmethod
+    def _itertext(cls, node: ET.Element) -> Iterator[str]:
+        if node.tag in NO_TEXT_ELEMENTS:
+            return
+        block = node.tag in BLOCK_ELEMENTS
+        if block:
+            yield " "
+        if node.text:
+            yield node.text
+        for child in node:
+            yield from cls._itertext(child)
+            if child.tail:
+                yield child.tail
+        if block:
+            yield " "
+
+
+class SnapshotElements(List[SnapshotElement]):
+    """A list of elements in a Snapshot. It has the read-only commands of `Elements`."""
+
+    def length(self) -> int:
+        """The number of elements in the list."""
+        return len(self)
+
+    def first(self) -> SnapshotElement:
+        """Gets the first element in the list.
+
+        Raises:
+            `IndexError` if the list is empty.
+        """
+        if self:
+            return self[0]
+        raise IndexError("Cannot get first() from an empty list")
+
+    def last(self) -> SnapshotElement:
+        """Gets the last element in the list.
+
+        Raises:
+            `IndexError` if the list is empty.
+        """
+        if self:
+            return self[-1]
+        raise IndexError("Cannot get last() from an empty list")
+
+    def is_empty(self) -> bool:
+        """Checks if there are zero elements in the list."""
+        return len(self) == 0
+
+    def texts(self) -> List[str]:
+        """Gets the text of every element in the list."""
+        return [element.text() for element in self]
+
+    def attributes(self, attribute: str) -> List[Optional[str]]:
+        """Gets the given attribute's value of every element in the list."""
+        return [element.get_attribute(attribute) for element in self]
+
+
+class Snapshot(SnapshotElement):
+    """A parsed snapshot of the whole DOM that can be queried locally.
+
+    Use `py.snapshot()` to take one from the current page.
+    """
+
+    def __init__(self, html: str, py=None, url: str = "", version: Optional[int] = None):
+        root = parse(html)
+        super().__init__(self, root)
+        self._py = py
+        self._version = version
+        self._parents: Dict[ET.Element, ET.Element] = {}
+        # the 0-based index of each element among its siblings, and among its siblings with the same tag
+        self._indexes: Dict[ET.Element, Tuple[int, int]] = {}
+        self._type_counts: Dict[Tuple[ET.Element, str], int] = {}
+        for parent in root.iter():
+            counts: Dict[str, int] = {}
+            for i, child in enumerate(parent):
+                self._parents[child] = parent
+                self._indexes[child] = (i, counts.get(child.tag, 0))
+                counts[child.tag] = counts.get(child.tag, 0) + 1
+            for tag, count in counts.items():
+                self._type_counts[(parent, tag)] = count
+        self.url = url
+
+    @classmethod
+    def capture(cls, py) -> "Snapshot":
+        """Take a snapshot of the current page with a single script."""
+        value = py.webdriver.execute_script(utils.read_script_from_file("snapshot.js"), True)
+        return cls(value["html"], py, value["url"], value["version"])
+
+    def __repr__(self) -> str:
+        return f"<Snapshot url={self.url}>"
+
+    def is_stale(self) -> bool:
+        """Check if the live page has changed since this snapshot was taken.
+
+        Returns:
+            True if the DOM changed, or if the page was reloaded or navigated away from.
+
+        Raises:
+            `ValueError` if this snapshot was not taken from a page.
+        """
+        if self._py is None:
+            raise ValueError("This snapshot was not taken from a page, so it cannot be compared with one")
+        value = self._py.webdriver.execute_script(utils.read_script_from_file("snapshot.js"), False)
+        stale = value["version"] != self._version
+        if stale:
+            log.debug("Snapshot of %s is stale", self.url)
+        return stale
+
+    def _matchers(self, css: str) -> List[Callable[[ET.Element], bool]]:
+        """A function per group of the CSS selector that checks if a node matches it.
+
+        Each function remembers what it found out about the siblings before a node, so one query stays linear.
+        """
+        matchers = []
+        for group in _parse_css(css):
+            cache: Dict[Tuple[ET.Element, int], bool] = {}
+            matchers.append(functools.partial(self._matches, group=group, index=len(group) - 1, cache=cache))
+        return matchers
+
+    def _matches(self, node: ET.Element, group: List[Tuple[str, _Compound]], index: int, cache: Dict[Tuple[ET.Element, int], bool]) -> bool:
+        """True if the node matches the compound at `index` of the group, and the rest of the group to its left."""
+        combinator, compound = group[index]
+        if not self._matches_compound(node, compound):
+            return False
+        if index == 0:
+            return True
+        if combinator == ">":
+            parent = self._parents.get(node)
+            return parent is not None and self._matches(parent, group, index - 1, cache)
+        if combinator == " ":
+            parent = self._parents.get(node)
+            while parent is not None:
+                if self._matches(parent, group, index - 1, cache):
+                    return True
+                parent = self._parents.get(parent)
+            return False
+        previous = self._previous(node)
+        if combinator == "+":
+            return previous is not None and self._matches(previous, group, index - 1, cache)
+        return self._any_from(previous, group, index - 1, cache)
+
+    def _any_from(self, node: Optional[ET.Element], group: List[Tuple[str, _Compound]], index: int, cache: Dict) -> bool:
+        """True if the node or a sibling before it matches the group up to `index`.
+
+        The answer is cached for every sibling that was checked, so `~` doesn't check each row against every row before it.
+        """
+        checked = []
+        found = False
+        while node is not None:
+            if (node, index) in cache:
+                found = cache[(node, index)]
+                break
+            checked.append(node)
+            if self._matches(node, group, index, cache):
+                found = True
+                break
+            node = self._previous(node)
+        for sibling in checked:
+            cache[(sibling, index)] = found
+        return found
+
+    def _matches_compound(self, node: ET.Element, compound: _Compound) -> bool:
+        if node.tag == DOCUMENT_TAG:
+            return False
+        if compound.tag not in (None, "*") and node.tag != compound.tag:
+            return False
+        if compound.ids and any(node.get("id") != id_ for id_ in compound.ids):
+            return False
+        if compound.classes:
+            classes = node.get("class", "").split()
+            if any(class_name not in classes for class_name in compound.classes):
+                return False
+        for name, op, value, ignore_case in compound.attrs:
+            actual = node.get(name)
+            if actual is None:
+                return False
+            if op is None:
+                continue
+            if ignore_case:
+                actual, value = actual.lower(), value.lower()
+            if not _ATTRIBUTE_OPERATORS[op](actual, value):
+                return False
+        return all(_PSEUDOS[pseudo](self, node, arg) for pseudo, arg in compound.pseudos)
+
+    def _previous(self, node: ET.Element) -> Optional[ET.Element]:
+        """The sibling right before the node, if any."""
+        parent = self._parents.get(node)
+        index = self._indexes[node][0] if parent is not None else 0
+        return parent[index - 1] if index else None
+
+    def _position(self, node: ET.Element, of_type: bool = False, from_end: bool = False) -> int:
+        """The 1-based position of the node among its siblings."""
+        if self._parents.get(node) is None:
+            return 1
+        index = self._indexes[node][1 if of_type else 0]
+        return self._count_siblings(node, of_type) - index if from_end else index + 1
+
+    def _count_siblings(self, node: ET.Element, of_type: bool = False) -> int:
+        parent = self._parents.get(node)
+        if parent is None:
+            return 1
+        return self._type_counts[(parent, node.tag)] if of_type else len(parent)
+
+
+_ATTRIBUTE_OPERATORS = {
+    "=": lambda actual, value: actual == value,
+    "~=": lambda actual, value: value in actual.split(),
+    "|=": lambda actual, value: actual == value or actual.startswith(value + "-"),
+    "^=": lambda actual, value: bool(value) and actual.startswith(value),
+    "$=": lambda actual, value: bool(value) and actual.endswith(value),
+    "*=": lambda actual, value: bool(value) and value in actual,
+}
+
+
+def _not(snapshot: Snapshot, node: ET.Element, arg: str) -> bool:
+    groups = _parse_css(arg)
+    return not any(len(group) == 1 and snapshot._matches_compound(node, group[0][1]) for group in groups)
+
+
+_PSEUDOS = {
+    "first-child": lambda s, node, _: s._position(node) == 1,
+    "last-child": lambda s, node, _: s._position(node, from_end=True) == 1,
+    "only-child": lambda s, node, _: s._count_siblings(node) == 1,
+    "first-of-type": lambda s, node, _: s._position(node, of_type=True) == 1,
+    "last-of-type": lambda s, node, _: s._position(node, of_type=True, from_end=True) == 1,
+    "only-of-type": lambda s, node, _: s._count_siblings(node, of_type=True) == 1,
+    "nth-child": lambda s, node, arg: _nth(arg, s._position(node)),
+    "nth-last-child": lambda s, node, arg: _nth(arg, s._position(node, from_end=True)),
+    "nth-of-type": lambda s, node, arg: _nth(arg, s._position(node, of_type=True)),
+    "nth-last-of-type": lambda s, node, arg: _nth(arg, s._position(node, of_type=True, from_end=True)),
+    "empty": lambda s, node, _: len(node) == 0 and not node.text,
+    "checked": lambda s, node, _: node.get("checked") is not None or node.get("selected") is not None,
+    "disabled": lambda s, node, _: node.get("disabled") is not None,
+    "enabled": lambda s, node, _: node.get("disabled") is None,
+    "not": _not,
+}
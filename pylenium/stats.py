@@ -0,0 +1,139 @@
+""" Counters of what Pylenium had to do behind the scenes during a test.
+
+Each instance of Pylenium has its own `py.stats`.
+
+Every wait is recorded in `py.stats.waits`, so the waits that cost the most time can be found and fixed first.
+At the end of the Test Run, the totals of each kind of wait and the waits that took the longest are reported in the
+terminal summary. The Test Run only keeps those, so its stats stay the same size however many tests run.
+"""
+
+import heapq
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+# the number of slowest waits that a Test Run keeps
+TOP_WAITS = 10
+
+
+class WaitRecord(BaseModel):
+    """A single wait: what it waited for, and how long and how many polls it took."""
+
+    condition: str
+    message: str = ""
+    locator: Optional[str] = None
+    test: Optional[str] = None
+    polls: int = 0
+    seconds: float = 0.0
+    timed_out: bool = False
+    swallowed: Dict[str, int] = {}
+
+    def summary(self) -> str:
+        """A single line summary of this wait."""
+        outcome = "timed out" if self.timed_out else "passed"
+        line = f"{self.seconds:.2f}s {outcome} after {self.polls} polls"
+        if self.swallowed:
+            line += " swallowing " + ", ".join(f"{count} {name}" for name, count in self.swallowed.items())
+        line += f" - {self.condition}"
+        for detail in (self.locator, self.message, self.test):
+            if detail:
+                line += f" - {detail}"
+        return line
+
+
+class Stats(BaseModel):
+    """Counters for the current instance of Pylenium."""
+
+    stale_recoveries: int = 0
+    waits: List[WaitRecord] = []
+
+    def record_wait(self, condition: str, message: str = "", locator: Optional[str] = None) -> WaitRecord:
+        """Add a record for a wait that is about to start. The wait fills in its polls and seconds."""
+        record = WaitRecord(condition=condition, message=message, locator=locator)
+        self.waits.append(record)
+        return record
+
+    def top_waits(self, count: int = 10) -> List[WaitRecord]:
+        """The waits that took the most time, longest first."""
+        return sorted(self.waits, key=lambda wait: wait.seconds, reverse=True)[:count]
+
+    def summary(self) -> str:
+        """A single line summary of these stats."""
+        timed_out = sum(1 for wait in self.waits if wait.timed_out)
+        seconds = sum(wait.seconds for wait in self.waits)
+        return (
+            f"stale recoveries: {self.stale_recoveries}, waits: {len(self.waits)} ({timed_out} timed out), "
+            f"wait seconds: {seconds:.2f}"
+        )
+
+
+class WaitTotals(BaseModel):
+    """The totals of one kind of wait, like `wait_for_selector.first`."""
+
+    count: int = 0
+    timed_out: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def add(self, wait: WaitRecord):
+        self.count += 1
+        self.timed_out += wait.timed_out
+        self.seconds += wait.seconds
+        self.max_seconds = max(self.max_seconds, wait.seconds)
+
+    def merge(self, other: "WaitTotals") -> "WaitTotals":
+        """Add the values of another WaitTotals (ie from another xdist worker) to this one."""
+        self.count += other.count
+        self.timed_out += other.timed_out
+        self.seconds += other.seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        return self
+
+    def summary(self) -> str:
+        """A single line summary of these totals."""
+        return f"{self.seconds:.2f}s in {self.count} waits ({self.timed_out} timed out), longest {self.max_seconds:.2f}s"
+
+
+class RunStats(BaseModel):
+    """The stats of a Test Run: totals per kind of wait and only the slowest waits themselves."""
+
+    stale_recoveries: int = 0
+    kinds: Dict[str, WaitTotals] = {}
+    slowest: List[WaitRecord] = []
+
+    def add(self, stats: Stats, test: Optional[str] = None) -> "RunStats":
+        """Add the stats of a test's instance of Pylenium, tagging the waits that are kept with the test."""
+        self.stale_recoveries += stats.stale_recoveries
+        for wait in stats.waits:
+            self.kinds.setdefault(wait.condition, WaitTotals()).add(wait)
+        slowest = stats.top_waits(TOP_WAITS)
+        for wait in slowest:
+            wait.test = test
+        self._keep_slowest(slowest)
+        return self
+
+    def merge(self, other: "RunStats") -> "RunStats":
+        """Add the values of another RunStats (ie from another xdist worker) to this one."""
+        self.stale_recoveries += other.stale_recoveries
+        for condition, totals in other.kinds.items():
+            self.kinds.setdefault(condition, WaitTotals()).merge(totals)
+        self._keep_slowest(other.slowest)
+        return self
+
+    def top_waits(self, count: int = TOP_WAITS) -> List[WaitRecord]:
+        """The waits that took the most time, longest first."""
+        return self.slowest[:count]
+
+    def top_kinds(self, count: int = TOP_WAITS) -> List[str]:
+        """The kinds of waits that took the most time in total, most first."""
+        return sorted(self.kinds, key=lambda condition: self.kinds[condition].seconds, reverse=True)[:count]
+
+    def summary(self) -> str:
+        """A single line summary of these stats."""
+        count = sum(totals.count for totals in self.kinds.values())
+        timed_out = sum(totals.timed_out for totals in self.kinds.values())
+        seconds = sum(totals.seconds for totals in self.kinds.values())
+        return f"stale recoveries: {self.stale_recoveries}, waits: {count} ({timed_out} timed out), wait seconds: {seconds:.2f}"
+
+    def _keep_slowest(self, waits: List[WaitRecord]):
+        self.slowest = heapq.nlargest(TOP_WAITS, self.slowest + waits, key=lambda wait: wait.seconds)
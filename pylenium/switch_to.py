@@ -40,7 +40,9 @@ class SwitchTo:
             The current instance of Pylenium
         """
         log.debug("py.switch_to.frame() - Switch to frame using name or id: `%s`", name_or_id)
+        self._py._restore_context()
         self._py.wait(timeout).until(FrameIsAvailable(name_or_id))
+        self._py._frame_path = self._py._context_path = None
         return self._py
 
     def frame_by_element(self, element: Element, timeout: int = 0):
@@ -60,7 +62,9 @@ class SwitchTo:
             The current instance of Pylenium
         """
         log.command("py.switch_to.frame_by_element() - Switch to frame using an Element")
+        self._py._restore_context()
         self._py.wait(timeout).until(ec.frame_to_be_available_and_switch_to_it(element.locator))
+        self._py._frame_path = self._py._context_path = None
         return self._py
 
     def parent_frame(self):
@@ -72,7 +76,10 @@ class SwitchTo:
             The current instance of Pylenium
         """
         log.command("py.switch_to.parent_frame() - Switch to the parent frame")
+        self._py._restore_context()
         self._py.webdriver.switch_to.parent_frame()
+        frame_path = self._py._frame_path
+        self._py._frame_path = self._py._context_path = None if frame_path is None else frame_path[:-1]
         return self._py
 
     def default_content(self):
@@ -85,6 +92,7 @@ class SwitchTo:
         """
         log.command("py.switch_to.default_content() - Switch to default content of this browser session")
         self._py.webdriver.switch_to.default_content()
+        self._py._frame_path = self._py._context_path = ()
         return self._py
 
     def new_window(self):
@@ -95,6 +103,7 @@ class SwitchTo:
         """
         log.command("py.new_window() - Open a new browser window")
         self._py.webdriver.switch_to.new_window("window")
+        self._py._frame_path = self._py._context_path = ()
         return self._py
 
     def new_tab(self):
@@ -105,6 +114,7 @@ class SwitchTo:
         """
         log.command("py.new_tab() - Open a new browser tab")
         self._py.webdriver.switch_to.new_window("tab")
+        self._py._frame_path = self._py._context_path = ()
         return self._py
 
     def window(self, name_or_handle="", index=0):
@@ -133,10 +143,12 @@ class SwitchTo:
             handle = self._py.webdriver.window_handles[index]
             log.command("py.switch_to.window() - Switch to a Tab or Window by index: %s", index)
             self._py.webdriver.switch_to.window(handle)
+            self._py._frame_path = self._py._context_path = ()
             return self._py
         if name_or_handle:
             log.command("py.switch_to.window() - Switch to Tab or Window by name or handle: `%s`", name_or_handle)
             self._py.webdriver.switch_to.window(name_or_handle)
+            self._py._frame_path = self._py._context_path = ()
             return self._py
         # context unchanged
         return self._py
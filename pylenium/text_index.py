@@ -0,0 +1,58 @@
+""" Find elements by their text with an index that lives in the page.
+
+`contains()` used to search the whole document with `//*[contains(text(), "...")]` on every poll.
+Instead, the page keeps an index of its normalized text that is only rebuilt after the DOM changes,
+and repeated lookups of the same text are cached until then.
+
+* Whitespace is normalized, so text that spans several text nodes or lines still matches.
+* The text is passed to the script as an argument, so quotes in the text are fine.
+* If the text is split across nested elements, the deepest element that contains all of it is found.
+* Text inside `<script>`, `<style>`, `<noscript>` and `<template>` elements never matches.
+"""
+
+from typing import Optional
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from pylenium import utils
+
+# elements whose text is never rendered, like the text_index.js SKIP list
+_SKIP = "self::script or self::style or self::noscript or self::template"
+
+
+def find(driver, text: str, root: Optional[WebElement] = None) -> Optional[WebElement]:
+    """Find the first element that contains the given text.
+
+    Args:
+        driver: The WebDriver.
+        text: The text for the element to contain.
+        root: The element to search within. If None, search the whole document.
+
+    Returns:
+        The WebElement, or None if no element contains the text.
+    """
+    return driver.execute_script(utils.read_script_from_file("text_index.js"), text, root)
+
+
+def xpath(text: str) -> str:
+    """The XPath equivalent of a text lookup, so the element can be found again with a locator.
+
+    Like the lookup, whitespace is normalized and the deepest element that contains all of the text matches.
+    Script, style, noscript and template elements never match, and neither do their ancestors because of them.
+
+    Examples:
+        xpath("Hi") == './/*[not(self::script or self::style or self::noscript or self::template)]'
+                       '[contains(normalize-space(.), "Hi")][not(*[contains(normalize-space(.), "Hi")])]'
+    """
+    contains = f"contains(normalize-space(.), {xpath_literal(' '.join(text.split()))})"
+    return f".//*[not({_SKIP})][{contains}][not(*[{contains}])]"
+
+
+def xpath_literal(text: str) -> str:
+    """Quote the text as an XPath string literal, even if it has both single and double quotes."""
+    if '"' not in text:
+        return f'"{text}"'
+    if "'" not in text:
+        return f"'{text}'"
+    parts = text.split('"')
+    return "concat(" + ", '\"', ".join(f'"{part}"' for part in parts) + ")"
@@ -1,12 +1,17 @@
+import functools
 import pathlib
+import pkgutil
 
 
+@functools.lru_cache(maxsize=None)
 def read_script_from_file(file_name) -> str:
     """ Get the script string from a file in the scripts directory.
 
     Args:
         file_name: The file name with extension to read from.
 
+    * Scripts are cached after the first read since they are sent on hot paths.
+
     Examples:
         script = read_script_from_file('drag_and_drop.js')
     """
@@ -14,3 +19,18 @@ def read_script_from_file(file_name) -> str:
     with open(path + f'/scripts/{file_name}', 'r', encoding='utf-8') as file:
         script = file.read()
     return script
+
+
+@functools.lru_cache(maxsize=None)
+def read_selenium_atom(file_name) -> str:
+    """ Get the source of a JavaScript atom that ships with Selenium.
+
+    Args:
+        file_name: The file name of the atom, like 'getAttribute.js'.
+
+    * Use it to compute a value in a script exactly like the WebElement command that uses the same atom.
+
+    Examples:
+        atom = read_selenium_atom('getAttribute.js')
+    """
+    return pkgutil.get_data('selenium.webdriver.remote', file_name).decode('utf-8')
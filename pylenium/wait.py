@@ -4,16 +4,56 @@ from typing import Tuple, Optional, Union
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.wait import WebDriverWait
 
+from pylenium import polling
 from pylenium.element import Element, Elements
+from pylenium.polling import PollingStrategy
+from pylenium.stats import Stats, WaitRecord
+
+
+class PollingWait(WebDriverWait):
+    """A WebDriverWait that sleeps between polls according to a PollingStrategy instead of a fixed poll frequency.
+
+    If it has `stats`, each wait is recorded in `stats.waits`.
+    """
+
+    def __init__(
+        self, driver, timeout: float, strategy: PollingStrategy, ignored_exceptions: Optional[Tuple] = None, stats: Optional[Stats] = None
+    ):
+        super().__init__(driver, timeout, ignored_exceptions=ignored_exceptions)
+        self._strategy = strategy
+        self._stats = stats
+
+    def until(self, method, message=""):
+        return polling.poll(
+            lambda: method(self._driver), self._timeout, self._strategy, self._ignored_exceptions, message, record=self._record(method, message)
+        )
+
+    def until_not(self, method, message=""):
+        return polling.poll(
+            lambda: method(self._driver),
+            self._timeout,
+            self._strategy,
+            self._ignored_exceptions,
+            message,
+            negate=True,
+            record=self._record(method, message),
+        )
+
+    def _record(self, method, message: str) -> Optional[WaitRecord]:
+        if self._stats is None:
+            return None
+        return self._stats.record_wait(polling.describe(method), message)
 
 
 class PyleniumWait:
     """The Pylenium version of Wait that returns Element and Elements objects."""
 
+    __slots__ = ("_py", "_webdriver", "_wait")
+
     def __init__(self, py, webdriver, timeout, ignored_exceptions: Optional[Tuple] = None):
         self._py = py
         self._webdriver = webdriver
-        self._wait = WebDriverWait(driver=webdriver, timeout=timeout, ignored_exceptions=ignored_exceptions)
+        self._wait = PollingWait(webdriver, timeout, polling.build_strategy(py.config.driver.polling), ignored_exceptions, py.stats)
 
     def sleep(self, seconds: int):
         """The test will sleep for the given number of seconds.
@@ -90,6 +130,8 @@ class PyleniumWait:
     ) -> Union[WebDriverWait, "PyleniumWait"]:
         """Builds a WebDriverWait or PyleniumWait.
 
+        * Both use the polling strategy in the config. The WebDriverWait is a `PollingWait`.
+
         Args:
             timeout: The number of seconds to wait for the condition to be True
             use_py: True if you want a PyleniumWait. False for a default WebDriverWait
@@ -100,4 +142,6 @@ class PyleniumWait:
         """
         if use_py:
             return PyleniumWait(self._py, self._webdriver, timeout, ignored_exceptions)
-        return WebDriverWait(self._webdriver, timeout, ignored_exceptions=ignored_exceptions)
+        return PollingWait(
+            self._webdriver, timeout, polling.build_strategy(self._py.config.driver.polling), ignored_exceptions, self._py.stats
+        )
@@ -4,9 +4,10 @@ The Pylenium class asks for a PyleniumConfig object to build a WebDriver,
 so the `build_from_config` method is the "main" method in this module.
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from selenium import webdriver
+from selenium.common.exceptions import NoSuchDriverException, WebDriverException
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.edge.service import Service as EdgeService
@@ -14,7 +15,9 @@ from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.safari.service import Service as SafariService
 from selenium.webdriver.remote.webdriver import WebDriver
 
-from pylenium.config import PyleniumConfig
+from pylenium import driver_cache
+from pylenium.config import PyleniumConfig, ViewportConfig
+from pylenium.log import logger as log
 
 
 class Browser:
@@ -109,6 +112,129 @@ def build_options(
     return options
 
 
+def cached_driver_path(browser: str, local_path: Optional[str], browser_options) -> Optional[str]:
+    """Get the driver path for the Service from the local driver cache, so Selenium Manager doesn't resolve it again.
+
+    * The `local_path` always wins if it is given.
+    * If the cache has the browser's path and the options don't have a `binary_location` yet, it is set too.
+    * Use `pylenium drivers prefetch` to fill the cache.
+
+    Args:
+        browser: The name of the browser.
+        local_path: The path to the driver binary from the config.
+        browser_options: The Options object for the browser.
+
+    Returns:
+        The path to the driver, or None to let Selenium Manager resolve it.
+    """
+    if local_path:
+        return local_path
+    cached = driver_cache.lookup(browser)
+    if cached is None:
+        return None
+    if cached["browser_path"] and not getattr(browser_options, "binary_location", None):
+        browser_options.binary_location = cached["browser_path"]
+    return cached["driver_path"]
+
+
+# Parts of the errors when a cached driver doesn't match the browser anymore, or its files are gone
+DRIVER_MISMATCH_ERRORS = ("only supports", "executable", "binary")
+
+
+def is_driver_mismatch(error: Exception) -> bool:
+    """Check if starting a session failed because the cached driver doesn't match the browser or is missing.
+
+    Args:
+        error: The error raised when starting the session.
+    """
+    if isinstance(error, (FileNotFoundError, NoSuchDriverException)):
+        return True
+    message = (getattr(error, "msg", None) or "").lower()
+    return any(part in message for part in DRIVER_MISMATCH_ERRORS)
+
+
+def start_with_cached_driver(browser: str, local_path: Optional[str], browser_options, start: Callable[[Optional[str]], WebDriver]) -> WebDriver:
+    """Start a session with the driver from the local driver cache, or with Selenium Manager if that fails.
+
+    A cached driver can stop matching the browser, like after the browser auto-updates, or its files can be deleted.
+    Then its entry is removed from the cache and the session is started again with the driver that Selenium Manager
+    resolves. Any other error, like a Grid that is down, is raised as is and the cache is kept.
+
+    Args:
+        browser: The name of the browser.
+        local_path: The path to the driver binary from the config.
+        browser_options: The Options object for the browser.
+        start: Starts the WebDriver with the given driver path, or with Selenium Manager if it is None.
+    """
+    binary_location = getattr(browser_options, "binary_location", None)
+    driver_path = cached_driver_path(browser, local_path, browser_options)
+    if local_path or driver_path is None:
+        return start(driver_path)
+    try:
+        return start(driver_path)
+    except (WebDriverException, FileNotFoundError) as e:
+        if not is_driver_mismatch(e):
+            raise
+        log.warning("The cached driver doesn't match %s, so Selenium Manager will resolve it. %s", browser, e)
+        driver_cache.remove(browser)
+        browser_options.binary_location = binary_location or ""
+        return start(None)
+
+
+def build_viewport_options(browser: str, viewport: ViewportConfig, browser_options: Optional[List[str]]) -> List[str]:
+    """Build the browser arguments that start the window at the configured viewport.
+
+    This folds the viewport into the new-session request instead of resizing the window
+    with another round trip after the session starts.
+
+    Args:
+        browser: The name of the browser.
+        viewport: The viewport settings.
+        browser_options: The options/arguments that are already included.
+
+    Usage:
+        options = build_viewport_options("chrome", config.viewport, config.driver.options)
+
+    Returns:
+        The list of arguments to add. An empty list means the viewport can't be folded for this browser
+        and has to be set after the session starts.
+    """
+    browser = browser.lower()
+    if viewport.orientation == "portrait":
+        width, height = viewport.width, viewport.height
+    elif viewport.orientation == "landscape":
+        width, height = viewport.height, viewport.width
+    else:
+        raise ValueError("Orientation must be `portrait` or `landscape`.")
+
+    if browser in (Browser.CHROME, Browser.EDGE):
+        if not viewport.maximize:
+            return [f"--window-size={width},{height}"]
+        # maximized windows are ignored by headless browsers, so they still need maximize_window()
+        if not any("headless" in option for option in browser_options or []):
+            return ["--start-maximized"]
+    elif browser == Browser.FIREFOX:
+        if not viewport.maximize:
+            return [f"--width={width}", f"--height={height}"]
+    return []
+
+
+def build_timeouts_capabilities(page_load_wait_time: int, capabilities: Optional[Dict]) -> Dict:
+    """Fold the page load timeout into the W3C `timeouts` capability of the new-session request.
+
+    Args:
+        page_load_wait_time: The number of seconds to wait for a page load. 0 means the driver's default.
+        capabilities: The dict of capabilities to include.
+
+    Returns:
+        A new dict of capabilities.
+    """
+    caps = dict(capabilities or {})
+    if page_load_wait_time:
+        caps["timeouts"] = {**caps.get("timeouts", {}), "pageLoad": page_load_wait_time * 1000}
+    return caps
+
+
 def build_from_config(config: PyleniumConfig) -> WebDriver:
     """The "main" method for building a WebDriver using PyleniumConfig.
 
@@ -124,8 +250,8 @@ def build_from_config(config: PyleniumConfig) -> WebDriver:
     browser = config.driver.browser.lower()
     remote_url = config.driver.remote_url
     _config = {
-        "options": config.driver.options,
-        "capabilities": config.driver.capabilities,
+        "options": config.driver.options + build_viewport_options(browser, config.viewport, config.driver.options),
+        "capabilities": build_timeouts_capabilities(config.driver.page_load_wait_time, config.driver.capabilities),
         "experimental_options": config.driver.experimental_options,
         "extension_paths": config.driver.extension_paths,
         "webdriver_kwargs": config.driver.webdriver_kwargs,
@@ -178,16 +304,13 @@ def build_chrome(
     for cap in caps:
         browser_options.set_capability(cap, caps[cap])
 
-    driver = webdriver.Chrome(
-        options=browser_options,
-        service=ChromeService(local_path or None),
-        **(webdriver_kwargs or {}),
+    return start_with_cached_driver(
+        Browser.CHROME,
+        local_path,
+        browser_options,
+        lambda driver_path: webdriver.Chrome(options=browser_options, service=ChromeService(driver_path), **(webdriver_kwargs or {})),
     )
 
-    # enable Performance Metrics from Chrome Dev Tools
-    driver.execute_cdp_cmd("Performance.enable", {})
-    return driver
-
 
 def build_edge(
     options: Optional[List[str]],
@@ -215,10 +338,11 @@ def build_edge(
     for cap in caps:
         browser_options.set_capability(cap, caps[cap])
 
-    return webdriver.Edge(
-        service=EdgeService(local_path or None),
-        options=browser_options,
-        **(webdriver_kwargs or {}),
+    return start_with_cached_driver(
+        Browser.EDGE,
+        local_path,
+        browser_options,
+        lambda driver_path: webdriver.Edge(service=EdgeService(driver_path), options=browser_options, **(webdriver_kwargs or {})),
     )
 
 
@@ -281,10 +405,11 @@ def build_firefox(
     for cap in caps:
         browser_options.set_capability(cap, caps[cap])
 
-    return webdriver.Firefox(
-        options=browser_options,
-        service=FirefoxService(local_path or None),
-        **(webdriver_kwargs or {}),
+    return start_with_cached_driver(
+        Browser.FIREFOX,
+        local_path,
+        browser_options,
+        lambda driver_path: webdriver.Firefox(options=browser_options, service=FirefoxService(driver_path), **(webdriver_kwargs or {})),
     )
 
 
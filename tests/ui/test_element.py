@@ -31,12 +31,35 @@ def test_find_in_element_context(py: Pylenium):
     assert items.should().have_length(5)
 
 
+def test_contains_text_split_across_elements(py: Pylenium):
+    py.visit(f"{THE_INTERNET}/dropdown")
+    footer = py.contains("Powered by Elemental Selenium")
+    assert footer.get_attribute("style") == "text-align: center;"
+    assert footer.contains("Elemental Selenium").tag_name() == "a"
+
+
 def test_children(py: Pylenium):
     py.visit(f"{THE_INTERNET}/dropdown")
     options = py.get("#dropdown").children()
     assert options.should().have_length(3)
 
 
+def test_elements_bulk_values(py: Pylenium):
+    py.visit(f"{THE_INTERNET}/dropdown")
+    options = py.find("#dropdown > option")
+    assert options.texts() == ["Please select an option", "Option 1", "Option 2"]
+    assert options.attributes("value") == ["", "1", "2"]
+    assert options.properties("index") == [0, 1, 2]
+
+
+@pytest.mark.parametrize("css, attribute", [("a", "href"), ("input", "checked"), ("input", "type")])
+def test_bulk_values_match_single_element_commands(py: Pylenium, css, attribute):
+    py.visit(f"{THE_INTERNET}/checkboxes" if css == "input" else THE_INTERNET)
+    elements = py.find(css)
+    assert elements.attributes(attribute) == [element.get_attribute(attribute) for element in elements]
+    assert elements.texts() == [element.text() for element in elements]
+
+
 def test_forced_click(py: Pylenium):
     py.visit(f"{DEMO_QA}/checkbox")
     # without forcing, this raises ElementNotInteractableException
@@ -44,6 +67,18 @@ def test_forced_click(py: Pylenium):
     assert py.get("#result").should().contain_text("You have selected")
 
 
+def test_click_waits_for_overlay_to_go_away(py: Pylenium):
+    py.visit(f"{THE_INTERNET}/add_remove_elements/")
+    py.execute_script(
+        "let overlay = document.createElement('div');"
+        "overlay.style = 'position: fixed; inset: 0; z-index: 1000';"
+        "document.body.appendChild(overlay);"
+        "setTimeout(() => overlay.remove(), 1000);"
+    )
+    py.get("button").click()
+    assert py.find(".added-manually").should().have_length(1)
+
+
 def test_element_should_be_clickable(py: Pylenium):
     py.visit(f"{DEMO_QA}/buttons")
     assert py.contains("Click Me").should().be_clickable()
@@ -60,6 +95,17 @@ def test_element_should_be_visible(py: Pylenium):
     assert py.contains("Click Me").should().be_visible()
 
 
+def test_element_should_meet_all_conditions(py: Pylenium):
+    py.visit(f"{DEMO_QA}/text-box")
+    assert py.get("#userName-label").should().all(visible=True, text="Full Name", attr={"id": "userName-label"})
+
+
+def test_element_should_report_every_failed_condition(py: Pylenium):
+    py.visit(f"{DEMO_QA}/text-box")
+    with pytest.raises(AssertionError, match="2 of 3 conditions failed"):
+        py.get("#userName-label").should(timeout=3).all(visible=True, text="Email", class_name="nope")
+
+
 def test_element_should_be_hidden(py: Pylenium):
     py.visit(f"{THE_INTERNET}/hovers")
     assert py.get("[href='/users/1']").should().be_hidden()
@@ -98,6 +98,35 @@ def test_switch_to_frame_by_element_then_back(py: Pylenium):
     assert py.get("h2").should().contain_text("iFrame Example List")
 
 
+def test_find_in_all_frames(py: Pylenium):
+    py.visit(f"{TEST_PAGES}/styled/iframes-test.html")
+    headings = py.find("h1", frames="all")
+    assert headings.length() > 1
+    nested = [h1 for h1 in headings if h1.frame_path]
+    assert nested[0].should().contain_text("Nested Page Example")
+    assert py.get("h1", frames="all").should().contain_text("iFrames Example")
+
+
+def test_get_with_piercing_selector(py: Pylenium):
+    py.visit(f"{THE_INTERNET}/shadowdom")
+    assert py.get("my-paragraph >>> p").tag_name() == "p"
+    assert py.find("my-paragraph >>> slot").length() == 2
+
+
+def test_wait_for_network_idle_and_dom_stable(py: Pylenium):
+    py.visit(f"{THE_INTERNET}/dynamic_loading/2")
+    py.get("#start button").click()
+    py.wait_for_dom_stable(quiet_ms=1000, timeout=15).wait_for_network_idle()
+    assert py.get("#finish").should().have_text("Hello World!")
+
+
+def test_navigation_with_wait_until(py: Pylenium):
+    py.visit(f"{THE_INTERNET}/", wait_until="domcontentloaded")
+    py.visit(f"{THE_INTERNET}/checkboxes", wait_until="load")
+    py.go("back", wait_until="load").should().have_url(f"{THE_INTERNET}/")
+    py.reload(wait_until="networkidle").should().have_url(f"{THE_INTERNET}/")
+
+
 def test_have_url(py: Pylenium):
     py.visit("https://qap.dev")
     py.should().have_url("https://www.qap.dev/")
@@ -120,6 +149,27 @@ def test_should_not_find(py: Pylenium):
     assert py.should().not_contain("foobar")
 
 
+def test_batch(py: Pylenium):
+    py.visit(f"{THE_INTERNET}/login")
+    with py.batch() as batch:
+        batch.type("#username", "tomsmith", clear=True)
+        batch.type("#password", "SuperSecretPassword!", clear=True)
+        batch.click("button[type='submit']")  # submits the form, so the next step runs on /secure
+        message = batch.text("#flash")
+    assert py.url().endswith("/secure")
+    assert "You logged into a secure area!" in message.value
+
+
+def test_snapshot(py: Pylenium):
+    py.visit(f"{THE_INTERNET}/tables")
+    snapshot = py.snapshot()
+    assert snapshot.find("#table1 tbody tr").length() == 4
+    assert snapshot.get("#table1 tbody tr:first-child td").text() == "Smith"
+    assert not snapshot.is_stale()
+    py.execute_script("document.body.appendChild(document.createElement('div'));")
+    assert snapshot.is_stale()
+
+
 def test_axe_run(py: Pylenium):
     py.visit("https://qap.dev")
     axe = PyleniumAxe(py.webdriver)
@@ -0,0 +1,126 @@
+import json
+import shutil
+import subprocess
+from typing import Sequence, Union
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylenium import utils
+from pylenium.config import PyleniumConfig
+from pylenium.driver import Pylenium
+
+# Just enough of a DOM to run the text scripts in node: elements, text nodes and a TreeWalker
+FAKE_DOM = """
+class FakeElement {
+    constructor(tagName, id, childNodes) {
+        this.tagName = tagName;
+        this.id = id;
+        this.childNodes = childNodes;
+        this.isConnected = true;
+        childNodes.forEach((child) => { child.parentElement = this; });
+    }
+    get firstElementChild() {
+        return this.childNodes.find((child) => child.tagName) || null;
+    }
+    get nextElementSibling() {
+        let siblings = this.parentElement ? this.parentElement.childNodes : [];
+        return siblings.slice(siblings.indexOf(this) + 1).find((child) => child.tagName) || null;
+    }
+    checkVisibility() {
+        return !this.hidden;
+    }
+    get textContent() {
+        return this.childNodes.map((child) => child.tagName ? child.textContent : child.data).join('');
+    }
+    contains(other) {
+        for (let node = other; node; node = node.parentElement) {
+            if (node === this) {
+                return true;
+            }
+        }
+        return false;
+    }
+}
+const el = (tagName, id, ...childNodes) => new FakeElement(tagName, id, childNodes);
+const text = (data) => ({data: data, parentElement: null});
+const NodeFilter = {SHOW_TEXT: 4, FILTER_ACCEPT: 1, FILTER_REJECT: 2};
+const window = {addEventListener: () => {}, removeEventListener: () => {}};
+const document = {
+    querySelector: (css) => byId(css.slice(1)),
+    addEventListener: () => {},
+    removeEventListener: () => {},
+    createTreeWalker: (root, _, filter) => {
+        let nodes = [];
+        (function walk(node) {
+            node.childNodes.forEach((child) => {
+                if (child.tagName) {
+                    walk(child);
+                } else if (!filter || filter.acceptNode(child) === NodeFilter.FILTER_ACCEPT) {
+                    nodes.push(child);
+                }
+            });
+        })(root === document ? document.documentElement : root);
+        let i = -1;
+        return {nextNode() { this.currentNode = nodes[++i]; return this.currentNode || null; }};
+    },
+};
+class MutationObserver {
+    observe() {}
+    disconnect() {}
+}
+const output = (result) => console.log(JSON.stringify(result, (_, value) => value && value.tagName ? value.id : value));
+document.body = %s;
+document.documentElement = el('HTML', 'html', document.body);
+const byId = (id, node = document.documentElement) => node.id === id ? node : node.childNodes.filter((child) => child.tagName)
+    .map((child) => byId(id, child)).find((found) => found) || null;
+const resolve = (arg) => Array.isArray(arg) ? arg.map(resolve) : arg && arg.element ? byId(arg.element) : arg;
+const result = (function() { %s }).apply(null, JSON.parse(process.argv[1]).map(resolve).concat([output]));
+if (result !== undefined) {
+    output(result);
+}
+"""
+
+
+@pytest.fixture
+def run_in_page():
+    """Run one of Pylenium's scripts with node against a fake DOM.
+
+    The body is a JS expression built with `el(tagName, id, ...children)` and `text(data)`. Only `#id` selectors
+    are supported. An argument like
+    `{"element": "save"}` is passed as the element with that id. The result, or the value passed to the callback
+    of an async script, is returned, with elements as their id. Several script names are run as one script.
+    """
+    if shutil.which("node") is None:
+        pytest.skip("needs node to run the script")
+
+    def run(script_names: Union[str, Sequence[str]], body: str, *args):
+        if isinstance(script_names, str):
+            script_names = [script_names]
+        source = "".join(utils.read_script_from_file(name) for name in script_names)
+        script = FAKE_DOM % (body, source)
+        output = subprocess.run(["node", "-e", script, json.dumps(args)], capture_output=True, text=True, check=True)
+        return json.loads(output.stdout)
+
+    return run
+
+
+@pytest.fixture
+def driver() -> MagicMock:
+    """A mocked WebDriver for the `py` fixture."""
+    return MagicMock()
+
+
+@pytest.fixture
+def py(driver: MagicMock) -> Pylenium:
+    """A Pylenium with the default config and a started session on the mocked `driver`.
+
+    In the unit tests, this replaces the `py` fixture that opens a real browser.
+    Waits poll every 10ms so the tests that wait stay fast. Change `py.config` in a test to try other settings.
+    """
+    config = PyleniumConfig()
+    config.driver.polling.initial = 0.01
+    config.driver.polling.maximum = 0.01
+    py = Pylenium(config, driver_factory=lambda _: driver)
+    py.webdriver  # start the session
+    return py
@@ -0,0 +1,84 @@
+import json
+import shutil
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import ElementClickInterceptedException, ElementNotInteractableException
+from selenium.webdriver.remote.webelement import WebElement
+
+from pylenium import utils
+from pylenium.element import Element
+
+# Runs actionability.js with node against a hidden, zero-sized element
+HIDDEN_ELEMENT = """
+const window = {getComputedStyle: () => ({display: 'none', visibility: 'visible'}), innerWidth: 800, innerHeight: 600};
+const document = {elementFromPoint: () => null};
+const requestAnimationFrame = (fn) => setTimeout(fn, 0);
+const rect = {x: 0, y: 0, left: 0, top: 0, width: 0, height: 0};
+const element = {
+    tagName: 'INPUT', type: process.argv[1], isConnected: true, readOnly: false,
+    matches: () => false, getAttribute: () => null, getBoundingClientRect: () => rect, scrollIntoView: () => {},
+};
+(function() { %s }).apply(null, [element, JSON.parse(process.argv[2]), 0, (result) => console.log(JSON.stringify(result))]);
+"""
+
+
+@pytest.fixture
+def webelement() -> MagicMock:
+    return MagicMock(spec=WebElement)
+
+
+@pytest.fixture
+def element(py, webelement) -> Element:
+    return Element(py, webelement, locator=None)
+
+
+def test_click_waits_until_the_element_is_actionable(element, driver, webelement):
+    driver.execute_async_script.side_effect = [{"actionable": False, "reason": "still moving"}, {"actionable": True}]
+    element.click()
+    assert driver.execute_async_script.call_count == 2
+    _, target, checks, _ = driver.execute_async_script.call_args.args
+    assert target is webelement
+    assert "receives_events" in checks
+    webelement.click.assert_called_once()
+
+
+def test_covered_element_is_not_clicked(py, element, driver, webelement):
+    py.config.driver.wait_mode = "observer"
+    driver.execute_async_script.return_value = {"actionable": False, "reason": "covered by <div#overlay>"}
+    with pytest.raises(ElementClickInterceptedException, match="div#overlay"):
+        element.click()
+    driver.execute_async_script.assert_called_once()
+    webelement.click.assert_not_called()
+
+
+def test_type_into_a_disabled_element(py, element, driver, webelement):
+    py.config.driver.wait_mode = "observer"
+    driver.execute_async_script.return_value = {"actionable": False, "reason": "disabled"}
+    with pytest.raises(ElementNotInteractableException):
+        element.type("hello")
+    _, _, checks, _ = driver.execute_async_script.call_args.args
+    assert "editable" in checks and "receives_events" not in checks
+    webelement.send_keys.assert_not_called()
+
+
+def test_force_click_skips_the_checks(element, driver):
+    element.click(force=True)
+    driver.execute_async_script.assert_not_called()
+
+
+def test_checks_can_be_turned_off(py, element, driver, webelement):
+    py.config.driver.actionability = False
+    element.click()
+    driver.execute_async_script.assert_not_called()
+    webelement.click.assert_called_once()
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node to run the script")
+@pytest.mark.parametrize("input_type, actionable", [("file", True), ("text", False)])
+def test_hidden_file_inputs_can_be_typed_into(input_type, actionable):
+    script = HIDDEN_ELEMENT % utils.read_script_from_file("actionability.js")
+    checks = json.dumps(["attached", "visible", "enabled", "editable", "stable", "receives_events"])
+    output = subprocess.run(["node", "-e", script, input_type, checks], capture_output=True, text=True, check=True).stdout
+    assert json.loads(output)["actionable"] is actionable
@@ -0,0 +1,82 @@
+""" Allocation benchmark for the wrapper classes that are created on almost every command.
+
+`Element`, `Elements`, `ElementShould`, `ElementsShould`, `ElementWait`, `PyleniumWait` and `PyleniumShould`
+use `__slots__`, so they don't carry a per-instance `__dict__`. The "before" numbers come from copies of the classes
+rebuilt without `__slots__`, which is the layout the classes had before.
+
+Run with `-s` to see the numbers.
+"""
+
+import tracemalloc
+from unittest.mock import MagicMock
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from pylenium.driver import PyleniumShould
+from pylenium.element import Element, Elements, ElementShould, ElementsShould, ElementWait
+from pylenium.wait import PyleniumWait
+
+COUNT = 5000
+
+
+def _bytes_per_call(build) -> float:
+    build()  # warm up caches
+    kept = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(COUNT):
+        kept.append(build())
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return allocated / COUNT
+
+
+def _without_slots(cls):
+    """The same class, but with the attributes in a per-instance `__dict__` instead of `__slots__`."""
+    slots = set(cls.__slots__) | {"__slots__", "__new__", "__dict__"}
+    namespace = {name: value for name, value in vars(cls).items() if name not in slots}
+    return type(f"{cls.__name__}WithDict", cls.__bases__, namespace)
+
+
+def test_wrappers_have_no_instance_dict(py):
+    element = Element(py, MagicMock(spec=WebElement), None)
+    instances = [
+        element,
+        Elements(py, [], None),
+        ElementShould(py, element, 1),
+        ElementsShould(py, Elements(py, [], None), 1),
+        ElementWait(element.webelement, 1),
+        PyleniumWait(py, py.webdriver, 1),
+        PyleniumShould(py, 1),
+    ]
+    for instance in instances:
+        assert not hasattr(instance, "__dict__"), type(instance).__name__
+
+
+def test_allocations_per_wrapper(py):
+    element = Element(py, MagicMock(spec=WebElement), None)
+    builders = {
+        Element: lambda cls: cls(py, None, ("css selector", "#id")),
+        ElementShould: lambda cls: cls(py, element, 1),
+        PyleniumShould: lambda cls: cls(py, 1),
+    }
+    print()
+    for cls, build in builders.items():
+        with_dict = _without_slots(cls)
+        after = _bytes_per_call(lambda: build(cls))
+        before = _bytes_per_call(lambda: build(with_dict))
+        print(f"{cls.__name__}: {before:.0f} bytes before, {after:.0f} bytes after")
+        assert after < before
+
+
+def test_allocations_per_command(py, driver):
+    driver.find_element.return_value = MagicMock(spec=WebElement)
+    after = _bytes_per_call(lambda: py.get("#id", timeout=0).should(timeout=1))
+    print(f"\npy.get().should(): {after:.0f} bytes per command")
+
+
+def test_sub_apis_are_cached(py):
+    assert py.switch_to is py.switch_to
+    assert py.performance is py.performance
+    assert py.cdp is py.cdp
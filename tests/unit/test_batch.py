@@ -0,0 +1,106 @@
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import JavascriptException, NoSuchElementException
+from selenium.webdriver.remote.webelement import WebElement
+
+from pylenium.element import Element
+
+
+def test_batch_runs_every_step_in_one_script(py, driver):
+    webelement = MagicMock(spec=WebElement)
+    driver.execute_async_script.return_value = {"results": [None, None, "Welcome", webelement], "error": None}
+    with py.batch() as batch:
+        batch.type("#username", "tomsmith", clear=True)
+        batch.click("button")
+        message = batch.text("#flash")
+        form = batch.get("form")
+    assert py.webdriver.execute_async_script.call_count == 1
+    steps = py.webdriver.execute_async_script.call_args[0][1]
+    assert [step["command"] for step in steps] == ["type", "click", "text", "get"]
+    assert steps[0]["args"] == {"text": "tomsmith", "clear": True}
+    assert message.value == "Welcome"
+    assert isinstance(form.value, Element)
+    assert form.value.locator == ("css selector", "form")
+
+
+def test_batch_failure_maps_back_to_the_step(py, driver):
+    driver.execute_async_script.return_value = {"results": [None], "error": {"index": 1, "kind": "not_found", "message": "could not find it"}}
+    with pytest.raises(NoSuchElementException, match="step 2 `click\\('#missing'\\)` failed: could not find it"):
+        with py.batch() as batch:
+            first = batch.type("#username", "tomsmith")
+            second = batch.click("#missing")
+            third = batch.check("#terms")
+    assert first.done
+    assert not second.done
+    assert not third.done
+
+
+def test_batch_does_not_run_if_the_block_raises(py, driver):
+    driver.execute_async_script.return_value = {"results": [], "error": None}
+    with pytest.raises(KeyError):
+        with py.batch() as batch:
+            batch.click("button")
+            raise KeyError("oops")
+    py.webdriver.execute_async_script.assert_not_called()
+
+
+def test_batch_select_needs_one_option(py, driver):
+    driver.execute_async_script.return_value = {"results": [], "error": None}
+    with pytest.raises(ValueError):
+        py.batch().select("#role", value="1", text="Admin")
+
+
+def test_batch_runs_the_steps_after_a_navigation_in_a_new_script(py):
+    py.webdriver.execute_async_script.side_effect = [
+        {"results": [None, None], "error": None, "navigated": 1},
+        JavascriptException("javascript error: document unloaded while waiting for result"),
+        {"results": [], "error": None, "navigated": -1},
+        {"results": ["Welcome"], "error": None, "navigated": None},
+    ]
+    with py.batch() as batch:
+        batch.type("#username", "tomsmith")
+        batch.click("button[type='submit']")
+        message = batch.text("#flash")
+    calls = py.webdriver.execute_async_script.call_args_list
+    assert len(calls) == 4
+    assert [step["command"] for step in calls[-1][0][1]] == ["text"]
+    assert message.value == "Welcome"
+
+
+def test_batch_does_not_retry_an_unload_before_a_navigation_was_seen(py):
+    py.webdriver.execute_async_script.side_effect = JavascriptException("javascript error: document unloaded while waiting for result")
+    with pytest.raises(JavascriptException):
+        with py.batch() as batch:
+            batch.click("button[type='submit']")
+    assert py.webdriver.execute_async_script.call_count == 1
+
+
+def test_batch_backs_off_while_the_old_page_unloads(monkeypatch, py):
+    sleeps = []
+    monkeypatch.setattr("pylenium.batch.time.sleep", sleeps.append)
+    py.webdriver.execute_async_script.side_effect = [
+        {"results": [None], "error": None, "navigated": 0},
+        {"results": [], "error": None, "navigated": -1},
+        {"results": [], "error": None, "navigated": -1},
+        {"results": ["Welcome"], "error": None, "navigated": None},
+    ]
+    with py.batch() as batch:
+        batch.click("button[type='submit']")
+        message = batch.text("#flash")
+    assert sleeps == [0.01, 0.01]
+    assert message.value == "Welcome"
+
+
+UNLOADING_BODY = "(window.__pyleniumBatchUnloading = Date.now() - %s, el('BODY', 'body', el('P', 'flash', text('Welcome'))))"
+
+
+@pytest.mark.parametrize("unloaded_ms_ago, response", [
+    (100, {"results": [], "error": None, "navigated": -1}),
+    (60000, {"results": ["Welcome"], "error": None, "navigated": None}),
+])
+def test_batch_script_only_waits_for_a_recent_unload(run_in_page, unloaded_ms_ago, response):
+    # a download or a cancelled navigation fires beforeunload too, and then the document stays
+    steps = [{"command": "text", "css": "#flash", "args": {}}]
+    body = UNLOADING_BODY % unloaded_ms_ago
+    assert run_in_page(["element_text.js", "batch.js"], body, steps, 10000) == response
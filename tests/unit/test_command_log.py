@@ -0,0 +1,83 @@
+import json
+import threading
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from pylenium.command_log import FILENAME, CommandLog
+from pylenium.log import logger as log
+
+
+class FakeDriver:
+    def execute(self, driver_command, params=None):
+        if driver_command == "findElement" and params["value"] == "#missing":
+            raise NoSuchElementException("no such element: Unable to locate element\n  (Session info: chrome)")
+        return {"value": None}
+
+
+def test_commands_are_recorded_with_their_outcome():
+    command_log = CommandLog()
+    driver = FakeDriver()
+    command_log.attach(driver)
+    log.command("py.get() - Find the element with CSS: `%s`", "#missing")
+    with pytest.raises(NoSuchElementException):
+        driver.execute("findElement", {"using": "css selector", "value": "#missing"})
+    driver.execute("getTitle")
+    first, second = command_log.records()
+    assert first["command"] == "py.get() - Find the element with CSS: `#missing`"
+    assert first["webdriver"] == "findElement"
+    assert first["outcome"] == "NoSuchElementException: Message: no such element: Unable to locate element"
+    assert second["outcome"] == "ok"
+    assert second["params"] is None
+
+
+def test_only_the_last_commands_are_kept():
+    command_log = CommandLog(size=3)
+    driver = FakeDriver()
+    command_log.attach(driver)
+    for i in range(5):
+        driver.execute("executeScript", {"script": str(i)})
+    assert [record["params"]["script"] for record in command_log.records()] == ["2", "3", "4"]
+
+
+def test_reused_driver_is_attached_to_the_new_log():
+    driver = FakeDriver()
+    old, new = CommandLog(), CommandLog()
+    old.attach(driver)
+    new.attach(driver)
+    driver.execute("getTitle")
+    assert len(old) == 0
+    assert len(new) == 1
+
+
+def test_write_on_failure(tmp_path):
+    command_log = CommandLog()
+    driver = FakeDriver()
+    command_log.attach(driver)
+    driver.execute("executeScript", {"script": "x" * 1000, "args": []})
+    path = command_log.write(tmp_path / "test_failed")
+    assert path.name == FILENAME
+    (record,) = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(record["params"]["script"]) == 203
+    command_log.clear()
+    assert command_log.write(tmp_path / "test_passed") is None
+
+
+def test_turned_off():
+    command_log = CommandLog(size=0)
+    driver = FakeDriver()
+    command_log.attach(driver)
+    assert "execute" not in vars(driver)
+
+
+def test_commands_are_only_tagged_with_the_last_command_of_their_thread():
+    log.command("py.visit() - Visit URL: `%s`", "https://qap.dev")  # in a previous test
+    command_log = CommandLog()
+    driver = FakeDriver()
+    command_log.attach(driver)
+    driver.execute("getTitle")
+    log.command("py.title() - Get the current page title")
+    thread = threading.Thread(target=driver.execute, args=("getCurrentUrl",))
+    thread.start()
+    thread.join()
+    assert [record["command"] for record in command_log.records()] == [None, None]
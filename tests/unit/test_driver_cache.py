@@ -0,0 +1,83 @@
+import os
+import time
+
+import pytest
+
+from pylenium import driver_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(driver_cache.CACHE_FILE_ENV, str(tmp_path.joinpath("drivers.json")))
+    return tmp_path
+
+
+def test_empty_cache(cache_dir):
+    assert driver_cache.read() == {}
+    assert driver_cache.lookup("chrome") is None
+
+
+def test_prefetch_then_lookup(cache_dir, monkeypatch):
+    driver = cache_dir.joinpath("chromedriver")
+    driver.write_text("")
+    monkeypatch.setattr(driver_cache, "resolve", lambda browser: {"driver_path": str(driver), "browser_path": ""})
+    driver_cache.prefetch(["chrome"])
+    assert driver_cache.lookup("chrome")["driver_path"] == str(driver)
+    assert not cache_dir.joinpath("drivers.json.lock").exists()
+
+
+def test_missing_driver_is_ignored(cache_dir):
+    driver_cache.write({"firefox": {"driver_path": str(cache_dir.joinpath("gone")), "browser_path": ""}})
+    assert "firefox" in driver_cache.read()
+    assert driver_cache.lookup("firefox") is None
+
+
+def test_write_merges_entries(cache_dir):
+    driver_cache.write({"chrome": {"driver_path": "a", "browser_path": ""}})
+    driver_cache.write({"edge": {"driver_path": "b", "browser_path": ""}})
+    assert set(driver_cache.read()) == {"chrome", "edge"}
+    driver_cache.clear()
+    assert driver_cache.read() == {}
+
+
+def test_updated_browser_is_not_looked_up(cache_dir, monkeypatch):
+    driver = cache_dir.joinpath("chromedriver")
+    driver.write_text("")
+    browser = cache_dir.joinpath("chrome")
+    browser.write_text("")
+    monkeypatch.setattr(driver_cache, "resolve", lambda _: {"driver_path": str(driver), "browser_path": str(browser)})
+    monkeypatch.setattr(driver_cache, "version", lambda path: "120.0.1" if path else "")
+    driver_cache.prefetch(["chrome"])
+    assert driver_cache.read()["chrome"]["browser_version"] == "120.0.1"
+    assert driver_cache.lookup("chrome") is not None
+
+    # the browser auto-updates
+    os.utime(browser, (time.time() + 10, time.time() + 10))
+    monkeypatch.setattr(driver_cache, "version", lambda path: "121.0.0")
+    assert driver_cache.lookup("chrome") is None
+
+
+def test_entries_without_versions_are_not_looked_up(cache_dir):
+    driver = cache_dir.joinpath("chromedriver")
+    driver.write_text("")
+    driver_cache.write({"chrome": {"driver_path": str(driver), "browser_path": ""}})
+    assert driver_cache.lookup("chrome") is None
+
+
+def test_stale_lock_is_broken(cache_dir):
+    lock = cache_dir.joinpath("drivers.json.lock")
+    lock.write_text("")
+    os.utime(lock, (time.time() - 300, time.time() - 300))
+    driver_cache.write({"chrome": {"driver_path": "a", "browser_path": ""}})
+    assert "chrome" in driver_cache.read()
+    assert not lock.exists()
+    assert not cache_dir.joinpath("drivers.json.lock.break").exists()
+
+
+def test_fresh_lock_is_not_broken(cache_dir):
+    lock = cache_dir.joinpath("drivers.json.lock")
+    lock.write_text("")
+    with pytest.raises(TimeoutError):
+        with driver_cache._lock(cache_dir.joinpath("drivers.json"), timeout=0.1):
+            pass
+    assert lock.exists()
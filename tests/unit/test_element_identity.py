@@ -0,0 +1,37 @@
+import gc
+
+from pylenium.element import Element, Elements
+
+
+class FakeWebElement:
+    def __init__(self, id_):
+        self.id = id_
+
+
+def test_elements_are_interned_by_webelement_id(py):
+    first = Element(py, FakeWebElement("a"), None)
+    again = Element(py, FakeWebElement("a"), ("css selector", "#a"))
+    assert again is first
+    assert first.locator == ("css selector", "#a")
+    assert Element(py, FakeWebElement("b"), None) is not first
+
+
+def test_interned_elements_keep_their_locator(py):
+    first = Element(py, FakeWebElement("a"), ("css selector", "#a"))
+    Element(py, FakeWebElement("a"), ("xpath", "//div"))
+    assert first.locator == ("css selector", "#a")
+
+
+def test_elements_can_be_deduplicated(py):
+    webelements = [FakeWebElement(id_) for id_ in "abcab"]
+    elements = Elements(py, webelements, ("css selector", "li"))
+    assert len(set(elements)) == 3
+    assert elements[0] == elements[3]
+    assert elements[0] is elements[3]
+    assert set(elements[:2]) & set(elements[3:]) == {elements[0], elements[1]}
+
+
+def test_interned_elements_are_released(py):
+    Element(py, FakeWebElement("a"), None)
+    gc.collect()
+    assert len(py._elements) == 0
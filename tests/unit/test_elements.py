@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock
+
+from pylenium.element import Element, Elements
+
+
+def build_elements(count: int) -> Elements:
+    return Elements(MagicMock(), [f"webelement-{i}" for i in range(count)], ("css selector", "tr"))
+
+
+def test_elements_wrap_on_access():
+    elements = build_elements(3)
+    assert len(elements) == 3
+    assert elements.length() == 3
+    assert isinstance(elements[1], Element)
+    assert elements[1].webelement == "webelement-1"
+    assert elements.first().webelement == "webelement-0"
+    assert elements.last().webelement == "webelement-2"
+    assert [e.webelement for e in elements] == ["webelement-0", "webelement-1", "webelement-2"]
+    assert [e.webelement for e in reversed(elements)] == ["webelement-2", "webelement-1", "webelement-0"]
+
+
+def test_elements_slices_share_webelements():
+    elements = build_elements(10)
+    view = elements[2:8:2]
+    assert isinstance(view, Elements)
+    assert view._handles is elements._handles
+    assert view.locator == elements.locator
+    assert [e.webelement for e in view] == ["webelement-2", "webelement-4", "webelement-6"]
+    assert view[-1].webelement == "webelement-6"
+    assert [e.webelement for e in view[1:]] == ["webelement-4", "webelement-6"]
+
+
+def test_elements_behave_like_a_list():
+    elements = build_elements(2)
+    assert elements
+    assert not build_elements(0)
+    assert build_elements(0).is_empty()
+    assert "webelement-1" in elements
+    assert elements[0] in elements
+    assert elements == build_elements(2)
+    assert elements != build_elements(3)
+    assert len(list(elements)) == 2
+
+
+def test_bulk_values_use_one_script():
+    elements = build_elements(4)
+    elements._py.webdriver.execute_script.return_value = ["true", "false", None, "x"]
+    assert elements[:4].attributes("data-on") == [True, False, None, "x"]
+    assert elements._py.webdriver.execute_script.call_count == 1
+    _, kind, name, webelements = elements._py.webdriver.execute_script.call_args[0]
+    assert (kind, name, webelements) == ("attribute", "data-on", ["webelement-0", "webelement-1", "webelement-2", "webelement-3"])
+    script = elements._py.webdriver.execute_script.call_args[0][0]
+    assert script.startswith("const getAttribute = ")  # the same atom as WebElement.get_attribute()
+    assert build_elements(0).texts() == []
+
+
+def test_list_methods_see_every_element():
+    elements = build_elements(3)
+    assert len(elements + elements) == 6
+    assert len([] + elements) == 3
+    assert len(elements * 2) == 6
+    assert elements.index(elements[1]) == 1
+    assert elements.count(elements[2]) == 1
+    elements.append(Element(elements._py, "webelement-3", None))
+    assert len(elements) == 4
+    assert [e.webelement for e in elements.copy()] == ["webelement-0", "webelement-1", "webelement-2", "webelement-3"]
+    assert elements.pop().webelement == "webelement-3"
+    elements[0] = elements[2]
+    assert [e.webelement for e in elements] == ["webelement-2", "webelement-1", "webelement-2"]
+    assert "webelement-1" in elements
+    elements.sort(key=lambda e: e.webelement)
+    assert elements.first().webelement == "webelement-1"
+    assert [e.webelement for e in elements[1:]] == ["webelement-2", "webelement-2"]
+
+
+# innerText of a paragraph with a non-breaking space, indented lines, and a hidden element
+TEXT_BODY = """el('BODY', 'body',
+    Object.assign(el('P', 'price', text('x')), {innerText: '  Total:\\u00a042  '}),
+    Object.assign(el('P', 'address', text('x')), {innerText: '  1 Main St  \\n   Springfield '}),
+    Object.assign(el('P', 'hidden', text('x')), {innerText: 'Secret', hidden: true}))"""
+
+
+def test_bulk_texts_and_conditions_read_text_the_same_way(run_in_page):
+    ids = ["price", "address", "hidden"]
+    expected = ["Total: 42", "1 Main St\nSpringfield", ""]
+    elements = [{"element": id_} for id_ in ids]
+    assert run_in_page(["element_text.js", "bulk_values.js"], TEXT_BODY, "text", "", elements) == expected
+    for id_, text in zip(ids, expected):
+        results = run_in_page(["element_text.js", "check_conditions.js"], TEXT_BODY, {"element": id_}, {"text": text})
+        assert results == {"text": [True, text]}
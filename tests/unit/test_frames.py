@@ -0,0 +1,99 @@
+from unittest.mock import MagicMock, call
+
+import pytest
+from selenium.webdriver.remote.webelement import WebElement
+
+
+def test_get_in_a_nested_frame(py, driver):
+    in_frame = MagicMock(spec=WebElement)
+    driver.execute_script.return_value = {"path": [1, 0], "index": 0, "element": None}
+    driver.find_elements.return_value = [in_frame]
+    element = py.get("#save", frames="all")
+    assert element.frame_path == (1, 0)
+    assert element.webelement is in_frame
+    assert driver.switch_to.frame.call_args_list == [call(1), call(0)]
+
+    # a search without frames runs in the main document again
+    driver.switch_to.reset_mock()
+    py.get("#other")
+    driver.switch_to.default_content.assert_called_once()
+    driver.switch_to.frame.assert_not_called()
+
+    # and using the element again switches back to its frame
+    driver.switch_to.reset_mock()
+    element.click()
+    driver.switch_to.default_content.assert_called_once()
+    assert driver.switch_to.frame.call_args_list == [call(1), call(0)]
+    in_frame.click.assert_called_once()
+
+
+def test_navigation_resets_the_frame(py, driver):
+    driver.execute_script.return_value = {"path": [0], "index": 0, "element": None}
+    driver.find_elements.return_value = [MagicMock(spec=WebElement)]
+    py.get("#save", frames="all")
+    py.reload()
+    driver.switch_to.reset_mock()
+    py.get("#other")
+    driver.switch_to.default_content.assert_not_called()
+
+
+def test_get_in_the_main_document_does_not_switch(py, driver):
+    webelement = MagicMock(spec=WebElement)
+    driver.execute_script.return_value = {"path": [], "index": 0, "element": webelement}
+    element = py.get("#save", frames="all", timeout=0)
+    assert element.frame_path == ()
+    assert element.webelement is webelement
+    driver.switch_to.frame.assert_not_called()
+
+
+def test_find_in_every_frame(py, driver):
+    main = MagicMock(spec=WebElement)
+    in_frames = [MagicMock(spec=WebElement), MagicMock(spec=WebElement)]
+    driver.execute_script.return_value = {"elements": [main], "frames": [{"path": [0], "count": 2}]}
+    driver.find_elements.return_value = in_frames
+    elements = py.find("button", frames="all")
+    assert len(elements) == 3
+    assert [element.frame_path for element in elements] == [(), (0,), (0,)]
+    assert elements[2]._index == 1
+
+
+def test_frames_must_be_all(py):
+    with pytest.raises(ValueError):
+        py.get("#save", frames="some")
+
+
+def test_main_document_element_after_a_frame_element(py, driver):
+    main = MagicMock(spec=WebElement)
+    driver.find_element.return_value = main
+    element = py.get("#main")
+    assert element.frame_path == ()
+
+    in_frame = MagicMock(spec=WebElement)
+    driver.execute_script.return_value = {"path": [0], "index": 0, "element": None}
+    driver.find_elements.return_value = [in_frame]
+    py.get("#save", frames="all").click()
+    assert py._frame_path == (0,)
+
+    # the main document element switches back to the main document, without a py command in between
+    driver.switch_to.reset_mock()
+    element.click()
+    driver.switch_to.default_content.assert_called_once()
+    driver.switch_to.frame.assert_not_called()
+    main.click.assert_called_once()
+    assert py._frame_path == ()
+
+
+def test_find_in_the_main_document_after_a_frame_element(py, driver):
+    rows = [MagicMock(spec=WebElement), MagicMock(spec=WebElement)]
+    driver.find_elements.return_value = rows
+    elements = py.find("tr")
+
+    driver.execute_script.return_value = {"path": [1], "index": 0, "element": None}
+    driver.find_elements.return_value = [MagicMock(spec=WebElement)]
+    py.get("#save", frames="all").click()
+
+    driver.switch_to.reset_mock()
+    elements[1].click()
+    driver.switch_to.default_content.assert_called_once()
+    driver.switch_to.frame.assert_not_called()
+    assert elements[1].frame_path == ()
@@ -0,0 +1,34 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+
+def test_network_counter_is_added_to_new_documents_once(py, driver):
+    driver.execute_async_script.return_value = {"idle": True}
+    py.wait_for_network_idle().wait_for_network_idle(idle_ms=100)
+    registrations = [c for c in driver.execute_cdp_cmd.call_args_list if c.args[0] == "Page.addScriptToEvaluateOnNewDocument"]
+    assert len(registrations) == 1
+    _, idle_ms, max_inflight, timeout = driver.execute_async_script.call_args.args
+    assert (idle_ms, max_inflight, timeout) == (100, 0, 10000)
+    assert len(py.stats.waits) == 2
+
+
+def test_network_not_idle(py, driver):
+    driver.execute_async_script.return_value = {"idle": False, "inflight": 2}
+    with pytest.raises(TimeoutException, match="2 requests"):
+        py.wait_for_network_idle(timeout=1)
+    assert py.stats.waits[-1].timed_out
+
+
+def test_network_idle_without_cdp(py, driver):
+    del driver.execute_cdp_cmd
+    driver.execute_async_script.return_value = {"idle": True}
+    py.wait_for_network_idle()
+    assert "__pyleniumNetwork" in driver.execute_async_script.call_args.args[0]
+
+
+def test_dom_stable(py, driver):
+    driver.execute_async_script.return_value = True
+    py.wait_for_dom_stable(quiet_ms=200)
+    driver.execute_async_script.return_value = False
+    with pytest.raises(TimeoutException):
+        py.wait_for_dom_stable()
@@ -0,0 +1,69 @@
+""" Import-time benchmark for `pylenium.driver`.
+
+The heavy sub-APIs (Faker, aXe, the Performance models, jQuery, rich and the WebDriver factory) are imported
+on first use, so xdist workers and short CLI commands don't pay for them.
+
+Run with `-s` to see the timings.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parents[2]
+
+HEAVY_MODULES = [
+    "faker",
+    "rich",
+    "axe_selenium_python",
+    "pylenium.a11y",
+    "pylenium.performance",
+    "pylenium.jquery",
+    "pylenium.webdriver_factory",
+]
+
+BENCHMARK = f"""
+import sys, time
+start = time.perf_counter()
+import pylenium.driver
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+"""
+
+
+def _import_pylenium_driver():
+    output = subprocess.run([sys.executable, "-c", BENCHMARK], capture_output=True, text=True, check=True).stdout
+    elapsed, loaded = output.split("\n")[:2]
+    return float(elapsed), [module for module in loaded.split(",") if module]
+
+
+def test_heavy_modules_are_not_imported():
+    elapsed, loaded = _import_pylenium_driver()
+    print(f"\nimport pylenium.driver took {elapsed * 1000:.1f} ms")
+    assert loaded == []
+
+
+def test_sub_apis_are_imported_on_first_use():
+    # in a new process, since this one has already imported faker
+    script = """
+import sys
+from pylenium.config import PyleniumConfig
+from pylenium.driver import Pylenium
+py = Pylenium(PyleniumConfig())
+before = "faker" in sys.modules
+py.fake.name()
+print(before, "faker" in sys.modules)
+"""
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ["False", "True"]
+
+
+def test_conftest_does_not_import_heavy_modules():
+    script = f"""
+import sys
+import conftest
+print(",".join(m for m in {HEAVY_MODULES + ["pylenium.session_pool"]!r} if m in sys.modules))
+"""
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, cwd=ROOT).stdout
+    assert output.strip() == ""
@@ -0,0 +1,117 @@
+""" Logging benchmark: how much each command pays for logging at the COMMAND level.
+
+The default handler renders each record with rich in the thread that logs it. With `"queue": true`, the command only
+puts the record on a queue, and a background thread renders it.
+
+Run with `-s` to see the timings. They depend on the machine, so they're printed and not asserted.
+"""
+
+import io
+import logging
+import time
+from logging.handlers import QueueListener
+from queue import SimpleQueue
+
+import pytest
+from rich.console import Console
+
+from pylenium import log as log_module
+from pylenium.log import LazyRichHandler, PLAIN_FORMAT, logger as log
+
+COUNT = 300
+
+
+@pytest.fixture
+def command_logger():
+    handlers, level = list(log.handlers), log.level
+    log.setLevel(log_module.COMMAND_LOG_LEVEL)
+    for handler in handlers:
+        log.removeHandler(handler)
+    yield log
+    for handler in list(log.handlers):
+        log.removeHandler(handler)
+    for handler in handlers:
+        log.addHandler(handler)
+    log.setLevel(level)
+
+
+def _rich_handler():
+    return LazyRichHandler(rich_tracebacks=True, markup=True, console=Console(file=io.StringIO(), width=120))
+
+
+def _plain_handler():
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(logging.Formatter(PLAIN_FORMAT))
+    return handler
+
+
+def _microseconds_per_command(logger) -> float:
+    logger.command("py.get() - Find the element with CSS: `%s`", "#warm-up")
+    start = time.perf_counter()
+    for i in range(COUNT):
+        logger.command("py.get() - Find the element with CSS: `%s`", f"#item-{i}")
+    return (time.perf_counter() - start) / COUNT * 1_000_000
+
+
+def test_cost_of_logging_per_command(command_logger):
+    results = {}
+    for name, build in (("rich", _rich_handler), ("plain", _plain_handler)):
+        handler = build()
+        command_logger.addHandler(handler)
+        results[name] = _microseconds_per_command(command_logger)
+        command_logger.removeHandler(handler)
+
+        records = SimpleQueue()
+        listener = QueueListener(records, build(), respect_handler_level=True)
+        listener.start()
+        queue_handler = log_module._QueueHandler(records)
+        command_logger.addHandler(queue_handler)
+        results[f"queue + {name}"] = _microseconds_per_command(command_logger)
+        listener.stop()
+        command_logger.removeHandler(queue_handler)
+
+    print()
+    for name, microseconds in results.items():
+        print(f"{name:>12}: {microseconds:8.1f} µs per command")
+
+
+def test_queue_renders_every_record_on_the_listener_thread(command_logger):
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(PLAIN_FORMAT))
+    records = SimpleQueue()
+    listener = QueueListener(records, handler)
+    listener.start()
+    command_logger.addHandler(log_module._QueueHandler(records))
+    args = ["#first"]
+    command_logger.command("py.get() - Find the element with CSS: `%s`", args)
+    args[0] = "#changed"  # the message keeps the args it was logged with
+    listener.stop()
+    assert "COMMAND  py.get() - Find the element with CSS: `['#first']`" in stream.getvalue()
+
+
+def test_configure():
+    try:
+        logger = log_module.configure(True, "plain")
+        (handler,) = logger.handlers
+        assert isinstance(handler, log_module._QueueHandler)
+        assert log_module.configure(True, "plain").handlers == [handler]
+        with pytest.raises(ValueError):
+            log_module.configure(False, "fancy")
+    finally:
+        log_module.configure(False, "rich")
+    (handler,) = log.handlers
+    assert isinstance(handler, LazyRichHandler)
+
+
+def test_configure_keeps_the_handlers_of_users():
+    users_handler = logging.NullHandler()
+    log.addHandler(users_handler)
+    try:
+        log_module.configure(True, "plain")
+        assert users_handler in log.handlers
+        assert len(log.handlers) == 2
+    finally:
+        log_module.configure(False, "rich")
+        log.removeHandler(users_handler)
+    assert len(log.handlers) == 1
@@ -0,0 +1,36 @@
+import pytest
+from selenium.common.exceptions import JavascriptException
+
+
+def test_visit_without_wait_until_uses_the_driver(py, driver):
+    py.visit("https://qap.dev")
+    driver.get.assert_called_once_with("https://qap.dev")
+
+
+def test_visit_waits_for_dom_content_loaded(py, driver):
+    driver.execute_cdp_cmd.return_value = {"frameId": "1", "loaderId": "2"}
+    # the old document, a script that ran while it unloaded, the new document while loading, then parsed
+    driver.execute_script.side_effect = ["https://old.page", None, JavascriptException(), "loading", "interactive"]
+    py.visit("https://qap.dev", wait_until="domcontentloaded")
+    driver.get.assert_not_called()
+    driver.execute_cdp_cmd.assert_called_once_with("Page.navigate", {"url": "https://qap.dev"})
+    assert driver.execute_script.call_count == 5
+
+
+def test_visit_without_cdp_navigates_with_a_script(py, driver):
+    del driver.execute_cdp_cmd
+    driver.execute_script.side_effect = ["https://old.page", "loading"]
+    py.visit("https://qap.dev", wait_until="commit")
+    assert driver.execute_script.call_args_list[0].args[1] == "https://qap.dev"
+
+
+def test_go_back_waits_for_load(py, driver):
+    driver.execute_script.side_effect = ["https://new.page", "complete"]
+    py.go("back", wait_until="load")
+    assert driver.execute_script.call_args_list[0].args[1] == -1
+    assert driver.execute_script.call_args_list[1].args[1] == "https://new.page"
+
+
+def test_wait_until_must_be_a_lifecycle_state(py):
+    with pytest.raises(ValueError):
+        py.reload(wait_until="idle")
@@ -0,0 +1,96 @@
+import pytest
+from selenium.common.exceptions import InvalidSelectorException, JavascriptException, TimeoutException
+
+from pylenium import observe
+
+
+@pytest.fixture(autouse=True)
+def observer_mode(py):
+    py.config.driver.wait_mode = "observer"
+    py._script_timeout = observe.DEFAULT_SCRIPT_TIMEOUT
+
+
+def test_wait_for_selector_returns_match(py):
+    element = object()
+    py.webdriver.execute_async_script.return_value = element
+    assert observe.is_enabled(py)
+    assert observe.wait_for_selector(py, "css selector", "#id", timeout=5) is element
+    py.webdriver.set_script_timeout.assert_not_called()
+
+
+def test_wait_for_selector_raises_script_timeout_only_when_needed(py):
+    py.webdriver.execute_async_script.return_value = []
+    observe.wait_for_selector(py, "css selector", "#id", timeout=40, mode="all")
+    observe.wait_for_selector(py, "css selector", "#id", timeout=40, mode="all")
+    py.webdriver.set_script_timeout.assert_called_once_with(45)
+
+
+def test_script_timeout_is_read_from_the_session(py):
+    py.webdriver.execute_async_script.return_value = []
+    py._script_timeout = None
+    py.webdriver.capabilities = {"timeouts": {"script": 10000, "pageLoad": 300000, "implicit": 0}}
+    observe.wait_for_selector(py, "css selector", "#id", timeout=8)
+    py.webdriver.set_script_timeout.assert_called_once_with(13)
+
+
+def test_wait_for_selector_runs_again_after_a_navigation(py):
+    element = object()
+    py.webdriver.execute_async_script.side_effect = [JavascriptException("javascript error: document unloaded while waiting for result"), element]
+    assert observe.wait_for_selector(py, "css selector", "#id", timeout=5) is element
+    assert py.webdriver.execute_async_script.call_count == 2
+    assert py.stats.waits[-1].polls == 2
+
+
+def test_wait_for_selector_timeout(py):
+    py.webdriver.execute_async_script.return_value = None
+    with pytest.raises(TimeoutException):
+        observe.wait_for_selector(py, "css selector", "#id", timeout=1)
+
+
+def test_wait_for_selector_invalid_selector(py):
+    py.webdriver.execute_async_script.return_value = {"error": "SyntaxError"}
+    with pytest.raises(InvalidSelectorException):
+        observe.wait_for_selector(py, "css selector", "#[", timeout=1)
+
+
+def test_wait_for_absence(py):
+    py.webdriver.execute_async_script.return_value = True
+    assert observe.wait_for_absence(py, "selector", 5, "css selector", "#spinner")
+    args = py.webdriver.execute_async_script.call_args.args
+    assert args[1:] == ("selector", "css selector", "#spinner", None, 5000)
+
+
+def test_wait_for_absence_timeout(py):
+    py.webdriver.execute_async_script.return_value = False
+    assert not observe.wait_for_absence(py, "text", 1, selector="Loading...")
+
+
+@pytest.mark.parametrize("mode, absent", [("gone", True), ("hidden", False)])
+def test_element_absence_when_the_page_unloads(mode, absent, py):
+    py.webdriver.execute_async_script.side_effect = JavascriptException("javascript error: document unloaded while waiting for result")
+    assert observe.wait_for_absence(py, mode, 5, element=object()) is absent
+    py.webdriver.execute_async_script.assert_called_once()
+
+
+def test_text_absence_runs_again_in_the_new_page(py):
+    py.webdriver.execute_async_script.side_effect = [JavascriptException("javascript error: document unloaded while waiting for result"), True]
+    assert observe.wait_for_absence(py, "text", 5, selector="Loading...")
+    assert py.webdriver.execute_async_script.call_count == 2
+
+
+def test_not_find_waits_inside_the_page(py, driver):
+    driver.execute_async_script.return_value = False
+    with pytest.raises(AssertionError, match="#spinner"):
+        py.should(timeout=2).not_find("#spinner")
+    driver.execute_async_script.assert_called_once()
+    driver.find_element.assert_not_called()
+
+
+def test_text_absence_ignores_inline_scripts(run_in_page):
+    body = "el('BODY', 'body', el('P', 'intro', text('Hello')), el('SCRIPT', 'data', text('const name = \"Jane Doe\";')))"
+    assert run_in_page("wait_for_absence.js", body, "text", "", "Jane Doe", None, 10) is True
+
+
+def test_text_absence_waits_for_text_split_across_elements(run_in_page):
+    body = "el('BODY', 'body', el('DIV', 'total', text('Total: '), el('B', 'amount', text('42'))))"
+    assert run_in_page("wait_for_absence.js", body, "text", "", "Total: 42", None, 10) is False
@@ -0,0 +1,40 @@
+import itertools
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from pylenium import polling
+from pylenium.config import PollingConfig
+
+
+def test_backoff_intervals_are_capped():
+    strategy = polling.BackoffPolling(initial=0.05, factor=2, maximum=0.5)
+    assert list(itertools.islice(strategy.intervals(), 6)) == [0.05, 0.1, 0.2, 0.4, 0.5, 0.5]
+
+
+def test_build_strategy_from_config():
+    assert isinstance(polling.build_strategy(PollingConfig()), polling.BackoffPolling)
+    fixed = polling.build_strategy(PollingConfig(strategy="fixed", maximum=0.25))
+    assert isinstance(fixed, polling.FixedPolling)
+    assert fixed.interval == 0.25
+    with pytest.raises(ValueError):
+        polling.build_strategy(PollingConfig(strategy="random"))
+
+
+def test_poll_returns_as_soon_as_condition_is_met():
+    calls = iter([False, None, "found"])
+    value = polling.poll(lambda: next(calls), 5, polling.BackoffPolling(initial=0.001))
+    assert value == "found"
+
+
+def test_poll_ignores_exceptions_until_timeout():
+    def condition():
+        raise NoSuchElementException("not yet")
+
+    with pytest.raises(TimeoutException, match="never found"):
+        polling.poll(condition, 0.05, polling.FixedPolling(0.01), NoSuchElementException, "never found")
+
+
+def test_poll_negate():
+    calls = iter([True, True, False])
+    assert polling.poll(lambda: next(calls), 5, polling.FixedPolling(0.001), negate=True) is False
@@ -0,0 +1,179 @@
+from urllib3.exceptions import MaxRetryError
+
+from pylenium.config import PyleniumConfig
+from pylenium.session_pool import SessionPool
+
+
+class FakeDriver:
+    """Just enough of WebDriver for the SessionPool."""
+
+    count = 0
+
+    def __init__(self):
+        FakeDriver.count += 1
+        self.session_id = f"session-{FakeDriver.count}"
+        self.window_handles = ["main"]
+        self.quit_called = False
+        self.visited = []
+        self.timeouts = None
+
+    @property
+    def switch_to(self):
+        return self
+
+    def window(self, handle):
+        pass
+
+    def execute_script(self, script):
+        return "https://example.com"
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute(self, command, params):
+        self.timeouts = params
+
+    def maximize_window(self):
+        pass
+
+    def set_window_size(self, width, height):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def build_pool(max_uses=25) -> SessionPool:
+    return SessionPool(max_uses=max_uses, build=lambda _: FakeDriver())
+
+
+def test_pool_reuses_sessions():
+    pool = build_pool()
+    config = PyleniumConfig()
+    driver = pool.acquire(config)
+    pool.release(driver)
+    assert pool.acquire(config) is driver
+    assert driver.visited == ["about:blank"]
+    assert pool.stats.hits == 1
+    assert pool.stats.misses == 1
+    assert pool.stats.resets == 1
+
+
+def test_pool_is_keyed_by_config():
+    pool = build_pool()
+    chrome = PyleniumConfig()
+    firefox = PyleniumConfig()
+    firefox.driver.browser = "firefox"
+    driver = pool.acquire(chrome)
+    pool.release(driver)
+    assert pool.acquire(firefox) is not driver
+    assert pool.stats.misses == 2
+
+
+def test_pool_recycles_on_failure():
+    pool = build_pool()
+    config = PyleniumConfig()
+    driver = pool.acquire(config)
+    pool.release(driver, failed=True)
+    assert driver.quit_called
+    assert pool.acquire(config) is not driver
+    assert pool.stats.recycled == 1
+
+
+def test_pool_recycles_after_max_uses():
+    pool = build_pool(max_uses=2)
+    config = PyleniumConfig()
+    driver = pool.acquire(config)
+    pool.release(driver)
+    assert pool.acquire(config) is driver
+    pool.release(driver)
+    assert driver.quit_called
+    assert pool.stats.recycled == 1
+
+
+def test_pool_close_quits_everything():
+    pool = build_pool()
+    config = PyleniumConfig()
+    idle = pool.acquire(config)
+    leased = pool.acquire(config)
+    pool.release(idle)
+    pool.close()
+    assert idle.quit_called
+    assert leased.quit_called
+
+
+def test_prewarmed_sessions_are_handed_out():
+    pool = build_pool(max_uses=1)
+    config = PyleniumConfig()
+    pool.prewarm(config, 2)
+    first = pool.acquire(config)
+    second = pool.acquire(config)
+    assert first is not second
+    assert pool.stats.prewarmed == 2
+    assert pool.stats.hits == 2
+    assert pool.stats.misses == 0
+    pool.close()
+
+
+def test_recycled_prewarmed_sessions_are_replaced():
+    pool = build_pool(max_uses=1)
+    config = PyleniumConfig()
+    pool.prewarm(config, 1)
+    driver = pool.acquire(config)
+    pool.release(driver)
+    assert driver.quit_called
+    assert pool.acquire(config) is not driver
+    assert pool.stats.prewarmed == 2
+    pool.close()
+
+
+def test_reset_clears_storage_of_every_open_origin():
+    pool = build_pool()
+    config = PyleniumConfig()
+    driver = pool.acquire(config)
+    driver.window_handles = ["main", "popup"]
+    commands = []
+    driver.close = lambda: None
+    driver.execute_cdp_cmd = lambda command, params: commands.append((command, params))
+    pool.release(driver)
+    assert commands == [
+        ("Network.clearBrowserCookies", {}),
+        ("Storage.clearDataForOrigin", {"origin": "https://example.com", "storageTypes": "all"}),
+    ]
+
+
+def test_acquire_does_not_wait_forever_for_a_prewarmed_session():
+    pool = build_pool()
+    config = PyleniumConfig()
+    config.driver.wait_time = 1
+    pool._pending[pool.key(config)] = 1  # a pre-warm that never finishes
+    driver = pool.acquire(config)
+    assert isinstance(driver, FakeDriver)
+    assert pool.stats.misses == 1
+
+
+def test_reset_restores_configured_timeouts():
+    pool = build_pool()
+    config = PyleniumConfig()
+    config.driver.page_load_wait_time = 20
+    config.driver.capabilities = {"timeouts": {"script": 5000}}
+    driver = pool.acquire(config)
+    pool.release(driver)
+    assert driver.timeouts == {"implicit": 0, "pageLoad": 20000, "script": 5000}
+
+
+def test_pool_replaces_a_session_the_test_quit():
+    pool = build_pool()
+    config = PyleniumConfig()
+    driver = pool.acquire(config)
+
+    def gone(*_):
+        raise MaxRetryError(None, "/session", "Connection refused")
+
+    driver.execute_script = driver.quit = gone
+    pool.release(driver)
+    assert pool.stats.recycled == 1
+    assert pool.acquire(config) is not driver
@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from pylenium import shadow
+
+
+def test_get_resolves_the_selector_in_one_script(py, driver):
+    button = MagicMock(spec=WebElement)
+    driver.execute_async_script.return_value = button
+    element = py.get("app-shell >>> nav-menu >>> button")
+    assert element.webelement is button
+    assert element.locator == (shadow.BY, "app-shell >>> nav-menu >>> button")
+    driver.execute_async_script.assert_called_once()
+    driver.find_element.assert_not_called()
+    _, css, root, first, watch, _ = driver.execute_async_script.call_args.args
+    assert (css, root, first, watch) == ("app-shell >>> nav-menu >>> button", None, True, False)
+
+
+def test_get_with_no_match_and_no_wait(py, driver):
+    driver.execute_async_script.return_value = None
+    with pytest.raises(NoSuchElementException):
+        py.get("app-shell >>> button", timeout=0)
+
+
+def test_observer_mode_waits_inside_the_page(py, driver):
+    py.config.driver.wait_mode = "observer"
+    buttons = [MagicMock(spec=WebElement), MagicMock(spec=WebElement)]
+    driver.execute_async_script.return_value = buttons
+    elements = py.find("app-shell >>> button", timeout=3)
+    assert len(elements) == 2
+    _, _, _, first, watch, timeout = driver.execute_async_script.call_args.args
+    assert (first, watch, timeout) == (False, True, 3000)
+
+
+def test_invalid_part_of_the_selector(py, driver):
+    driver.execute_async_script.return_value = {"error": "every part of a piercing selector must be a CSS selector"}
+    with pytest.raises(InvalidSelectorException):
+        py.get("app-shell >>>", timeout=0)
+
+
+def test_get_within_an_element(py, driver):
+    host = MagicMock(spec=WebElement)
+    driver.find_element.return_value = host
+    driver.execute_async_script.return_value = MagicMock(spec=WebElement)
+    py.get("main").get("app-shell >>> button")
+    _, _, root, _, _, _ = driver.execute_async_script.call_args.args
+    assert root is host
+
+
+def test_stale_element_is_found_again_with_the_piercing_selector(py, driver):
+    stale, fresh = MagicMock(spec=WebElement), MagicMock(spec=WebElement)
+    stale.click.side_effect = StaleElementReferenceException()
+    ready = {"actionable": True}
+    driver.execute_async_script.side_effect = [stale, ready, [fresh], ready]
+    py.get("app-shell >>> button").click()
+    fresh.click.assert_called_once()
+    assert py.stats.stale_recoveries == 1
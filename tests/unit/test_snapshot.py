@@ -0,0 +1,106 @@
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException
+
+from pylenium.snapshot import Snapshot
+
+
+HTML = """<html><head><title>Users</title><script>var x = "<td>";</script></head><body>
+<nav><a href="/" class="nav active">Home</a><a href="/users" class="nav">Users</a></nav>
+<table id="users">
+  <tr><th>Name</th><th>Role</th></tr>
+  <tr data-id="1"><td>Jane   Doe</td><td>Admin</td></tr>
+  <tr data-id="2"><td>John &amp; Co</td><td>User</td></tr>
+  <tr data-id="3" class="disabled"><td>Bob</td><td>User</td></tr>
+</table>
+<p>Powered by <a href="https://example.com">Example</a></p>
+<input type="checkbox" checked><img src="a.png"><span></span>
+</body></html>"""
+
+
+@pytest.fixture
+def snapshot() -> Snapshot:
+    return Snapshot(HTML)
+
+
+def test_get_and_text(snapshot: Snapshot):
+    assert snapshot.get("#users tr:nth-child(2) > td").text() == "Jane Doe"
+    assert snapshot.get("tr[data-id='2'] td").text() == "John & Co"
+    assert snapshot.get("title").text() == ""
+    assert snapshot.get("table").text().startswith("Name Role Jane Doe Admin")
+
+
+def test_find(snapshot: Snapshot):
+    assert snapshot.find("tr").length() == 4
+    assert snapshot.find("tr[data-id]").attributes("data-id") == ["1", "2", "3"]
+    assert snapshot.find("tr:not(.disabled) > td:first-child").texts() == ["Jane Doe", "John & Co"]
+    assert snapshot.find("a.nav.active, a[href^='https']").texts() == ["Home", "Example"]
+    assert snapshot.find("a.nav + a").texts() == ["Users"]
+    assert snapshot.find("nav ~ p").length() == 1
+    assert snapshot.find("tr:nth-child(odd)").length() == 2
+    assert snapshot.find("input:checked, span:empty").length() == 2
+    assert snapshot.find("td").first().text() == "Jane Doe"
+    assert snapshot.find("nope").is_empty()
+
+
+def test_sibling_positions(snapshot: Snapshot):
+    assert snapshot.find("tr:nth-last-child(2) td").texts() == ["John & Co", "User"]
+    assert snapshot.find("td:last-of-type").texts() == ["Admin", "User", "User"]
+    assert snapshot.find("tr:first-child ~ tr.disabled td:only-child").is_empty()
+    assert snapshot.find("tr:first-child ~ tr").attributes("data-id") == ["1", "2", "3"]
+    assert snapshot.find("tr.disabled ~ tr, th + th").texts() == ["Role"]
+    assert snapshot.get("table").find("tr + tr + tr").attributes("data-id") == ["2", "3"]
+
+
+def test_sibling_selectors_on_a_large_table():
+    rows = "".join(f"<tr><td>{i}</td></tr>" for i in range(5000))
+    snapshot = Snapshot(f"<html><body><table><tr class='header'><th>#</th></tr>{rows}</table></body></html>")
+    assert snapshot.find("tr:nth-child(odd) td").length() == 2500
+    assert snapshot.find(".header ~ tr td").length() == 5000
+    assert snapshot.find("tr + tr:last-child td").texts() == ["4999"]
+
+
+def test_find_in_element_context(snapshot: Snapshot):
+    row = snapshot.get("tr:last-child")
+    assert row.find("td").texts() == ["Bob", "User"]
+    assert row.get("td").parent() == row
+    assert row.children().length() == 2
+
+
+def test_xpath(snapshot: Snapshot):
+    assert snapshot.getx("//tr[@data-id='3']/td").text() == "Bob"
+    assert snapshot.findx("//td").length() == 6
+    row = snapshot.get("tr[data-id='1']")
+    assert row.findx(".//td").texts() == ["Jane Doe", "Admin"]
+    assert row.findx("//tr").length() == 4
+
+
+def test_contains(snapshot: Snapshot):
+    assert snapshot.contains("John & Co").tag_name() == "td"
+    assert snapshot.contains("Powered by Example").tag_name() == "p"
+    with pytest.raises(NoSuchElementException):
+        snapshot.contains("nope")
+
+
+def test_errors(snapshot: Snapshot):
+    with pytest.raises(NoSuchElementException):
+        snapshot.get("video")
+    with pytest.raises(InvalidSelectorException):
+        snapshot.find("a:hover")
+    with pytest.raises(InvalidSelectorException):
+        snapshot.findx("//a[contains(text(), 'Home')]")
+    with pytest.raises(ValueError):
+        snapshot.is_stale()
+
+
+def test_capture_and_is_stale():
+    py = MagicMock()
+    py.webdriver.execute_script.return_value = {"html": HTML, "url": "https://example.com", "version": 4}
+    snapshot = Snapshot.capture(py)
+    assert snapshot.url == "https://example.com"
+    assert snapshot.find("tr").length() == 4
+    py.webdriver.execute_script.return_value = {"version": 4}
+    assert not snapshot.is_stale()
+    py.webdriver.execute_script.return_value = {"version": -1}
+    assert snapshot.is_stale()
@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from pylenium.element import Element, Elements
+
+
+class StaleWebElement:
+    """A WebElement that was removed from the DOM."""
+
+    def __init__(self):
+        self.id = f"stale-{id(self)}"
+
+    @property
+    def text(self):
+        raise StaleElementReferenceException("stale")
+
+    def find_elements(self, *locator):
+        raise StaleElementReferenceException("stale")
+
+
+def stale_webelement():
+    return StaleWebElement()
+
+
+def test_stale_element_is_found_again_with_its_locator(py):
+    fresh = MagicMock(text="fresh")
+    py.webdriver.find_elements.return_value = [fresh]
+    element = Element(py, stale_webelement(), ("css selector", "#foo"))
+    assert element.text() == "fresh"
+    assert element.webelement is fresh
+    py.webdriver.find_elements.assert_called_once_with("css selector", "#foo")
+    assert py.stats.stale_recoveries == 1
+
+
+def test_stale_element_in_a_list_is_found_again_by_index(py):
+    fresh = [MagicMock(text="a"), MagicMock(text="b")]
+    py.webdriver.find_elements.return_value = fresh
+    elements = Elements(py, [stale_webelement(), stale_webelement()], ("css selector", "li"))
+    assert elements[1].text() == "b"
+
+
+def test_stale_parent_is_found_again_first(py):
+    child = MagicMock(text="child")
+    new_parent = MagicMock()
+    new_parent.find_elements.return_value = [child]
+    py.webdriver.find_elements.return_value = [new_parent]
+    parent = Element(py, stale_webelement(), ("css selector", "ul"))
+    element = Element(py, stale_webelement(), ("css selector", "li"), parent)
+    assert element.text() == "child"
+    assert py.stats.stale_recoveries == 2
+
+
+def test_stale_recovery_is_bounded(py):
+    py.config.driver.stale_retries = 1
+    py.webdriver.find_elements.side_effect = lambda *_: [stale_webelement()]
+    element = Element(py, stale_webelement(), ("css selector", "#foo"))
+    with pytest.raises(StaleElementReferenceException):
+        element.text()
+    assert py.stats.stale_recoveries == 1
+
+
+def test_element_without_locator_is_not_recovered(py):
+    element = Element(py, stale_webelement(), None)
+    with pytest.raises(StaleElementReferenceException):
+        element.text()
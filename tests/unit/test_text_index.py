@@ -0,0 +1,36 @@
+from pylenium import text_index
+
+
+SKIP = "not(self::script or self::style or self::noscript or self::template)"
+
+
+def test_xpath_of_plain_text():
+    contains = 'contains(normalize-space(.), "Submit")'
+    assert text_index.xpath("Submit") == f".//*[{SKIP}][{contains}][not(*[{contains}])]"
+
+
+def test_xpath_of_text_with_quotes():
+    contains = """contains(normalize-space(.), 'Say "hi"')"""
+    assert text_index.xpath('Say "hi"') == f".//*[{SKIP}][{contains}][not(*[{contains}])]"
+    contains = """contains(normalize-space(.), concat("It's ", '"', "here", '"', ""))"""
+    assert text_index.xpath("""It's "here\"""") == f".//*[{SKIP}][{contains}][not(*[{contains}])]"
+
+
+def test_xpath_normalizes_whitespace():
+    assert text_index.xpath("  Sign\n   in ") == text_index.xpath("Sign in")
+
+
+def test_find_own_text(run_in_page):
+    body = "el('BODY', 'body', el('P', 'intro', text('Hello')), el('BUTTON', 'save', text(' Save   changes ')))"
+    assert run_in_page("text_index.js", body, "Save changes", None) == "save"
+
+
+def test_find_text_split_across_nested_elements(run_in_page):
+    body = "el('BODY', 'body', el('DIV', 'total', text('Total: '), el('B', 'amount', text('42'))))"
+    assert run_in_page("text_index.js", body, "Total: 42", None) == "total"
+
+
+def test_text_in_a_script_does_not_match(run_in_page):
+    body = "el('BODY', 'body', el('P', 'intro', text('Hello')), el('SCRIPT', 'data', text('{\"name\": \"Jane Doe\"}')))"
+    assert run_in_page("text_index.js", body, "Jane Doe", None) is None
+    assert run_in_page("text_index.js", body, '"name": "Jane', None) is None
@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from pylenium import polling
+from pylenium.stats import TOP_WAITS, RunStats, Stats
+
+
+def test_wait_that_passes_late_is_recorded(py, driver):
+    driver.find_element.side_effect = [NoSuchElementException(), NoSuchElementException(), MagicMock()]
+    py.get("#late")
+    (wait,) = py.stats.waits
+    assert wait.condition == "Pylenium.get.<lambda>"
+    assert wait.message == "Could not find element with the CSS `#late`"
+    assert wait.polls == 3
+    assert wait.swallowed == {"NoSuchElementException": 2}
+    assert not wait.timed_out
+
+
+def test_wait_that_times_out_is_recorded(py):
+    with pytest.raises(TimeoutException):
+        py.wait(0.05).until(lambda driver: False)
+    (wait,) = py.stats.waits
+    assert wait.timed_out
+    assert wait.seconds >= 0.05
+    assert wait.polls > 1
+
+
+def test_element_waits_record_the_locator(py, driver):
+    webelement = MagicMock()
+    webelement.is_displayed.return_value = True
+    driver.find_element.return_value = webelement
+    py.get("#visible", timeout=0).should().be_visible()
+    assert py.stats.waits[-1].locator == "css selector: #visible"
+
+
+def test_top_waits_are_the_longest():
+    stats = Stats()
+    for seconds in (1, 5, 3):
+        stats.record_wait("condition").seconds = seconds
+    assert [wait.seconds for wait in stats.top_waits(2)] == [5, 3]
+    assert "waits: 3" in stats.summary()
+
+
+def test_run_stats_keep_totals_and_only_the_slowest_waits():
+    run = RunStats()
+    for test in range(50):
+        stats = Stats(stale_recoveries=1)
+        for seconds in (0.1, test, 0.2):
+            stats.record_wait("wait_for_selector.first").seconds = seconds
+        stats.record_wait("Pylenium.get.<lambda>", message="late").timed_out = True
+        run.add(stats, f"test_{test}")
+    assert len(run.slowest) == TOP_WAITS
+    assert [wait.test for wait in run.top_waits(3)] == ["test_49", "test_48", "test_47"]
+    assert run.kinds["wait_for_selector.first"].count == 150
+    assert run.kinds["wait_for_selector.first"].max_seconds == 49
+    assert run.kinds["Pylenium.get.<lambda>"].timed_out == 50
+    assert run.top_kinds() == ["wait_for_selector.first", "Pylenium.get.<lambda>"]
+    assert "stale recoveries: 50, waits: 200 (50 timed out)" in run.summary()
+
+
+def test_run_stats_from_workers_are_merged():
+    first, second = RunStats(), RunStats()
+    for run, seconds in ((first, 3), (second, 5)):
+        stats = Stats()
+        stats.record_wait("condition").seconds = seconds
+        run.add(stats, "test")
+    # xdist workers send their stats to the controller as dicts
+    total = first.merge(RunStats(**second.model_dump()))
+    assert total.kinds["condition"].count == 2
+    assert total.kinds["condition"].seconds == 8
+    assert [wait.seconds for wait in total.top_waits()] == [5, 3]
+
+
+def test_describe_expected_conditions():
+    from selenium.webdriver.support import expected_conditions as ec
+
+    assert polling.describe(ec.title_is("title")) == "title_is"
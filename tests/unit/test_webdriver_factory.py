@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver import ChromeOptions
+
+from pylenium import webdriver_factory
+from pylenium.config import ViewportConfig
+
+
+def test_viewport_folded_into_chrome_options():
+    viewport = ViewportConfig(maximize=False, width=1280, height=800)
+    assert webdriver_factory.build_viewport_options("chrome", viewport, []) == ["--window-size=1280,800"]
+
+
+def test_landscape_viewport_folded_into_firefox_options():
+    viewport = ViewportConfig(maximize=False, width=375, height=667, orientation="landscape")
+    assert webdriver_factory.build_viewport_options("firefox", viewport, []) == ["--width=667", "--height=375"]
+
+
+def test_maximize_not_folded_for_headless():
+    viewport = ViewportConfig(maximize=True)
+    assert webdriver_factory.build_viewport_options("chrome", viewport, []) == ["--start-maximized"]
+    assert webdriver_factory.build_viewport_options("chrome", viewport, ["headless=new"]) == []
+
+
+def test_page_load_timeout_folded_into_capabilities():
+    caps = {"timeouts": {"script": 5000}, "enableVNC": True}
+    folded = webdriver_factory.build_timeouts_capabilities(30, caps)
+    assert folded["timeouts"] == {"script": 5000, "pageLoad": 30000}
+    assert folded["enableVNC"] is True
+    assert "pageLoad" not in caps["timeouts"]
+
+
+def test_session_falls_back_to_selenium_manager(monkeypatch):
+    removed = []
+    monkeypatch.setattr(webdriver_factory.driver_cache, "lookup", lambda _: {"driver_path": "/cache/chromedriver", "browser_path": "/cache/chrome"})
+    monkeypatch.setattr(webdriver_factory.driver_cache, "remove", removed.append)
+    driver = MagicMock()
+    started = []
+
+    def start(driver_path):
+        started.append((driver_path, options.binary_location))
+        if driver_path:
+            raise SessionNotCreatedException("This version of ChromeDriver only supports Chrome version 120")
+        return driver
+
+    options = ChromeOptions()
+    assert webdriver_factory.start_with_cached_driver("chrome", None, options, start) is driver
+    assert started == [("/cache/chromedriver", "/cache/chrome"), (None, "")]
+    assert removed == ["chrome"]
+
+
+def test_session_with_missing_cached_driver_falls_back(monkeypatch):
+    removed = []
+    monkeypatch.setattr(webdriver_factory.driver_cache, "lookup", lambda _: {"driver_path": "/cache/chromedriver", "browser_path": None})
+    monkeypatch.setattr(webdriver_factory.driver_cache, "remove", removed.append)
+    driver = MagicMock()
+
+    def start(driver_path):
+        if driver_path:
+            raise FileNotFoundError(2, "No such file or directory", driver_path)
+        return driver
+
+    assert webdriver_factory.start_with_cached_driver("chrome", None, ChromeOptions(), start) is driver
+    assert removed == ["chrome"]
+
+
+def test_other_session_errors_keep_the_cached_driver(monkeypatch):
+    removed = []
+    monkeypatch.setattr(webdriver_factory.driver_cache, "lookup", lambda _: {"driver_path": "/cache/chromedriver", "browser_path": None})
+    monkeypatch.setattr(webdriver_factory.driver_cache, "remove", removed.append)
+    started = []
+
+    def start(driver_path):
+        started.append(driver_path)
+        raise SessionNotCreatedException("Could not start a new session. Possible causes are invalid address of the remote server")
+
+    with pytest.raises(SessionNotCreatedException):
+        webdriver_factory.start_with_cached_driver("chrome", None, ChromeOptions(), start)
+    assert started == ["/cache/chromedriver"]
+    assert removed == []